@@ -6,33 +6,27 @@ PYGAME-MENU
 A menu for pygame. Simple, and easy to use.
 """
 
+import importlib
 import logging
 import os
 from datetime import datetime
-from importlib.metadata import PackageNotFoundError, metadata
+from typing import TYPE_CHECKING, Any
 
 logger = logging.getLogger(__name__)
 
 __all__ = ["BaseImage", "Menu", "Sound", "Theme"]
 
-# Metadata
-try:
-    _meta = metadata("pygame-menu")
-    __version__ = _meta.get("Version")
-    __author__ = _meta.get("Author-email").split("<")[0][1:-2].strip()
-    __email__ = _meta.get("Author-email").split("<")[1][:-1].strip()
-    __description__ = _meta.get("Summary")
-    __license__ = _meta.get("License")
-    __url__ = _meta.get("Home-page")
-    __module_name__ = _meta.get("Name")
-except PackageNotFoundError:
-    __version__ = "4.4.3"
-    __author__ = "Pablo Pizarro R."
-    __email__ = "pablo@ppizarror.com"
-    __description__ = "A menu for pygame. Simple, and easy to use"
-    __license__ = "MIT"
-    __url__ = "https://pygame-menu.readthedocs.io"
-    __module_name__ = "pygame-menu"
+# Metadata, resolved from the installed package on first access
+_METADATA: dict[str, str] = {}
+_METADATA_FALLBACK = {
+    "__version__": "4.4.3",
+    "__author__": "Pablo Pizarro R.",
+    "__email__": "pablo@ppizarror.com",
+    "__description__": "A menu for pygame. Simple, and easy to use",
+    "__license__": "MIT",
+    "__url__": "https://pygame-menu.readthedocs.io",
+    "__module_name__": "pygame-menu",
+}
 
 # Extra metadata not provided by importlib
 __url_documentation__ = "https://pygame-menu.readthedocs.io"
@@ -79,30 +73,118 @@ except (ModuleNotFoundError, ImportError):
     # Pygame is not installed; skip pygame-dependent imports
     pass
 
-# Conditional imports
-if __pygame_version__ is not None:
+# Submodules and classes, imported on first access
+_SUBMODULES = (
+    "_scrollarea",
+    "baseimage",
+    "binding",
+    "controls",
+    "events",
+    "examples",
+    "font",
+    "loader",
+    "locals",
+    "menu",
+    "sound",
+    "themes",
+    "utils",
+    "version",
+    "widgets",
+)
+_CLASSES = {
+    "BaseImage": "baseimage",
+    "Menu": "menu",
+    "Sound": "sound",
+    "Theme": "themes",
+}
+
+if TYPE_CHECKING:
     from pygame_menu import (
         _scrollarea,  # type: ignore
         baseimage,
+        binding,  # type: ignore
         controls,  # type: ignore
         events,  # type: ignore
+        examples,  # type: ignore
         font,  # type: ignore
+        loader,  # type: ignore
         locals,  # type: ignore
         menu,
         sound,
         themes,
+        utils,  # type: ignore
         version,  # type: ignore
         widgets,  # type: ignore
     )
+    from pygame_menu.baseimage import BaseImage
+    from pygame_menu.menu import Menu
+    from pygame_menu.sound import Sound
+    from pygame_menu.themes import Theme
+
+
+def _get_metadata() -> dict[str, str]:
+    """
+    Return the package metadata. Uses the fallback values if the package is not
+    installed.
+
+    :return: Metadata dict
+    """
+    if _METADATA:
+        return _METADATA
+    from importlib.metadata import PackageNotFoundError, metadata
+
+    try:
+        meta = metadata("pygame-menu")
+        _METADATA.update(
+            {
+                "__version__": meta.get("Version"),
+                "__author__": meta.get("Author-email").split("<")[0][1:-2].strip(),
+                "__email__": meta.get("Author-email").split("<")[1][:-1].strip(),
+                "__description__": meta.get("Summary"),
+                "__license__": meta.get("License"),
+                "__url__": meta.get("Home-page"),
+                "__module_name__": meta.get("Name"),
+            }
+        )
+    except PackageNotFoundError:
+        _METADATA.update(_METADATA_FALLBACK)
+    return _METADATA
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import the submodules, main classes and metadata on first access.
+
+    :param name: Attribute name
+    :return: Attribute value
+    """
+    if name in _METADATA_FALLBACK:
+        value = _get_metadata()[name]
+    elif __pygame_version__ is not None and name in _CLASSES:
+        value = getattr(importlib.import_module(f"{__name__}.{_CLASSES[name]}"), name)
+    elif __pygame_version__ is not None and name in _SUBMODULES:
+        value = importlib.import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """
+    Return the module attributes, including the ones imported on access.
+
+    :return: Attribute names
+    """
+    names = set(globals()) | set(_METADATA_FALLBACK) | set(_CLASSES)
+    return sorted(names | set(_SUBMODULES))
 
-    BaseImage = baseimage.BaseImage
-    Menu = menu.Menu
-    Sound = sound.Sound
-    Theme = themes.Theme
 
 # Version print
 if (
     "PYGAME_MENU_HIDE_VERSION" not in os.environ
     and "PYGAME_HIDE_SUPPORT_PROMPT" not in os.environ
 ):
-    logger.info(f"{__module_name__} {__version__}")
+    from pygame_menu.version import ver as __ver
+
+    logger.info(f"pygame-menu {__ver}")
@@ -21,6 +21,14 @@ class Base:
     Base object.
     """
 
+    __slots__ = (
+        "_attributes",
+        "_class_id__repr__",
+        "_id",
+        "_id__repr__",
+        "_verbose",
+    )
+
     _attributes: dict[str, Any] | None
     _class_id__repr__: bool
     _id: str
@@ -34,6 +34,7 @@ from pygame_menu.utils import (
     assert_list_vector,
     assert_vector,
     make_surface,
+    release_surface,
     uuid4,
     warn,
 )
@@ -959,7 +960,7 @@ class Decorator(Base):
                 rect.width,
                 rect.height,
             )
-            del self._cache_surface[prev]
+            release_surface(self._cache_surface.pop(prev))
             self._cache_surface[prev] = make_surface(
                 surface.get_width(), surface.get_height()
             )
@@ -975,12 +976,13 @@ class Decorator(Base):
         :param surface: Pygame surface
         :return: Self reference
         """
+        deco = self._decor[DECOR_TYPE_PREV]
+        if not deco:
+            return self
         if not self.cache:
-            self._draw(self._decor[DECOR_TYPE_PREV], surface)
+            self._draw(deco, surface)
         else:
-            self._draw_assemble_cache(
-                DECOR_TYPE_PREV, self._decor[DECOR_TYPE_PREV], surface
-            )
+            self._draw_assemble_cache(DECOR_TYPE_PREV, deco, surface)
         return self
 
     def draw_post(self, surface: pygame.Surface) -> Decorator:
@@ -990,12 +992,13 @@ class Decorator(Base):
         :param surface: Pygame surface
         :return: Self reference
         """
+        deco = self._decor[DECOR_TYPE_POST]
+        if not deco:
+            return self
         if not self.cache:
-            self._draw(self._decor[DECOR_TYPE_POST], surface)
+            self._draw(deco, surface)
         else:
-            self._draw_assemble_cache(
-                DECOR_TYPE_POST, self._decor[DECOR_TYPE_POST], surface
-            )
+            self._draw_assemble_cache(DECOR_TYPE_POST, deco, surface)
         return self
 
     def _draw(self, deco: list[tuple[int, str, Any]], surface: pygame.Surface) -> None:
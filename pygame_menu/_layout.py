@@ -0,0 +1,441 @@
+"""
+pygame-menu
+https://github.com/ppizarror/pygame-menu
+
+LAYOUT
+Export and restore the widget tree of the Menus.
+"""
+
+from __future__ import annotations
+
+__all__ = ["export_layout", "load_layout"]
+
+import base64
+import hashlib
+import inspect
+import json
+import zlib
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pygame
+
+import pygame_menu
+from pygame_menu._widgetmanager import _LAYOUT_METHODS, WidgetManager
+from pygame_menu.baseimage import BaseImage
+from pygame_menu.version import ver
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pygame_menu.events import MenuAction
+    from pygame_menu.menu import Menu
+    from pygame_menu.themes import Theme
+
+# Version of the layout data, layouts from other versions are discarded
+_LAYOUT_VERSION = 2
+
+# pygame 2.1.3 renamed image.tostring to image.tobytes
+_image_tobytes = getattr(pygame.image, "tobytes", pygame.image.tostring)
+
+# Digests of the files referenced by the layouts, keyed by (path, size, mtime)
+_FILE_DIGESTS: dict[tuple[str, int, int], str] = {}
+
+
+def _file_digest(path: str) -> str | None:
+    """
+    Return the digest of a file.
+
+    :param path: File path
+    :return: Digest, ``None`` if the path is not a file
+    """
+    try:
+        stat = Path(path).stat()
+    except (OSError, ValueError):
+        return None
+    if not Path(path).is_file():
+        return None
+    key = (path, stat.st_size, stat.st_mtime_ns)
+    if key not in _FILE_DIGESTS:
+        _FILE_DIGESTS[key] = hashlib.sha1(Path(path).read_bytes()).hexdigest()
+    return _FILE_DIGESTS[key]
+
+
+def _surface_data(surface: pygame.Surface) -> tuple[tuple[int, int], bytes]:
+    """
+    Return the size and the RGBA pixels of a surface.
+
+    :param surface: Surface
+    :return: Surface data
+    """
+    return surface.get_size(), _image_tobytes(surface, "RGBA")
+
+
+def _fingerprint(value: Any, files: dict[str, str], depth: int = 0) -> Any:
+    """
+    Return a hashable representation of a value, used to detect theme changes.
+    The digests of the files it refers to (fonts, images) are added to ``files``.
+
+    :param value: Value
+    :param files: Referenced files
+    :param depth: Object depth, objects are only inspected up to two levels
+    :return: Fingerprint
+    """
+    if isinstance(value, Path):
+        value = str(value)
+    if isinstance(value, str):
+        digest = _file_digest(value)
+        if digest is not None:
+            files[value] = digest
+        return value
+    elif value is None or isinstance(value, (bool, int, float)):
+        return value
+    elif isinstance(value, (list, tuple, pygame.Color)):
+        return tuple(_fingerprint(v, files, depth) for v in value)
+    elif isinstance(value, dict):
+        return tuple(
+            (str(k), _fingerprint(value[k], files, depth))
+            for k in sorted(value.keys(), key=str)
+        )
+    elif isinstance(value, BaseImage):
+        return (
+            "BaseImage",
+            _fingerprint(value.get_path(), files, depth),
+            hashlib.sha1(_surface_data(value.get_surface(new=False))[1]).hexdigest(),
+        )
+    elif isinstance(value, pygame.Surface):
+        return "Surface", hashlib.sha1(_surface_data(value)[1]).hexdigest()
+    elif depth < 2 and hasattr(value, "__dict__"):
+        return type(value).__qualname__, _fingerprint(vars(value), files, depth + 1)
+    return type(value).__qualname__
+
+
+def _theme_hash(theme: Theme, files: dict[str, str]) -> str:
+    """
+    Return the hash of a theme.
+
+    :param theme: Theme
+    :param files: Referenced files
+    :return: Hash
+    """
+    return hashlib.sha1(repr(_fingerprint(theme, files)).encode()).hexdigest()
+
+
+def _event_name(event: MenuAction) -> str | None:
+    """
+    Return the name of a Menu event.
+
+    :param event: Event
+    :return: Event name within :py:mod:`pygame_menu.events`, ``None`` if not found
+    """
+    for name in pygame_menu.events.__all__:
+        if getattr(pygame_menu.events, name) is event:
+            return name
+    return None
+
+
+def _encode_surface(surface: pygame.Surface) -> list[Any]:
+    """
+    Encode the size and the RGBA pixels of a surface.
+
+    :param surface: Surface
+    :return: Width, height and base64 pixels
+    """
+    (width, height), pixels = _surface_data(surface)
+    return [width, height, base64.b64encode(pixels).decode("ascii")]
+
+
+def _decode_surface(value: list[Any]) -> pygame.Surface:
+    """
+    Decode a surface encoded by :py:func:`_encode_surface`.
+
+    :param value: Width, height and base64 pixels
+    :return: Surface
+    """
+    width, height, pixels = value
+    return pygame.image.frombuffer(
+        base64.b64decode(pixels), (width, height), "RGBA"
+    ).copy()
+
+
+def _argument_names(method: str, count: int) -> list[str]:
+    """
+    Return the parameter names of the positional arguments of a widget
+    addition method.
+
+    :param method: WidgetManager method name
+    :param count: Number of positional arguments
+    :return: Parameter names
+    """
+    names = []
+    signature = inspect.signature(getattr(WidgetManager, method))
+    for param in list(signature.parameters.values())[1:]:
+        if param.kind == param.VAR_POSITIONAL:
+            break
+        names.append(param.name)
+    return [
+        names[i] if i < len(names) else f"args.{i - len(names)}" for i in range(count)
+    ]
+
+
+class _LayoutEncoder:
+    """
+    Converts the Menu tree to layout data, made of JSON primitives only. The
+    values that are not primitives are encoded as single-key objects, whose key
+    is the value kind, for example, ``{"tuple": [1, 2]}``.
+    """
+
+    files: dict[str, str]
+    menus: dict[str, dict[str, Any]]
+
+    def __init__(self) -> None:
+        self.files = {}
+        self.menus = {}
+        self._queue: list[Menu] = []
+
+    def add_menu(self, menu: Menu) -> dict[str, str]:
+        """
+        Queue a Menu to be encoded.
+
+        :param menu: Menu
+        :return: Menu reference
+        """
+        if type(menu) is not pygame_menu.Menu:
+            raise ValueError(
+                f"{type(menu).__name__} is not a Menu but a subclass, thus, it "
+                f"cannot be exported"
+            )
+        if menu.get_id() not in self.menus and menu not in self._queue:
+            self._queue.append(menu)
+        return {"menu": menu.get_id()}
+
+    def encode(self, value: Any, key: str) -> Any:
+        """
+        Encode a value. Callbacks are replaced by references.
+
+        :param value: Value
+        :param key: Value key, used to name the callbacks
+        :return: Encoded value
+        """
+        if value is None or type(value) in (bool, int, float):
+            return value
+        elif isinstance(value, (str, Path)):
+            _fingerprint(value, self.files)
+            return value if isinstance(value, str) else {"path": str(value)}
+        elif isinstance(value, pygame_menu.Menu):
+            return self.add_menu(value)
+        elif isinstance(value, pygame_menu.events.MenuAction):
+            name = _event_name(value)
+            if name is None:
+                raise ValueError(f'event of "{key}" is not a pygame_menu event')
+            return {"event": name}
+        elif isinstance(value, BaseImage):
+            if isinstance(value.get_path(), str):
+                _fingerprint(value.get_path(), self.files)
+            return {
+                "image": [
+                    _encode_surface(value.get_surface(new=False)),
+                    value.get_drawing_mode(),
+                    list(value.get_drawing_offset()),
+                ]
+            }
+        elif isinstance(value, pygame.Surface):
+            return {"surface": _encode_surface(value)}
+        elif isinstance(value, pygame.Color):
+            return {"color": list(value)}
+        elif type(value) in (list, tuple):
+            encoded = [self.encode(v, f"{key}.{i}") for i, v in enumerate(value)]
+            return encoded if isinstance(value, list) else {"tuple": encoded}
+        elif type(value) is dict:
+            if not all(isinstance(k, str) for k in value.keys()):
+                raise ValueError(f'keys of "{key}" must be strings')
+            return {"dict": {k: self.encode(v, f"{key}.{k}") for k, v in value.items()}}
+        elif callable(value) and not isinstance(value, type):
+            return {"callback": key}
+        raise ValueError(f'{type(value).__name__} value of "{key}" cannot be exported')
+
+    def encode_menus(self) -> None:
+        """
+        Encode all the queued Menus, and the submenus they refer to.
+        """
+        while self._queue:
+            menu = self._queue.pop(0)
+            menu_id = menu.get_id()
+            self.menus[menu_id] = {}  # Prevents cycles
+            calls = []
+            encoded = set()
+            for method, args, kwargs, ids in menu._layout_calls.values():
+                if id(ids) in encoded:  # Calls which added several widgets
+                    continue
+                encoded.add(id(ids))
+                present = [wid in menu._widgets_index for wid in ids]
+                names = _argument_names(method, len(args))
+                calls.append(
+                    [
+                        method,
+                        [self.encode(a, f"{ids[0]}.{n}") for a, n in zip(args, names)],
+                        {k: self.encode(v, f"{ids[0]}.{k}") for k, v in kwargs.items()},
+                        ids,
+                        [i for i, p in enumerate(present) if not p],
+                        [
+                            i
+                            for i, wid in enumerate(ids)
+                            if present[i] and not menu._widgets_index[wid].is_visible()
+                        ],
+                    ]
+                )
+            for widget in menu._widgets:
+                if widget.get_frame() is not None:
+                    raise ValueError(
+                        f"{widget.get_class_id()} is packed within a frame, frames "
+                        f"cannot be exported"
+                    )
+                elif widget.get_id() not in menu._layout_calls:
+                    raise ValueError(
+                        f"{widget.get_class_id()} was not added using Menu.add "
+                        f"within Menu.record_layout, thus, it cannot be exported"
+                    )
+            args = {
+                k: self.encode(v, f"{menu_id}.{k}")
+                for k, v in menu._layout_args.items()
+                if k != "theme"
+            }
+            args["menu_id"] = menu_id
+            self.menus[menu_id] = {
+                "args": args,
+                "calls": calls,
+                "theme": _theme_hash(menu.get_theme(), self.files),
+            }
+
+
+def export_layout(menu: Menu, key: str = "") -> bytes:
+    """
+    Export the layout of a Menu and its submenus.
+
+    :param menu: Menu
+    :param key: Layout key, it must be the same to restore the layout
+    :return: Compressed JSON layout data
+    """
+    encoder = _LayoutEncoder()
+    encoder.add_menu(menu)
+    encoder.encode_menus()
+    data = {
+        "files": encoder.files,
+        "key": key,
+        "menus": encoder.menus,
+        "root": menu.get_id(),
+        "version": [_LAYOUT_VERSION, ver],
+    }
+    return zlib.compress(json.dumps(data, separators=(",", ":")).encode())
+
+
+def _decode(value: Any, callbacks: dict[str, Callable], menus: dict[str, Menu]) -> Any:
+    """
+    Decode a layout value.
+
+    :param value: Encoded value
+    :param callbacks: Callbacks by name
+    :param menus: Restored menus by ID
+    :return: Value
+    """
+    if isinstance(value, list):
+        return [_decode(v, callbacks, menus) for v in value]
+    elif not isinstance(value, dict):
+        return value
+    kind, data = next(iter(value.items()))
+    if kind == "tuple":
+        return tuple(_decode(v, callbacks, menus) for v in data)
+    elif kind == "dict":
+        return {k: _decode(v, callbacks, menus) for k, v in data.items()}
+    elif kind == "menu":
+        return menus[data]
+    elif kind == "callback":
+        for name in (data, data.split(".")[0]):
+            if name in callbacks:
+                return callbacks[name]
+        raise ValueError(f'callback "{data}" of the layout was not provided')
+    elif kind == "event":
+        if data not in pygame_menu.events.__all__:
+            raise ValueError(f'"{data}" is not a pygame_menu event')
+        return getattr(pygame_menu.events, data)
+    elif kind == "path":
+        return Path(data)
+    elif kind == "color":
+        return pygame.Color(*data)
+    elif kind == "surface":
+        return _decode_surface(data)
+    elif kind == "image":
+        surface, drawing_mode, drawing_offset = data
+        return BaseImage(
+            _decode_surface(surface),
+            drawing_mode=drawing_mode,
+            drawing_offset=tuple(drawing_offset),
+        )
+    raise ValueError(f'invalid layout value kind "{kind}"')
+
+
+def load_layout(
+    data: bytes,
+    callbacks: dict[str, Callable] | None = None,
+    theme: Theme | None = None,
+    key: str = "",
+) -> Menu | None:
+    """
+    Restore the Menu tree from the layout data. The recorded widget addition
+    calls are replayed, and recorded again, with the rendering disabled. The
+    calls store the widget IDs; thus, the widgets are added with the same IDs.
+
+    :param data: Compressed JSON layout data
+    :param callbacks: Callbacks by name
+    :param theme: Theme of the menus. If ``None`` uses the default theme
+    :param key: Layout key
+    :return: Root Menu, ``None`` if the layout is not valid
+    """
+    try:
+        layout = json.loads(zlib.decompress(data))
+        valid = layout["version"] == [_LAYOUT_VERSION, ver] and layout["key"] == key
+    except Exception:  # Corrupted or incompatible data
+        return None
+    if not valid:
+        return None
+
+    # Check the theme and the referenced files have not changed
+    for path, digest in layout["files"].items():
+        if _file_digest(path) != digest:
+            return None
+    if theme is None:
+        theme_hash = _theme_hash(pygame_menu.themes.THEME_DEFAULT, {})
+    else:
+        theme_hash = _theme_hash(theme, {})
+    for menu_data in layout["menus"].values():
+        if menu_data["theme"] != theme_hash:
+            return None
+
+    # Create the menus, then add the widgets; thus, submenus can be linked
+    if callbacks is None:
+        callbacks = {}
+    menus: dict[str, Menu] = {}
+    for menu_id, menu_data in layout["menus"].items():
+        args = {k: _decode(v, callbacks, menus) for k, v in menu_data["args"].items()}
+        menus[menu_id] = pygame_menu.Menu(theme=theme, **args).disable_render()
+    for menu_id, menu_data in layout["menus"].items():
+        menu = menus[menu_id]
+        for method, args, kwargs, ids, removed, hidden in menu_data["calls"]:
+            if method not in _LAYOUT_METHODS:
+                raise ValueError(f'"{method}" is not a widget addition method')
+            with menu.record_layout():
+                widgets = getattr(menu.add, method)(
+                    *_decode(args, callbacks, menus),
+                    **{k: _decode(v, callbacks, menus) for k, v in kwargs.items()},
+                )
+            if not isinstance(widgets, list):
+                widgets = [widgets]
+            if [w.get_id() for w in widgets] != ids:
+                raise ValueError(f'widget IDs of the "{method}" call do not match')
+            for i in hidden:
+                widgets[i].hide()
+            for i in removed:
+                menu.remove_widget(widgets[i])
+    for menu in menus.values():
+        menu.enable_render()
+    return menus[layout["root"]]
@@ -58,6 +58,8 @@ from pygame_menu.utils import (
     assert_position,
     get_finger_pos,
     make_surface,
+    optimize_surface,
+    release_surface,
 )
 from pygame_menu.widgets import ScrollBar
 
@@ -146,11 +148,13 @@ class ScrollArea(Base):
 
     _area_color: ColorInputType | pygame_menu.BaseImage | None
     _border_color: ColorInputType | pygame_menu.BaseImage | None
+    _border_surface: tuple[Tuple2IntType, pygame.Surface] | None
     _border_tiles: list[pygame.Surface]
     _border_tiles_size: Tuple2IntType
     _border_width: int
     _bg_surface: pygame.Surface | None
-    _decorator: Decorator
+    _bg_surface_key: tuple[Any, ...]
+    _decorator: Decorator | None
     _extend_x: int
     _extend_y: int
     _menu: pygame_menu.Menu | None
@@ -163,6 +167,7 @@ class ScrollArea(Base):
     _translate: Tuple2IntType
     _view_rect: pygame.Rect
     _world: pygame.Surface | None
+    _world_area: pygame.Rect
 
     def __init__(
         self,
@@ -250,12 +255,15 @@ class ScrollArea(Base):
 
         self._area_color = area_color
         self._border_color = border_color
+        self._border_surface = None
         self._border_width = border_width
         self._bg_surface = None
-        self._decorator = Decorator(self)  # type: ignore
+        self._bg_surface_key = ()
+        self._decorator = None  # Created by get_decorator()
         self._scrollbar_positions = tuple(unique_scrolls)  # Ensure unique
         self._translate = (0, 0)
         self._world = world
+        self._world_area = pygame.Rect(0, 0, 0, 0)  # Reused on each draw
 
         self._extend_x = extend_x
         self._extend_y = extend_y
@@ -365,27 +373,87 @@ class ScrollArea(Base):
 
     def _make_background_surface(self) -> None:
         """
-        Create background surface.
-        """
-        # If bg surface is created, and it's the same size
-        if (
-            self._bg_surface is not None
-            and self._bg_surface.get_width() == self._rect.width
-            and self._bg_surface.get_height() == self._rect.height
-        ):
+        Create background surface. It is cached until the extended area size, the
+        area color, or the image drawing properties change.
+        """
+        size = self._rect.width + self._extend_x, self._rect.height + self._extend_y
+        color = self._area_color
+        if isinstance(color, pygame_menu.BaseImage):
+            key = (
+                size,
+                color,
+                color.get_surface(new=False),
+                color.get_drawing_mode(),
+                color.get_drawing_offset(),
+                color.get_drawing_position(),
+            )
+        else:
+            key = (size, color)
+
+        # If bg surface is created, and it's the same key
+        if self._bg_surface is not None and self._bg_surface_key == key:
             return
 
         # Make surface
-        self._bg_surface = make_surface(
-            width=self._rect.width + self._extend_x,
-            height=self._rect.height + self._extend_y,
-        )
+        release_surface(self._bg_surface)
+        self._bg_surface = make_surface(width=size[0], height=size[1])
+        self._bg_surface_key = key
         rect = self._bg_surface.get_rect()
-        if self._area_color is not None:
-            if isinstance(self._area_color, pygame_menu.BaseImage):
-                self._area_color.draw(surface=self._bg_surface, area=rect)
+        if color is not None:
+            if isinstance(color, pygame_menu.BaseImage):
+                color.draw(surface=self._bg_surface, area=rect)
             else:
-                self._bg_surface.fill(assert_color(self._area_color))
+                self._bg_surface.fill(assert_color(color))
+        if self._menu is not None:
+            self._menu._stats.build_background += 1
+
+    def _make_border_surface(self) -> pygame.Surface:
+        """
+        Create the image border surface, composed from the border tiles. It is
+        cached until the area size changes.
+
+        :return: Border surface
+        """
+        size = self._rect.width, self._rect.height
+        if self._border_surface is not None and self._border_surface[0] == size:
+            return self._border_surface[1]
+
+        tw, th = self._border_tiles_size
+        width, height = int(self._rect.width + 2 * tw), int(self._rect.height + 2 * th)
+        (
+            tile_nw,
+            tile_w,
+            tile_sw,
+            tile_n,
+            _,
+            tile_s,
+            tile_ne,
+            tile_e,
+            tile_se,
+        ) = self._border_tiles
+        blits: list[tuple[pygame.Surface, Tuple2IntType]] = []
+
+        # Top and bottom tiles, the last ones are covered by the corners
+        for x in range(0, width - tw, tw):
+            blits.append((tile_n, (x, 0)))
+            blits.append((tile_s, (x, height - th)))
+
+        # Left and right tiles
+        for y in range(0, height - th, th):
+            blits.append((tile_w, (0, y)))
+            blits.append((tile_e, (width - tw, y)))
+
+        # Corners
+        blits.append((tile_nw, (0, 0)))
+        blits.append((tile_sw, (0, height - th)))
+        blits.append((tile_ne, (width - tw, 0)))
+        blits.append((tile_se, (width - tw, height - th)))
+
+        border = make_surface(width, height)
+        border.blits(blits, doreturn=False)
+        border = optimize_surface(border)
+        self._border_surface = (size, border)
+        return border
 
     def update_area_color(
         self, color: ColorInputType | pygame_menu.BaseImage | None
@@ -397,7 +465,7 @@ class ScrollArea(Base):
         :return: Self reference
         """
         self._area_color = color
-        self._bg_surface = None
+        self._bg_surface_key = ()
         self._make_background_surface()
         return self
 
@@ -484,7 +552,8 @@ class ScrollArea(Base):
         """
         if self._menu is not None:
             self._menu._widget_surface_cache_need_update = True
-            self._decorator.force_cache_update()
+            if self._decorator is not None:
+                self._decorator.force_cache_update()
         return self
 
     def _apply_size_changes(self) -> None:
@@ -567,12 +636,12 @@ class ScrollArea(Base):
                 (self._rect.x - self._extend_x, self._rect.y - self._extend_y),
             )
 
-        # Draw world surface
-        surface.blit(
-            self._world,
-            self._view_rect.topleft,
-            (self.get_offsets(), self._view_rect.size),
-        )
+        # Draw world surface, the area rect is updated in place
+        area = self._world_area
+        area.x, area.y = self.get_offsets()
+        area.width = self._view_rect.width
+        area.height = self._view_rect.height
+        surface.blit(self._world, self._view_rect, area)
 
         # Then draw scrollbars
         for sbar in self._scrollbars:
@@ -586,60 +655,16 @@ class ScrollArea(Base):
                     sbar.draw(surface)
 
         # Draw post decorator
-        self._decorator.draw_post(surface)
+        if self._decorator is not None:
+            self._decorator.draw_post(surface)
 
         # Create border
         if isinstance(self._border_color, pygame_menu.BaseImage):  # Image
             tw, th = self._border_tiles_size
-            border_rect = pygame.Rect(
-                int(self._rect.x - tw),
-                int(self._rect.y - th),
-                int(self._rect.width + 2 * tw),
-                int(self._rect.height + 2 * th),
+            surface.blit(
+                self._make_border_surface(), (self._rect.x - tw, self._rect.y - th)
             )
 
-            surface_blit = surface.blit
-            (
-                tile_nw,
-                tile_w,
-                tile_sw,
-                tile_n,
-                _,
-                tile_s,
-                tile_ne,
-                tile_e,
-                tile_se,
-            ) = self._border_tiles
-            left, top = self._rect.topleft
-            left -= tw
-            top -= th
-
-            # draw top and bottom tiles
-            area: tuple[int, int, int, int] | None
-
-            for x in range(border_rect.left, border_rect.right, tw):
-                if x + tw >= border_rect.right:
-                    area = 0, 0, tw - (x + border_rect.right), th
-                else:
-                    area = None
-                surface_blit(tile_n, (x, top), area)
-                surface_blit(tile_s, (x, border_rect.bottom - th), area)
-
-            # draw left and right tiles
-            for y in range(border_rect.top, border_rect.bottom, th):
-                if y + th >= border_rect.bottom:
-                    area = 0, 0, tw, th - (y + border_rect.bottom)
-                else:
-                    area = None
-                surface_blit(tile_w, (left, y), area)
-                surface_blit(tile_e, (border_rect.right - tw, y), area)
-
-            # draw corners
-            surface_blit(tile_nw, (left, top))
-            surface_blit(tile_sw, (left, border_rect.bottom - th))
-            surface_blit(tile_ne, (border_rect.right - tw, top))
-            surface_blit(tile_se, (border_rect.right - tw, border_rect.bottom - th))
-
         else:  # Color
             if self._border_width == 0 or self._border_color is None:
                 return self
@@ -696,19 +721,19 @@ class ScrollArea(Base):
 
         :return: ScrollArea offset on x-axis and y-axis (x, y)
         """
-        offsets = [0, 0]
+        offset_x, offset_y = 0, 0
         for sbar in self._scrollbars:
             if not sbar.is_visible():
                 continue
             elif sbar.get_orientation() == ORIENTATION_HORIZONTAL:
                 if self.get_hidden_width():
-                    offsets[0] = (
+                    offset_x = (
                         sbar.get_value()
                     )  # Cannot add as each scrollbar can only affect 1 axis only
             else:
                 if self.get_hidden_height():
-                    offsets[1] = sbar.get_value()
-        return offsets[0], offsets[1]
+                    offset_y = sbar.get_value()
+        return offset_x, offset_y
 
     def get_rect(self, to_real_position: bool = False) -> pygame.Rect:
         """
@@ -1400,6 +1425,8 @@ class ScrollArea(Base):
 
         :return: Decorator API
         """
+        if self._decorator is None:
+            self._decorator = Decorator(self)  # type: ignore
         return self._decorator
 
 
@@ -10,7 +10,9 @@ from __future__ import annotations
 
 __all__ = ["WidgetManager"]
 
-from typing import Any
+import inspect
+from functools import wraps
+from typing import TYPE_CHECKING, Any
 
 import pygame_menu
 from pygame_menu._base import Base
@@ -34,6 +36,7 @@ from pygame_menu.widgets.widget.frame import FrameManager
 from pygame_menu.widgets.widget.hmargin import HMarginManager
 from pygame_menu.widgets.widget.image import ImageManager
 from pygame_menu.widgets.widget.label import LabelManager
+from pygame_menu.widgets.widget.listview import ListViewManager
 from pygame_menu.widgets.widget.menulink import MenuLinkManager
 from pygame_menu.widgets.widget.none import NoneWidgetManager
 from pygame_menu.widgets.widget.progressbar import ProgressBarManager
@@ -46,6 +49,61 @@ from pygame_menu.widgets.widget.toggleswitch import ToggleSwitchManager
 from pygame_menu.widgets.widget.vfill import VFillManager
 from pygame_menu.widgets.widget.vmargin import VMarginManager
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+# Names of the widget addition methods recorded within the layouts
+_LAYOUT_METHODS: set[str] = set()
+
+
+def _record_layout(method: Callable, id_parameter: str) -> Callable:
+    """
+    Record the calls of a widget addition method within the Menu, used by
+    :py:meth:`pygame_menu.menu.Menu.export_layout`. Calls are recorded only
+    within :py:meth:`pygame_menu.menu.Menu.record_layout`, and calls made by other
+    addition methods are not. The call is kept while any of the widgets it added
+    remains within the Menu.
+
+    The widget ID is stored within the call arguments; thus, the replayed call
+    adds the widgets with the same IDs.
+
+    :param method: Widget addition method
+    :param id_parameter: Name of the widget ID parameter of the method
+    :return: Recorded method
+    """
+    parameters = list(inspect.signature(method).parameters)
+    id_position = (
+        parameters.index(id_parameter) - 1 if id_parameter in parameters else -1
+    )
+
+    @wraps(method)
+    def add(self: WidgetManager, *args, **kwargs) -> Any:
+        self._layout_depth += 1
+        try:
+            widget = method(self, *args, **kwargs)
+        finally:
+            self._layout_depth -= 1
+        if self._layout_depth == 0 and self._menu._layout_recording:
+            widgets = widget if isinstance(widget, list) else [widget]
+            ids = [w.get_id() for w in widgets]
+            positional = 0 <= id_position < len(args)
+            given_id = args[id_position] if positional else kwargs.get(id_parameter)
+            if ids and not given_id:
+                # Labels split in several lines append "+<line>" to the generated ID
+                call_id = ids[0].split("+")[0] if len(ids) > 1 else ids[0]
+                if positional:
+                    args = (*args[:id_position], call_id, *args[id_position + 1 :])
+                else:
+                    kwargs[id_parameter] = call_id
+            call = (method.__name__, args, kwargs, ids)
+            for widget_id in ids:
+                self._menu._layout_calls[widget_id] = call
+        return widget
+
+    _LAYOUT_METHODS.add(method.__name__)
+    return add
+
 
 # noinspection PyProtectedMember
 class WidgetManager(
@@ -58,6 +116,7 @@ class WidgetManager(
     HMarginManager,
     ImageManager,
     LabelManager,
+    ListViewManager,
     MenuLinkManager,
     NoneWidgetManager,
     ProgressBarManager,
@@ -77,8 +136,37 @@ class WidgetManager(
     :param verbose: Enables/disables verbose mode (warnings/errors)
     """
 
+    # Widget addition methods, the calls are recorded to export the Menu layout
+    banner = _record_layout(ButtonManager.banner, "button_id")
+    button = _record_layout(ButtonManager.button, "button_id")
+    clock = _record_layout(LabelManager.clock, "clock_id")
+    color_input = _record_layout(ColorInputManager.color_input, "color_id")
+    dropselect = _record_layout(DropSelectManager.dropselect, "dropselect_id")
+    dropselect_multiple = _record_layout(
+        DropSelectMultipleManager.dropselect_multiple, "dropselect_multiple_id"
+    )
+    frame_h = _record_layout(FrameManager.frame_h, "frame_id")
+    frame_v = _record_layout(FrameManager.frame_v, "frame_id")
+    horizontal_margin = _record_layout(HMarginManager.horizontal_margin, "margin_id")
+    image = _record_layout(ImageManager.image, "image_id")
+    label = _record_layout(LabelManager.label, "label_id")
+    list_view = _record_layout(ListViewManager.list_view, "list_view_id")
+    menu_link = _record_layout(MenuLinkManager.menu_link, "link_id")
+    none_widget = _record_layout(NoneWidgetManager.none_widget, "widget_id")
+    progress_bar = _record_layout(ProgressBarManager.progress_bar, "progressbar_id")
+    range_slider = _record_layout(RangeSliderManager.range_slider, "rangeslider_id")
+    selector = _record_layout(SelectorManager.selector, "selector_id")
+    surface = _record_layout(SurfaceWidgetManager.surface, "surface_id")
+    table = _record_layout(TableManager.table, "table_id")
+    text_input = _record_layout(TextInputManager.text_input, "textinput_id")
+    toggle_switch = _record_layout(ToggleSwitchManager.toggle_switch, "toggleswitch_id")
+    url = _record_layout(ButtonManager.url, "button_id")
+    vertical_fill = _record_layout(VFillManager.vertical_fill, "vfill_id")
+    vertical_margin = _record_layout(VMarginManager.vertical_margin, "margin_id")
+
     def __init__(self, menu: pygame_menu.Menu, verbose: bool = True) -> None:
         super().__init__(object_id=menu.get_id() + "+widget-manager", verbose=verbose)
+        self._layout_depth = 0
         self._menu = menu
 
     @property
@@ -91,6 +179,7 @@ class WidgetManager(
         assert isinstance(hook, Widget)
         if menu not in self._menu._submenus.keys():
             self._menu._submenus[menu] = []
+            pygame_menu.menu._TREE_VERSION[0] += 1
         assert hook not in self._menu._submenus[menu], (
             f"widget {hook.get_class_id()} already hooks submenu {menu.get_class_id()}"
         )
@@ -383,6 +472,9 @@ class WidgetManager(
 
         # Append to lists
         self._menu._widgets.append(widget)
+        self._menu._widgets_index[widget.get_id()] = widget
+        pygame_menu.menu._TREE_VERSION[0] += 1
+        self._menu._input_data_changed(widget)
 
         # Update selection index
         if self._menu._index < 0 and widget.is_selectable:
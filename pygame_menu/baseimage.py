@@ -12,6 +12,7 @@ from __future__ import annotations
 __all__ = [
     # Base class
     "BaseImage",
+    "GradientImage",
     # Image paths
     "IMAGE_EXAMPLE_CARBON_FIBER",
     "IMAGE_EXAMPLE_GRAY_LINES",
@@ -33,6 +34,8 @@ __all__ = [
 import base64
 import math
 import os.path as path
+import weakref
+from concurrent.futures import Future
 from io import BytesIO
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal, Union
@@ -67,6 +70,9 @@ from pygame_menu.utils import (
     assert_position,
     assert_vector,
     load_pygame_image_file,
+    make_gradient,
+    make_surface,
+    optimize_surface,
 )
 
 if TYPE_CHECKING:
@@ -113,6 +119,7 @@ _VALID_IMAGE_MODES = (
 )
 
 # Other constants
+_EXTENSION_PENDING = "<pending>"
 _EXTENSION_SURFACE = "<surface>"
 
 _VALID_IMAGE_FORMATS = [
@@ -131,9 +138,13 @@ _VALID_IMAGE_FORMATS = [
     ".svg",
     "BytesIO",
     "base64",
+    _EXTENSION_PENDING,
     _EXTENSION_SURFACE,
 ]
 
+# Images waiting for a background load, see BaseImage pending sources
+_PENDING_IMAGES: weakref.WeakSet[BaseImage] = weakref.WeakSet()
+
 # Custom types
 ColorChannelType = Literal["r", "g", "b"]
 ChannelType = Union[
@@ -144,55 +155,98 @@ ChannelType = Union[
 ]
 
 
+def _resolve_pending_images() -> list[BaseImage]:
+    """
+    Swap in the surfaces of all pending images whose background load has
+    finished. Must be called from the main thread.
+
+    :return: Images that have been updated
+    """
+    if not _PENDING_IMAGES:
+        return []
+    return [image for image in list(_PENDING_IMAGES) if image._check_pending()]
+
+
 class BaseImage(Base):
     """
     Object that loads an image, stores as a surface, transform it and
     let write the image to a surface.
 
-    :param image_path: Path of the image to be loaded. It can be a string (path, base64), :py:class:`pathlib.Path`, or :py:class:`io.BytesIO`. May also be a :py:class:`pygame.Surface`, in which case the image is copied.
+    .. note::
+
+        ``image_path`` can also be a pending :py:class:`concurrent.futures.Future`
+        that resolves to a :py:class:`pygame.Surface`, for example, the one
+        returned by :py:meth:`pygame_menu.loader.AssetLoader.load_image`. Until
+        the future is done the image uses the ``placeholder`` surface and it is
+        not drawn; the loaded surface is swapped in from the main thread once it
+        is ready. Transformations (scale, rotate, etc.) should be applied after
+        the image has been loaded, see :py:meth:`pygame_menu.baseimage.BaseImage.is_pending`.
+
+    :param image_path: Path of the image to be loaded. It can be a string (path, base64), :py:class:`pathlib.Path`, or :py:class:`io.BytesIO`. May also be a :py:class:`pygame.Surface`, in which case the image is copied, or a pending :py:class:`concurrent.futures.Future`
     :param drawing_mode: Drawing mode of the image
     :param drawing_offset: Offset of the image in drawing method
     :param drawing_position: Drawing position if mode is ``IMAGE_MODE_SIMPLE``. See :py:mod:`pygame_menu.locals` for valid ``position`` values
     :param load_from_file: Loads the image from the given path
     :param frombase64: If ``True`` consider ``image_path`` as base64 string
     :param image_id: str
+    :param placeholder: Surface used while a pending source is being loaded. If ``None`` uses a transparent 1x1 px surface
     """
 
     _angle: NumberType
     _drawing_mode: int
     _drawing_offset: Tuple2IntType
     _drawing_position: str
+    _display_surface: tuple[pygame.Surface | None, pygame.Surface | None]
     _extension: str
     _filename: str
     _filepath: str | BytesIO
     _frombase64: bool
     _last_transform: tuple[int, int, pygame.Surface | None]
     _original_surface: pygame.Surface
+    _pending: Future | None
+    _repeat_surface: (
+        tuple[pygame.Surface, tuple[int, Tuple4IntType], pygame.Surface] | None
+    )
     _rotated: bool
     _surface: pygame.Surface
     smooth_scaling: bool
 
     def __init__(
         self,
-        image_path: str | Path | BytesIO | pygame.Surface,
+        image_path: str | Path | BytesIO | pygame.Surface | Future,
         drawing_mode: int = IMAGE_MODE_FILL,
         drawing_offset: Vector2NumberType = (0, 0),
         drawing_position: str = POSITION_NORTHWEST,
         load_from_file: bool = True,
         frombase64: bool = False,
         image_id: str = "",
+        placeholder: pygame.Surface | None = None,
     ) -> None:
         super().__init__(object_id=image_id)
 
         assert isinstance(load_from_file, bool)
         assert isinstance(frombase64, bool)
+        assert isinstance(placeholder, (pygame.Surface, type(None)))
 
         self._load_from_file = load_from_file
+        self._pending = None
 
         self._is_surface_source = isinstance(image_path, pygame.Surface)
 
+        # Handle pending sources, the surface is swapped in once loaded
+        if isinstance(image_path, Future):
+            if placeholder is None:
+                placeholder = pygame.Surface((1, 1), pygame.SRCALPHA)
+            self._set_source_info(_EXTENSION_PENDING, _EXTENSION_PENDING, False)
+            self._filename = ""
+            self._surface = placeholder
+            self._original_surface = placeholder
+            self._load_from_file = False
+            self._pending = image_path
+            _PENDING_IMAGES.add(self)
+
         # Handle pygame.Surface input directly
-        if self._is_surface_source:
+        elif self._is_surface_source:
             # Copy the surface; preserve alpha if present
             surf = (
                 image_path.copy().convert_alpha()
@@ -265,10 +319,16 @@ class BaseImage(Base):
 
         # Internal state
         self._angle = 0
+        self._display_surface = (None, None)  # Display-format surface for draw()
         self._last_transform = (0, 0, None)  # Cache for draw()
+        self._repeat_surface = None  # Repeated image for draw()
         self._rotated = False
         self.smooth_scaling = True  # Default scaling mode
 
+        # The source may have been loaded already
+        if self._pending is not None:
+            self._check_pending()
+
     def __copy__(self) -> BaseImage:
         """
         Copy method.
@@ -304,6 +364,38 @@ class BaseImage(Base):
         self._extension = extension
         self._frombase64 = frombase64
 
+    def _check_pending(self) -> bool:
+        """
+        Swap in the loaded surface if the pending source has finished. If the
+        background load failed its exception is raised.
+
+        :return: ``True`` if the surface has been swapped
+        """
+        if self._pending is None or not self._pending.done():
+            return False
+        future, self._pending = self._pending, None
+        _PENDING_IMAGES.discard(self)
+        surface = future.result()
+        assert isinstance(surface, pygame.Surface), (
+            "pending image source must resolve to a pygame.Surface"
+        )
+        self._set_source_info(_EXTENSION_SURFACE, _EXTENSION_SURFACE, False)
+        self._is_surface_source = True
+        self._surface = surface
+        self._original_surface = surface.copy()
+        self._last_transform = (0, 0, None)
+        return True
+
+    def is_pending(self) -> bool:
+        """
+        Return ``True`` if the image source is still being loaded in the
+        background. In that case the image holds a placeholder surface.
+
+        :return: ``True`` if pending
+        """
+        self._check_pending()
+        return self._pending is not None
+
     def crop_rect(self, rect: pygame.Rect) -> BaseImage:
         """
         Crop image from rect.
@@ -335,6 +427,8 @@ class BaseImage(Base):
         :param flags: Optional flags
         :return: Self reference
         """
+        self._display_surface = (None, None)
+        self._repeat_surface = None
         if value is None:
             self._surface.set_alpha(None)
             return self
@@ -403,8 +497,16 @@ class BaseImage(Base):
         :return: A new BaseImage instance
         """
 
+        self._check_pending()
+
         # Reconstruct the correct source type
-        if self._is_surface_source:
+        if self._pending is not None:
+            # Share the pending load, the internal state is copied below
+            path_to_pass = self._pending
+            load_from_file = False
+            frombase64 = False
+
+        elif self._is_surface_source:
             # Pass a fresh surface so the new instance is independent
             path_to_pass = self._surface.copy()
             load_from_file = False
@@ -491,6 +593,14 @@ class BaseImage(Base):
         self._drawing_offset = (int(offset[0]), int(offset[1]))
         return self
 
+    def get_drawing_position(self) -> str:
+        """
+        Return the image position.
+
+        :return: Image position
+        """
+        return self._drawing_position
+
     def set_drawing_position(self, position: str) -> BaseImage:
         """
         Set the image position.
@@ -512,6 +622,8 @@ class BaseImage(Base):
 
         :return: Image width
         """
+        if self._pending is not None:
+            self._check_pending()
         return int(self._surface.get_width())
 
     def get_height(self) -> int:
@@ -520,6 +632,8 @@ class BaseImage(Base):
 
         :return: Image height
         """
+        if self._pending is not None:
+            self._check_pending()
         return int(self._surface.get_height())
 
     def subsurface(self, rect: Tuple4IntType | pygame.Rect) -> pygame.Surface:
@@ -577,6 +691,8 @@ class BaseImage(Base):
         """
         assert_vector(pos, 2)
         self._surface.set_at(pos, assert_color(color))
+        self._display_surface = (None, None)
+        self._repeat_surface = None
         return self
 
     def get_bitsize(self) -> int:
@@ -594,6 +710,8 @@ class BaseImage(Base):
         :param new: Return a new surface; if ``False`` return the same object
         :return: Image surface
         """
+        if self._pending is not None:
+            self._check_pending()
         if new:
             return self.get_crop_rect(self.get_rect())
         return self._surface
@@ -720,6 +838,8 @@ class BaseImage(Base):
                 if "b" not in channels:
                     b = 0
                 self._surface.set_at((x, y), pygame.Color(r, g, b, a))
+        self._display_surface = (None, None)
+        self._repeat_surface = None
         return self
 
     def flip(self, x: bool, y: bool) -> BaseImage:
@@ -904,6 +1024,69 @@ class BaseImage(Base):
             return rect.bottomright
         raise ValueError(f'unknown drawing position "{self._drawing_position}"')
 
+    def _get_display_surface(self) -> pygame.Surface:
+        """
+        Return the image surface converted to the display pixel format. The
+        conversion is cached until the image surface changes. If the display
+        optimization is not available, the image surface is returned.
+
+        :return: Surface to draw
+        """
+        if self._display_surface[0] is self._surface:
+            return self._display_surface[1]
+        surface = optimize_surface(self._surface)
+        if surface is not self._surface:
+            self._display_surface = (self._surface, surface)
+        return surface
+
+    def _get_repeat_surface(
+        self, image: pygame.Surface, area: pygame.Rect
+    ) -> pygame.Surface:
+        """
+        Return the image repeated over the area, as the repeat drawing modes
+        require. The surface is composed once, and cached until the area, the
+        drawing mode or the image changes.
+
+        :param image: Image surface to repeat
+        :param area: Area to draw
+        :return: Repeated image surface
+        """
+        key = (self._drawing_mode, tuple(area))
+        if (
+            self._repeat_surface is not None
+            and self._repeat_surface[0] is image
+            and self._repeat_surface[1] == key
+        ):
+            return self._repeat_surface[2]
+
+        w, h = image.get_size()
+        timesx, timesy = 1, 1
+        if self._drawing_mode == IMAGE_MODE_REPEAT_X:
+            timesx = int(math.ceil(float(area.width) / w))
+            assert timesx > 0, "invalid size, width must be greater than zero"
+        elif self._drawing_mode == IMAGE_MODE_REPEAT_Y:
+            timesy = int(math.ceil(float(area.height) / h))
+            assert timesy > 0, "invalid size, height must be greater than zero"
+        else:
+            timesx = int(math.ceil(float(area.width) / w))
+            timesy = int(math.ceil(float(area.height) / h))
+            assert timesx > 0 and timesy > 0, (
+                "invalid size, width and height must be greater than zero"
+            )
+
+        repeat = make_surface(timesx * w, timesy * h)
+        repeat.blits(
+            [
+                (image, (x * w, y * h), area)
+                for x in range(timesx)
+                for y in range(timesy)
+            ],
+            doreturn=False,
+        )
+        repeat = optimize_surface(repeat)
+        self._repeat_surface = (image, key, repeat)
+        return repeat
+
     def draw(
         self,
         surface: pygame.Surface,
@@ -922,6 +1105,10 @@ class BaseImage(Base):
         assert isinstance(area, (pygame.Rect, type(None)))
         assert_vector(position, 2, int)
 
+        # Placeholders are not drawn
+        if self._pending is not None and not self._check_pending():
+            return self
+
         if area is None:
             area = surface.get_rect()
 
@@ -934,6 +1121,11 @@ class BaseImage(Base):
         offx = self._drawing_offset[0] - px
         offy = self._drawing_offset[1] - py
 
+        # Filled images optimize the scaled surface instead
+        image = self._surface
+        if self._drawing_mode != IMAGE_MODE_FILL:
+            image = self._get_display_surface()
+
         if self._drawing_mode == IMAGE_MODE_FILL:
             # Check if exists the transformed surface
             if (
@@ -951,52 +1143,26 @@ class BaseImage(Base):
                     surf = pygame.transform.scale(
                         self._surface, (area.width, area.height)
                     )
+                surf = optimize_surface(surf)
                 self._last_transform = (area.width, area.height, surf)
 
             surface.blit(surf, (offx + position[0], offy + position[1]))
 
-        elif self._drawing_mode == IMAGE_MODE_REPEAT_X:
-            w = self._surface.get_width()
-            times = int(math.ceil(float(area.width) / w))
-            assert times > 0, "invalid size, width must be greater than zero"
-            for x in range(times):
-                surface.blit(
-                    self._surface,
-                    (x * w + offx + position[0], offy + position[1]),
-                    area,
-                )
-
-        elif self._drawing_mode == IMAGE_MODE_REPEAT_Y:
-            h = self._surface.get_height()
-            times = int(math.ceil(float(area.height) / h))
-            assert times > 0, "invalid size, height must be greater than zero"
-            for y in range(times):
-                surface.blit(
-                    self._surface,
-                    (0 + offx + position[0], y * h + offy + position[1]),
-                    area,
-                )
-
-        elif self._drawing_mode == IMAGE_MODE_REPEAT_XY:
-            w, h = self._surface.get_size()
-            timesx = int(math.ceil(float(area.width) / w))
-            timesy = int(math.ceil(float(area.height) / h))
-            assert timesx > 0 and timesy > 0, (
-                "invalid size, width and height must be greater than zero"
+        elif self._drawing_mode in (
+            IMAGE_MODE_REPEAT_X,
+            IMAGE_MODE_REPEAT_Y,
+            IMAGE_MODE_REPEAT_XY,
+        ):
+            surface.blit(
+                self._get_repeat_surface(image, area),
+                (offx + position[0], offy + position[1]),
             )
-            for x in range(timesx):
-                for y in range(timesy):
-                    surface.blit(
-                        self._surface,
-                        (x * w + offx + position[0], y * h + offy + position[1]),
-                        area,
-                    )
 
         elif self._drawing_mode == IMAGE_MODE_CENTER:
             sw, hw = area.width, area.height  # Window
-            w, h = self._surface.get_size()  # Image
+            w, h = image.get_size()  # Image
             surface.blit(
-                self._surface,
+                image,
                 (
                     int(float(sw - w) / 2 + offx + position[0]),
                     int(float(hw - h) / 2 + offy + position[1]),
@@ -1005,6 +1171,128 @@ class BaseImage(Base):
             )
 
         elif self._drawing_mode == IMAGE_MODE_SIMPLE:
-            surface.blit(self._surface, (offx + position[0], offy + position[1]), area)
+            surface.blit(image, (offx + position[0], offy + position[1]), area)
+
+        return self
 
+
+class GradientImage(BaseImage):
+    """
+    Image which fills the drawing area with a gradient. It can be used as any
+    color which accepts an image, such as the theme ``background_color``.
+
+    In ``IMAGE_MODE_FILL`` drawing mode the gradient is computed for the size of
+    the drawing area and cached (see :py:func:`pygame_menu.utils.make_gradient`),
+    so redrawing costs a blit. Other drawing modes, or transformed images, use a
+    gradient strip of 256 px.
+
+    .. code-block:: python
+
+        theme.background_color = pygame_menu.baseimage.GradientImage(
+            (255, 0, 0), [(0, 255, 0), (0, 0, 255)]
+        )
+
+    :param color: Starting color
+    :param gradient: Final color, or list of colors (the last is the final) for a multi-stop gradient
+    :param vertical: True=vertical; False=horizontal
+    :param forward: True=forward; False=reverse
+    :param drawing_mode: Drawing mode of the image
+    :param drawing_offset: Offset of the image in drawing method
+    :param image_id: Image ID
+    """
+
+    _gradient: tuple[tuple[Tuple3IntType, ...], bool, bool]
+    _gradient_surface: pygame.Surface
+
+    def __init__(
+        self,
+        color: ColorInputType,
+        gradient: ColorInputType | list[ColorInputType] | tuple[ColorInputType, ...],
+        vertical: bool = True,
+        forward: bool = True,
+        drawing_mode: int = IMAGE_MODE_FILL,
+        drawing_offset: Vector2NumberType = (0, 0),
+        image_id: str = "",
+    ) -> None:
+        if isinstance(gradient, VectorInstance) and not (
+            len(gradient) > 0 and isinstance(gradient[0], NumberInstance)
+        ):
+            colors = (color, *gradient)
+        else:
+            colors = (color, gradient)
+        assert len(colors) >= 2, "gradient must have at least two colors"
+        assert isinstance(vertical, bool) and isinstance(forward, bool)
+        colors = tuple(tuple(assert_color(c)[0:3]) for c in colors)
+        self._gradient = (colors, vertical, forward)
+        size = (1, 256) if vertical else (256, 1)
+        super().__init__(
+            make_gradient(size[0], size[1], colors, vertical, forward),
+            drawing_mode=drawing_mode,
+            drawing_offset=drawing_offset,
+            image_id=image_id,
+        )
+        self._gradient_surface = self._surface
+
+    def get_gradient(self) -> tuple[tuple[Tuple3IntType, ...], bool, bool]:
+        """
+        Return the gradient colors and direction.
+
+        :return: Colors, vertical, forward
+        """
+        return self._gradient
+
+    def copy(self) -> GradientImage:
+        """
+        Return a copy of the image.
+
+        :return: A new GradientImage instance
+        """
+        colors, vertical, forward = self._gradient
+        image = GradientImage(
+            colors[0],
+            list(colors[1:]),
+            vertical,
+            forward,
+            drawing_mode=self._drawing_mode,
+            drawing_offset=self._drawing_offset,
+        )
+
+        # Copy internal state
+        image._angle = self._angle
+        if self._surface is not self._gradient_surface:
+            image._surface = self._surface.copy()
+        image.smooth_scaling = self.smooth_scaling
+
+        # Copy attributes
+        if self._attributes is not None:
+            for k, v in self._attributes.items():
+                image.set_attribute(k, v)
+
+        return image
+
+    def draw(
+        self,
+        surface: pygame.Surface,
+        area: pygame.Rect | None = None,
+        position: Tuple2IntType = (0, 0),
+    ) -> GradientImage:
+        if self._drawing_mode != IMAGE_MODE_FILL or (
+            self._surface is not self._gradient_surface
+        ):
+            super().draw(surface, area, position)
+            return self
+
+        assert isinstance(surface, pygame.Surface)
+        assert isinstance(area, (pygame.Rect, type(None)))
+        assert_vector(position, 2, int)
+        if area is None:
+            area = surface.get_rect()
+        if area.width > 0 and area.height > 0:
+            surface.blit(
+                make_gradient(area.width, area.height, *self._gradient),
+                (
+                    self._drawing_offset[0] + position[0],
+                    self._drawing_offset[1] + position[1],
+                ),
+            )
         return self
@@ -0,0 +1,164 @@
+"""
+pygame-menu
+https://github.com/ppizarror/pygame-menu
+
+BINDING
+Binds a list of items to a pool of reusable widgets.
+"""
+
+from __future__ import annotations
+
+__all__ = ["ListBinding"]
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    import pygame_menu
+    from pygame_menu.widgets.core.widget import Widget
+
+
+def _bind_title(widget: Widget, item: Any) -> None:
+    """
+    Default binding, sets the item string as the widget title.
+
+    :param widget: Widget
+    :param item: Item
+    """
+    title = str(item)
+    if widget.get_title() != title:
+        widget.set_title(title)
+
+
+# noinspection PyProtectedMember
+class ListBinding:
+    """
+    Binds a list of items to a pool of widgets. Each call to
+    :py:meth:`pygame_menu.binding.ListBinding.update` rebinds the title, value or
+    callbacks of the widgets in place, instead of removing and adding them again.
+    The pool only grows if the list is longer than ever before; widgets not used
+    by a shorter list are hidden, and shown again once needed.
+
+    .. code-block:: python
+
+        def bind(button, server):
+            button.set_title(server.name)
+            button.update_callback(join_server, server)
+
+        servers = pygame_menu.binding.ListBinding(
+            menu, lambda: menu.add.button('', None), bind
+        )
+        servers.update(fetch_servers())  # Call again after each refresh
+
+    .. note::
+
+        The Menu layout runs once per update, as the render is disabled while
+        the widgets are bound. See :py:meth:`pygame_menu.menu.Menu.disable_render`.
+
+    .. note::
+
+        Widgets keep their ID between updates. New widgets are moved after the
+        last widget of the pool, thus, the list keeps its position within the
+        Menu even if other widgets were added later.
+
+    :param menu: Menu which contains the widgets
+    :param factory: Function that adds a new widget to the Menu and returns it, ``factory() -> Widget``
+    :param bind: Function that binds an item to a widget, ``bind(widget, item)``. If ``None`` the item string is set as the widget title
+    """
+
+    _bind: Callable[[Widget, Any], Any]
+    _factory: Callable[[], Widget]
+    _menu: pygame_menu.Menu
+    _size: int
+    _widgets: list[Widget]
+
+    def __init__(
+        self,
+        menu: pygame_menu.Menu,
+        factory: Callable[[], Widget],
+        bind: Callable[[Widget, Any], Any] | None = None,
+    ) -> None:
+        assert callable(factory), "factory must be callable (function-type)"
+        assert bind is None or callable(bind), (
+            "bind must be callable (function-type) or None"
+        )
+        self._bind = _bind_title if bind is None else bind
+        self._factory = factory
+        self._menu = menu
+        self._size = 0
+        self._widgets = []
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _new_widget(self) -> Widget:
+        """
+        Create a new widget from the factory, and move it after the last widget
+        of the pool.
+
+        :return: New widget
+        """
+        widget = self._factory()
+        assert widget.get_menu() is self._menu, (
+            f"{widget.get_class_id()} returned by the factory must be added to the menu"
+        )
+        if self._widgets and widget.get_frame() is None:
+            widgets = self._menu.get_widgets()
+            last = self._widgets[-1]
+            last_index = widgets.index(
+                last if last.get_frame() is None else last.get_frame()
+            )
+            if widgets.index(widget) != last_index + 1:
+                self._menu.move_widget_index(widget, last_index + 1, render=False)
+        self._widgets.append(widget)
+        return widget
+
+    def update(self, items: Iterable[Any]) -> ListBinding:
+        """
+        Bind the items to the widgets of the pool. New widgets are only created
+        if the pool is smaller than the number of items. The widgets removed from
+        the Menu are dropped from the pool.
+
+        :param items: Items
+        :return: Self reference
+        """
+        menu = self._menu
+        self._widgets = [w for w in self._widgets if w.get_menu() is menu]
+        render_enabled = menu._render_enabled
+        menu.disable_render()
+        size = 0
+        try:
+            for item in items:
+                if size < len(self._widgets):
+                    widget = self._widgets[size]
+                else:
+                    widget = self._new_widget()
+                self._bind(widget, item)
+                if not widget.is_visible():
+                    widget.show()
+                size += 1
+            for widget in self._widgets[size:]:
+                if widget.is_visible():
+                    widget.hide()
+        finally:
+            self._size = size
+            if render_enabled:
+                menu.enable_render()
+        return self
+
+    def get_widgets(self) -> list[Widget]:
+        """
+        Return the widgets bound to the items of the last update.
+
+        :return: Widget list
+        """
+        return self._widgets[: self._size]
+
+    def get_pool_size(self) -> int:
+        """
+        Return the number of widgets within the pool, including the hidden ones.
+
+        :return: Pool size
+        """
+        return len(self._widgets)
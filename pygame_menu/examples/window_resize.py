@@ -42,15 +42,22 @@ on_resize()  # Set initial size
 if __name__ == "__main__":
     while True:
         events = pygame.event.get()
+        resize_event = None
         for event in events:
             if event.type == pygame.QUIT:
                 pygame.quit()
                 break
             if event.type == pygame.VIDEORESIZE:
-                # Update the surface
-                surface = pygame.display.set_mode((event.w, event.h), pygame.RESIZABLE)
-                # Call the menu event
-                on_resize()
+                # While dragging the window border many events are received,
+                # only the last one is applied
+                resize_event = event
+        if resize_event is not None:
+            # Update the surface
+            surface = pygame.display.set_mode(
+                (resize_event.w, resize_event.h), pygame.RESIZABLE
+            )
+            # Call the menu event
+            on_resize()
 
         # Draw the menu
         surface.fill((25, 0, 50))
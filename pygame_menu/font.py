@@ -36,8 +36,12 @@ __all__ = [
     "get_font",
     "load_font_file",
     "load_system_font",
+    "measure_text",
 ]
 
+import threading
+import unicodedata
+import weakref
 from pathlib import Path
 from typing import Any, Union
 
@@ -89,8 +93,16 @@ FONT_EXAMPLES = (
 FontType = Union[str, __font.Font, Path]
 FontInstance = (str, __font.Font, Path)
 
-# Stores font cache
+# Stores font cache. Fonts may be loaded from the AssetLoader threads, thus, the
+# cache is only accessed while holding the lock
 _cache: dict[tuple[FontType, int], __font.Font] = {}
+_cache_lock = threading.Lock()
+
+# Stores if the glyph metrics of each font (and style) reproduce the rendered text size
+_measure_calibration: weakref.WeakKeyDictionary[
+    __font.Font, tuple[tuple[bool, bool, bool, bool], bool]
+] = weakref.WeakKeyDictionary()
+_MEASURE_CALIBRATION_TEXTS = ("", "Ag", "Hello world")
 
 
 def assert_font(font: Any) -> None:
@@ -151,15 +163,16 @@ def load_font_file(path: str | Path, size: int) -> __font.Font:
         raise OSError(f'font file "{font_path}" does not exist')
 
     key = (font_path.as_posix(), size)
-    if key in _cache:
-        return _cache[key]
+    with _cache_lock:
+        if key in _cache:
+            return _cache[key]
 
-    try:
-        font = __font.Font(font_path.as_posix(), size)
-    except OSError:
-        raise OSError(f'font file "{font_path}" cannot be loaded')
+        try:
+            font = __font.Font(font_path.as_posix(), size)
+        except OSError:
+            raise OSError(f'font file "{font_path}" cannot be loaded')
 
-    _cache[key] = font
+        _cache[key] = font
     return font
 
 
@@ -204,13 +217,70 @@ def load_system_font(name: str, size: int) -> __font.Font:
         )
 
     key = (matched, size)
-    if key in _cache:
-        return _cache[key]
+    with _cache_lock:
+        if key in _cache:
+            return _cache[key]
 
-    try:
-        font = __font.Font(matched, size)
-    except OSError:
-        raise OSError(f'system font file "{matched}" cannot be loaded')
+        try:
+            font = __font.Font(matched, size)
+        except OSError:
+            raise OSError(f'system font file "{matched}" cannot be loaded')
 
-    _cache[key] = font
+        _cache[key] = font
     return font
+
+
+def _measure_text_metrics(font: __font.Font, text: str) -> tuple[int, int] | None:
+    """
+    Compute the rendered size of a text from the font glyph metrics.
+
+    :param font: Font object
+    :param text: Text to measure
+    :return: Text width and height in px, or ``None`` if the metrics are not enough
+    """
+    if text == "":
+        return font.size(text)
+    for c in text:
+        if unicodedata.combining(c) or unicodedata.category(c)[0] == "C":
+            return None
+    metrics = font.metrics(text)
+    if len(metrics) != len(text):
+        return None
+    ascent = font.get_ascent()
+    top, bottom = 0, font.get_height()
+    for glyph in metrics:
+        if glyph is None:
+            return None
+        top = min(top, ascent - glyph[3])
+        bottom = max(bottom, ascent - glyph[2])
+    return font.size(text)[0], max(bottom - top, font.get_linesize())
+
+
+def measure_text(font: __font.Font, text: str) -> tuple[int, int] | None:
+    """
+    Return the size of the surface that ``font.render(text)`` would create,
+    computed from the glyph metrics without rasterizing the text.
+
+    .. note::
+
+        The metrics of each font are validated against a real render the first
+        time the font (or its style) is measured. If the size cannot be computed
+        exactly (for example, missing glyphs, or combining characters) this
+        method returns ``None``, and the text must be rendered to know its size.
+
+    :param font: Font object
+    :param text: Text to measure
+    :return: Text width and height in px, or ``None`` if it cannot be measured
+    """
+    style = (font.bold, font.italic, font.underline, font.strikethrough)
+    calibration = _measure_calibration.get(font)
+    if calibration is None or calibration[0] != style:
+        calibration = style, all(
+            _measure_text_metrics(font, t)
+            == font.render(t, True, (0, 0, 0)).get_size()
+            for t in _MEASURE_CALIBRATION_TEXTS
+        )
+        _measure_calibration[font] = calibration
+    if not calibration[1]:
+        return None
+    return _measure_text_metrics(font, text)
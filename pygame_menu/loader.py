@@ -0,0 +1,151 @@
+"""
+pygame-menu
+https://github.com/ppizarror/pygame-menu
+
+LOADER
+Background asset loader for images, sounds and fonts.
+"""
+
+from __future__ import annotations
+
+__all__ = ["AssetLoader"]
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from io import BytesIO
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pygame
+from pygame import mixer
+
+from pygame_menu.baseimage import BaseImage
+from pygame_menu.font import FontType, assert_font, get_font
+from pygame_menu.utils import load_pygame_image_file
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class AssetLoader:
+    """
+    Loads images, sounds and fonts on a background thread pool. Each ``load_*``
+    method returns a :py:class:`concurrent.futures.Future`, so building a menu
+    does not stall while the assets are decoded.
+
+    .. code-block:: python
+
+        loader = pygame_menu.loader.AssetLoader()
+        theme.background_color = loader.image(pygame_menu.baseimage.IMAGE_EXAMPLE_WALLPAPER)
+        loader.load_font(pygame_menu.font.FONT_OPEN_SANS, 30)
+        sound.load_example_sounds(loader=loader)
+
+    .. note::
+
+        Pending images are drawn by the Menu once their load has finished; until
+        then a placeholder is used. See :py:class:`pygame_menu.baseimage.BaseImage`.
+
+    .. note::
+
+        Loaded surfaces are not converted to the display format, as that must be
+        done from the main thread. See
+        :py:func:`pygame_menu.utils.configure_display_optimization`.
+
+    :param max_workers: Maximum number of worker threads. If ``None`` uses the :py:class:`concurrent.futures.ThreadPoolExecutor` default
+    """
+
+    _executor: ThreadPoolExecutor
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        assert isinstance(max_workers, (int, type(None)))
+        if max_workers is not None:
+            assert max_workers > 0, "max workers must be greater than zero"
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="pygame-menu-loader"
+        )
+
+    def __enter__(self) -> AssetLoader:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.shutdown()
+
+    def load_image(self, image_path: str | Path | BytesIO) -> Future:
+        """
+        Load an image in the background.
+
+        :param image_path: Path of the image file, or :py:class:`io.BytesIO` object
+        :return: Future that resolves to a :py:class:`pygame.Surface`
+        """
+        assert isinstance(image_path, (str, Path, BytesIO))
+        if not isinstance(image_path, BytesIO):
+            image_path = str(image_path)
+            assert Path(image_path).is_file(), (
+                f"file {image_path} does not exist or could not be found"
+            )
+        return self._executor.submit(load_pygame_image_file, image_path)
+
+    def image(
+        self,
+        image_path: str | Path | BytesIO,
+        placeholder: pygame.Surface | None = None,
+        **kwargs,
+    ) -> BaseImage:
+        """
+        Load an image in the background and return a pending
+        :py:class:`pygame_menu.baseimage.BaseImage`, which uses the placeholder
+        until the load has finished.
+
+        :param image_path: Path of the image file, or :py:class:`io.BytesIO` object
+        :param placeholder: Surface used while the image is being loaded
+        :param kwargs: Optional keyword arguments passed to :py:class:`pygame_menu.baseimage.BaseImage`
+        :return: Pending image
+        """
+        return BaseImage(self.load_image(image_path), placeholder=placeholder, **kwargs)
+
+    def load_sound(self, sound_file: str | Path) -> Future:
+        """
+        Load a sound in the background. The mixer must be initialized.
+
+        :param sound_file: Path of the sound file
+        :return: Future that resolves to a :py:class:`pygame.mixer.Sound`
+        """
+        assert isinstance(sound_file, (str, Path))
+        sound_path = Path(sound_file)
+        if not sound_path.is_file():
+            raise OSError(f'sound file "{sound_path}" does not exist')
+        return self._executor.submit(mixer.Sound, file=str(sound_path))
+
+    def load_font(self, name: FontType, size: int) -> Future:
+        """
+        Load a font in the background. The font is stored in the font cache,
+        thus, later :py:func:`pygame_menu.font.get_font` calls (for example, from
+        the widgets) return it without opening the file again.
+
+        :param name: Font name or path
+        :param size: Font size in px
+        :return: Future that resolves to a :py:class:`pygame.font.Font`
+        """
+        assert_font(name)
+        assert isinstance(size, int)
+        return self._executor.submit(get_font, name, size)
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """
+        Run a custom loading function in the background.
+
+        :param fn: Function
+        :param args: Function arguments
+        :param kwargs: Function keyword arguments
+        :return: Future that resolves to the function result
+        """
+        assert callable(fn)
+        return self._executor.submit(fn, *args, **kwargs)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Shut down the loader. Pending loads are finished, but new ones cannot
+        be scheduled.
+
+        :param wait: Wait until all pending loads have finished
+        """
+        self._executor.shutdown(wait=wait)
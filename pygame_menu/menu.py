@@ -11,10 +11,17 @@ from __future__ import annotations
 
 __all__ = ["Menu"]
 
+import asyncio
+import inspect
 import math
 import os
 import sys
 import time
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import partial
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import pygame
@@ -23,6 +30,7 @@ import pygame.gfxdraw as gfxdraw
 import pygame_menu.events as _events
 from pygame_menu._base import Base
 from pygame_menu._decorator import Decorator
+from pygame_menu._layout import export_layout, load_layout
 from pygame_menu._scrollarea import ScrollArea, get_scrollbars_from_position
 
 # Import types
@@ -38,6 +46,7 @@ from pygame_menu._types import (
     NumberType,
     Tuple2BoolType,
     Tuple2IntType,
+    Tuple3IntType,
     Tuple4Tuple2IntType,
     Vector2BoolType,
     Vector2IntType,
@@ -46,6 +55,7 @@ from pygame_menu._types import (
     VectorType,
 )
 from pygame_menu._widgetmanager import WidgetManager
+from pygame_menu.baseimage import _resolve_pending_images
 from pygame_menu.controls import Controller
 from pygame_menu.locals import (
     ALIGN_CENTER,
@@ -57,22 +67,28 @@ from pygame_menu.locals import (
     ORIENTATION_HORIZONTAL,
     ORIENTATION_VERTICAL,
 )
-from pygame_menu.sound import Sound
-from pygame_menu.themes import THEME_DEFAULT, Theme
+from pygame_menu.sound import Sound, _flush_scheduled_sounds
+from pygame_menu.themes import Theme
 from pygame_menu.utils import (
+    _MENU_RETENTION_BUDGET,
     assert_vector,
     check_key_pressed_valid,
     get_finger_pos,
     make_surface,
     mouse_motion_current_mouse_position,
     print_menu_widget_structure,
+    release_surface,
     warn,
 )
-from pygame_menu.widgets import Frame, MenuBar, Widget
-from pygame_menu.widgets.core.widget import WIDGET_MOUSEOVER, check_widget_mouseleave
+from pygame_menu.widgets import Frame, Image, MenuBar, Widget
+from pygame_menu.widgets.core.widget import (
+    _SELECTION_VERSION,
+    WIDGET_MOUSEOVER,
+    check_widget_mouseleave,
+)
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Generator
 
 # Joy events
 JOY_EVENT_LEFT = 1
@@ -92,6 +108,26 @@ SELECT_RESET = "reset"
 SELECT_TOUCH = "touch"
 SELECT_WIDGET = "widget"
 
+# Version of the menu trees, increased each time a widget or submenu is added or
+# removed from any Menu. It invalidates the cached tree indices
+_TREE_VERSION: list[int] = [0]
+
+# Version of the input data, increased each time a tracked widget changes its
+# value. It invalidates the cached recursive input data
+_INPUT_DATA_VERSION: list[int] = [0]
+
+# Theme shared by the menus created without a theme, copied from the default
+# theme on first use
+_DEFAULT_THEME: list[Theme | None] = [None]
+
+# Inactive menus which retain their widget surface, sorted from the least to the
+# most recently displayed. Each item stores the Menu reference and the surface
+# size in bytes. See pygame_menu.utils.configure_menu_retention
+_RETAINED_MENUS: OrderedDict[int, tuple[weakref.ref[Menu], int]] = OrderedDict()
+
+# Color of the widgets not rendered yet by the incremental render
+_PLACEHOLDER_COLOR = (128, 128, 128, 48)
+
 
 class Menu(Base):
     """
@@ -134,12 +170,13 @@ class Menu(Base):
     :param rows: Number of rows of each column, if there's only 1 column ``None`` can be used for no-limit. Also, a tuple can be provided for defining different number of rows for each column, for example ``rows=10`` (each column can have a maximum 10 widgets), or ``rows=[2, 3, 5]`` (first column has 2 widgets, second 3, and third 5)
     :param screen_dimension: List/Tuple representing the dimensions the Menu should reference for sizing/positioning (width, height), if ``None`` pygame is queried for the display mode. This value defines the ``window_size`` of the Menu
     :param surface: The surface that contains the Menu. By default, the Menu always considers that it is drawn on a surface that uses all window width/height. However, if a sub-surface is used the ``surface`` value will be used instead to retrieve the offset. Also, if ``surface`` is provided the menu can be drawn without providing a surface object while calling ``Menu.draw()``
-    :param theme: Menu theme
+    :param theme: Menu theme. If ``None`` uses a copy of :py:data:`pygame_menu.themes.THEME_DEFAULT`
     :param touchscreen: Enable/disable touch action inside the Menu. Only available on pygame 2
     :param touchscreen_motion_selection: Select widgets using touchscreen motion. If ``True`` menu draws a ``focus`` on the selected widget
     :param verbose: Enable/disable verbose mode (warnings/errors). Propagates to all widgets
     """
 
+    _async_tasks: list[asyncio.Future] | None
     _auto_centering: bool
     _background_function: tuple[bool, Callable[[Menu], Any] | CallableNoArgsType | None]
     _clock: pygame.time.Clock
@@ -151,13 +188,23 @@ class Menu(Base):
     _columns: int
     _ctrl: Controller
     _current: Menu
-    _decorator: Decorator
+    _decorator: Decorator | None
     _disable_draw: bool
     _disable_exit: bool
     _disable_update: bool
     _enabled: bool
+    _focus_last: tuple[
+        Any,
+        dict[int, Tuple4Tuple2IntType] | None,
+        list[tuple[pygame.Surface, Tuple2IntType]],
+    ]
     _height: int
     _index: int
+    _input_data: dict[str, Any] | None  # Widget ID -> value, ordered as widgets
+    _input_data_delta: dict[Widget, None] | None  # Changed since the last delta
+    _input_data_dirty: set[Widget]  # Changed since the last snapshot
+    _input_data_tree: tuple[int, int, dict[str, Any]] | None
+    _input_data_values: dict[Widget, Any] | None  # None if not tracking
     _joy_event: int
     _joy_event_repeat: int
     _joy_event_timer: bool
@@ -166,7 +213,11 @@ class Menu(Base):
     _keyboard_ignore_nonphysical: bool
     _last_scroll_thickness: list[Tuple2IntType | int]
     _last_selected_type: str
+    _select_table: tuple[Tuple3IntType, dict[tuple[Any, ...], tuple[int, bool]]]
     _last_update_mode: list[str]
+    _layout_args: dict[str, Any]
+    _layout_calls: dict[str, tuple[str, tuple[Any, ...], dict[str, Any], list[str]]]
+    _layout_recording: bool
     _mainloop: bool
     _max_row_column_elements: int
     _menubar: MenuBar
@@ -186,11 +237,16 @@ class Menu(Base):
     _onwindowmouseleave: Callable[[Menu], Any] | CallableNoArgsType | None
     _onwindowmouseover: Callable[[Menu], Any] | CallableNoArgsType | None
     _overflow: Tuple2BoolType
+    _pending_resize: tuple[Any, ...] | None
     _position: Tuple2IntType
     _position_default: Tuple2IntType
     _position_relative: bool
     _prev: list[Menu | list[Menu]] | None
+    _prewarm: _MenuPrewarm | None
     _remember_selection: bool
+    _render_budget: NumberType | None
+    _pending_widgets: list[Widget]
+    _rendered_widgets: set[str]
     _runtime_errors: _MenuRuntimeErrorConfig
     _scrollarea: ScrollArea
     _scrollarea_margin: list[int]
@@ -204,6 +260,7 @@ class Menu(Base):
     _touchscreen: bool
     _touchscreen_motion_selection: bool
     _translate: Tuple2IntType
+    _tree_index: tuple[int, tuple[Menu, ...], dict[str, Widget]] | None
     _update_frames: list[
         Frame
     ]  # Stores the reference of scrollable frames to check inputs
@@ -218,6 +275,7 @@ class Menu(Base):
     _widget_surface_cache_enabled: bool
     _widget_surface_cache_need_update: bool
     _widgets: list[Widget]
+    _widgets_index: dict[str, Widget]  # Widget ID -> Widget
     _widgets_surface: pygame.Surface | None
     _widgets_surface_last: tuple[int, int, pygame.Surface | None]
     _widgets_surface_need_update: bool
@@ -258,13 +316,18 @@ class Menu(Base):
         rows: MenuRowsType = None,
         screen_dimension: Vector2IntType | None = None,
         surface: pygame.Surface | None = None,
-        theme: Theme = THEME_DEFAULT.copy(),
+        theme: Theme | None = None,
         touchscreen: bool = False,
         touchscreen_motion_selection: bool = False,
         verbose: bool = True,
     ) -> None:
         super().__init__(object_id=menu_id, verbose=verbose)
 
+        # Arguments used to restore the Menu from its layout
+        self._layout_args = {
+            k: v for k, v in locals().items() if k not in ("__class__", "self")
+        }
+
         assert isinstance(center_content, bool)
         assert isinstance(
             column_max_width, (VectorInstance, type(None), NumberInstance)
@@ -282,6 +345,12 @@ class Menu(Base):
         assert isinstance(remember_selection, bool)
         assert isinstance(rows, (int, type(None), VectorInstance))
         assert isinstance(surface, (pygame.Surface, type(None)))
+        if theme is None:
+            if _DEFAULT_THEME[0] is None:
+                from pygame_menu.themes import THEME_DEFAULT
+
+                _DEFAULT_THEME[0] = THEME_DEFAULT.copy()
+            theme = _DEFAULT_THEME[0]
         assert isinstance(theme, Theme), (
             "theme bust be a pygame_menu.themes.Theme object instance"
         )
@@ -439,7 +508,7 @@ class Menu(Base):
             None,
         )  # Accept menu as argument, callable object
         self._clock = pygame.time.Clock()
-        self._decorator = Decorator(self, verbose=verbose)  # type: ignore
+        self._decorator = None  # Created by get_decorator()
         self._enabled = (
             enabled  # Menu is enabled or not. If disabled menu can't update or draw
         )
@@ -451,9 +520,15 @@ class Menu(Base):
             0,
         ]  # scroll and the number of recursive states
         self._last_selected_type = ""  # Last type selection, used for test purposes
+        self._select_table = ((-1, -1, -1), {})  # Resolved selection indices
+        self._async_tasks = None  # Pending callback tasks, only within run_async
         self._mainloop = False  # Menu is in mainloop state
         self._onclose = None  # Function or event called on Menu close
         self._remember_selection = remember_selection
+        self._prewarm = None  # Pending prewarm work
+        self._render_budget = None  # Incremental render time budget (ms) per frame
+        self._pending_widgets = []  # Widgets not drawn yet (incremental)
+        self._rendered_widgets = set()  # Widgets drawn at least once (incremental)
         self._render_enabled = True
         self._sound = Sound(verbose=verbose)
         self._stats = _MenuStats()
@@ -492,8 +567,19 @@ class Menu(Base):
         # Menu widgets, it should not be accessed outside the object as strange
         # issues can occur
         self.add = WidgetManager(self, verbose=verbose)
+        self._layout_calls = {}  # Widget addition calls by widget ID (layout export)
+        self._layout_recording = False
         self._widget_selected_update = True  # If True, the selected widget receives the updates, if False, the events only are passed to the Menu
         self._widgets = []  # This list may change during execution (replaced by a new one)
+        self._widgets_index = {}
+        self._tree_index = None
+
+        # Input data snapshot, updated only from the widgets which changed value
+        self._input_data = None
+        self._input_data_delta = None
+        self._input_data_dirty = set()
+        self._input_data_tree = None
+        self._input_data_values = None
 
         # Stores the frames which receive update events, updated and managed only
         # by the Frame class
@@ -508,6 +594,11 @@ class Menu(Base):
         self._widgets_surface_need_update = False
         self._widgets_surface_last = (0, 0, None)
 
+        # Stores the last focus key, the focus region, and the prerendered areas,
+        # these are rebuilt only if the focused widget, its rect, or the scroll
+        # offsets change
+        self._focus_last = (None, None, [])
+
         # Precache widgets surface draw, this method dramatically increases the
         # performance of the menu rendering
         self._widget_surface_cache_enabled = True
@@ -546,6 +637,7 @@ class Menu(Base):
         self._translate = (0, 0)
 
         # Set the size
+        self._pending_resize = None
         self.resize(width=width, height=height, screen_dimension=screen_dimension)
 
         # Setups controller
@@ -708,7 +800,7 @@ class Menu(Base):
         :param height: Menu height (px)
         :param screen_dimension: List/Tuple representing the dimensions the Menu should reference for sizing/positioning (width, height), if ``None`` pygame is queried for the display mode. This value defines the ``window_size`` of the Menu
         :param position: Position on x-axis and y-axis. If the value is only 2 elements, the position is relative to the window width (thus, values must be 0-100%); else, the third element defines if the position is relative or not. If ``(x, y, False)`` the values of ``(x, y)`` are in px. If ``None`` use the default from the menu constructor
-        :param recursive: If true, resize all submenus in a recursive fashion
+        :param recursive: If true, resize all submenus in a recursive fashion. The submenus which are not displayed apply the new size once they are opened
         :return: Self reference
         """
         assert isinstance(width, NumberInstance)
@@ -717,11 +809,17 @@ class Menu(Base):
             "menu width and height must be greater than zero"
         )
         assert isinstance(recursive, bool)
+        self._pending_resize = None
 
-        # Resize recursively
+        # Resize recursively. Submenus which are not displayed apply the new size
+        # once they become the current Menu, thus, successive resizes (for example,
+        # while dragging the window border) only update the displayed Menu
         if recursive:
             for menu in self.get_submenus(True):
-                menu.resize(width, height, screen_dimension, position)
+                if menu == self._top._current:
+                    menu.resize(width, height, screen_dimension, position)
+                else:
+                    menu._pending_resize = (width, height, screen_dimension, position)
 
         # Convert to int
         width, height = int(width), int(height)
@@ -892,7 +990,35 @@ class Menu(Base):
         :return: Self reference
         """
         self._current._widget_surface_cache_need_update = True
-        self._current._decorator.force_cache_update()
+        for decorator in (
+            self._current._decorator,
+            self._current._scrollarea._decorator,
+        ):
+            if decorator is not None:
+                decorator.force_cache_update()
+        return self
+
+    def set_incremental_render(self, budget_ms: NumberType | None = 8) -> Menu:
+        """
+        Set the incremental render mode. If enabled, the widgets which have not
+        been drawn yet are rendered within a time budget on each frame, starting
+        with the widgets within the visible area; the remaining widgets are drawn
+        as placeholder rects with their measured size until rendered. Useful for
+        menus with many widgets.
+
+        .. note::
+
+            This is applied only to the base Menu (not the currently displayed,
+            stored in ``_current`` pointer); for such behavior apply to
+            :py:meth:`pygame_menu.menu.Menu.get_current` object.
+
+        :param budget_ms: Time budget per frame in ms. If ``None`` the incremental render is disabled
+        :return: Self reference
+        """
+        assert isinstance(budget_ms, (NumberInstance, type(None)))
+        if budget_ms is not None:
+            assert budget_ms > 0, "budget must be greater than zero"
+        self._render_budget = budget_ms
         return self
 
     def set_onbeforeopen(
@@ -1176,6 +1302,8 @@ class Menu(Base):
 
         :return: Position on x-axis and y-axis (x,y) in px
         """
+        if self._pending_resize is not None:
+            self._apply_pending_resize()
         return self._position[0] + self._translate[0], self._position[
             1
         ] + self._translate[1]
@@ -1256,6 +1384,11 @@ class Menu(Base):
                 "with menu.get_current().remove_widget(widget)"
             )
         self._widgets.pop(index)
+        del self._widgets_index[widget.get_id()]
+        self._layout_calls.pop(widget.get_id(), None)
+        self._rendered_widgets.discard(widget.get_id())
+        _TREE_VERSION[0] += 1
+        self._input_data_remove_widget(widget)
         self._update_after_remove_or_hidden(index)  # Forces surface update
         self._stats.removed_widgets += 1
 
@@ -1354,7 +1487,17 @@ class Menu(Base):
     def _update_widget_position(self) -> None:
         """
         Update the position of each widget. Also checks widget consistency.
+
+        .. note::
+
+            If the render is disabled the update is deferred to the next render,
+            thus, a batch of changes runs the layout only once.
         """
+        self._select_table = self._select_table[0], {}
+        if not self._render_enabled:
+            self._widgets_surface_need_update = True
+            return
+
         # Column widgets
         self._widget_columns = {}
         for i in range(self._columns):
@@ -1448,7 +1591,7 @@ class Menu(Base):
 
             column_widths[col] = max(
                 column_widths[col],
-                widget.get_width(apply_selection=True),  # This forces rendering
+                widget.measure(apply_selection=True)[0],  # Does not render if possible
             )
 
         if len(invalid_selection_widgets) > 0:
@@ -1578,21 +1721,21 @@ class Menu(Base):
         max_x, max_y = -1e8, -1e8
         min_x, min_y = 1e8, 1e8
 
-        # Cache rects
-        rects_cache: dict[str, pygame.Rect] = {}
+        # Cache sizes
+        sizes_cache: dict[str, Tuple2IntType] = {}
 
-        def get_rect(wid: Widget) -> pygame.Rect:
+        def get_size(wid: Widget) -> Tuple2IntType:
             """
-            Get rect cache from widget.
+            Get the measured size cache from widget.
 
             :param wid: Widget
-            :return: Rect cache
+            :return: Size cache (width, height)
             """
             try:
-                return rects_cache[wid.get_id()]
+                return sizes_cache[wid.get_id()]
             except KeyError:
-                rects_cache[wid.get_id()] = wid.get_rect(render=True)
-            return rects_cache[wid.get_id()]
+                sizes_cache[wid.get_id()] = wid.measure()
+            return sizes_cache[wid.get_id()]
 
         # Get menubar height, if fixed then move all widgets within area
         menubar_height = self._menubar.get_height() if self._menubar.fixed else 0
@@ -1605,7 +1748,6 @@ class Menu(Base):
             margin = widget.get_margin()
             padding = widget.get_padding()
             selection_effect_margin = widget.get_selection_effect().get_margin()
-            width = get_rect(widget).width
 
             if not widget.is_visible():
                 widget.set_position(0, 0)
@@ -1619,6 +1761,7 @@ class Menu(Base):
 
             # Get column and row position
             col, row, _ = widget.get_col_row_index()
+            width = get_size(widget)[0]
 
             # Calculate X position
             column_width = self._column_widths[col]
@@ -1658,7 +1801,7 @@ class Menu(Base):
                     and not r_widget.is_floating()
                     and not r_widget.get_frame() is not None
                 ):
-                    y_sum += get_rect(r_widget).height  # Height
+                    y_sum += get_size(r_widget)[1]  # Height
                     y_sum += r_widget.get_margin()[1]  # Vertical margin (bottom)
 
                     # If no widget is before add the selection effect
@@ -1699,7 +1842,7 @@ class Menu(Base):
                 max_x, x_coord + width - padding[1] + tx + sm_right
             )  # minus right padding
             max_y = max(
-                max_y, y_coord + get_rect(widget).height - padding[2] + ty
+                max_y, y_coord + get_size(widget)[1] - padding[2] + ty
             )  # minus bottom padding
             min_x = min(min_x, x_coord - padding[3] - sm_left)
             min_y = min(min_y, y_coord - padding[0])
@@ -1811,6 +1954,17 @@ class Menu(Base):
         self._stats.total_building_time += dt
         self._stats.last_build_surface_time = dt
 
+    def _release_widget_surface(self) -> None:
+        """
+        Release the widget surface, it is built again on the next render.
+        """
+        surface = self._widgets_surface_last[2]
+        self._widgets_surface = None
+        self._widgets_surface_last = (0, 0, None)
+        self._scrollarea.set_world(None)
+        release_surface(surface)
+        self._stats.release_surface += 1
+
     def _check_id_duplicated(self, widget_id: str) -> None:
         """
         Check if widget ID is duplicated. Throws ``IndexError`` if the index is
@@ -1819,11 +1973,47 @@ class Menu(Base):
         :param widget_id: New widget ID
         """
         assert isinstance(widget_id, str)
-        for widget in self._widgets:
-            if widget.get_id() == widget_id:
-                raise IndexError(
-                    f'widget id "{widget_id}" already exists on the current menu ({widget.get_class_id()})'
-                )
+        widget = self._widgets_index.get(widget_id)
+        if widget is not None:
+            raise IndexError(
+                f'widget id "{widget_id}" already exists on the current menu ({widget.get_class_id()})'
+            )
+
+    def _get_tree_index(self) -> tuple[tuple[Menu, ...], dict[str, Widget]]:
+        """
+        Return the recursive submenus and the widget ID index of the Menu tree.
+        Both are cached until any Menu adds or removes a widget or submenu.
+
+        .. note::
+
+            Widget IDs are unique within a Menu but not within the tree; the
+            index stores the first widget found by a depth-first search, that
+            is, the Menu widgets take precedence over the submenus.
+
+        :return: Recursive submenus tuple, and widget ID index
+        """
+        if self._tree_index is not None and self._tree_index[0] == _TREE_VERSION[0]:
+            return self._tree_index[1], self._tree_index[2]
+
+        cache: dict[Menu, tuple[dict[Menu, None], dict[str, Widget]]] = {}
+
+        def build(menu: Menu) -> tuple[dict[Menu, None], dict[str, Widget]]:
+            if menu in cache:
+                return cache[menu]
+            submenus = dict.fromkeys(menu._submenus)
+            index = dict(menu._widgets_index)
+            cache[menu] = submenus, index  # Stops cycles
+            for sm in menu._submenus:
+                sm_submenus, sm_index = build(sm)
+                for m in sm_submenus:
+                    submenus.setdefault(m)
+                for widget_id, widget in sm_index.items():
+                    index.setdefault(widget_id, widget)
+            return submenus, index
+
+        tree_submenus, tree_index = build(self)
+        self._tree_index = (_TREE_VERSION[0], tuple(tree_submenus), tree_index)
+        return self._tree_index[1], self._tree_index[2]
 
     # noinspection PyCallingNonCallable
     def _close(self) -> bool:
@@ -2042,6 +2232,8 @@ class Menu(Base):
         :param border: If ``True``, add the mmenu border width. Only applied if both ``inner`` and ``widget`` are ``False``
         :return: Width in px
         """
+        if self._pending_resize is not None:
+            self._apply_pending_resize()
         if widget:
             return int(self._widget_max_position[0] - self._widget_min_position[0])
         elif not inner:
@@ -2066,6 +2258,8 @@ class Menu(Base):
         :param border: If ``True`` add the menu border height. Only applied if both ``inner`` and ``widget`` are ``False``
         :return: Height in px
         """
+        if self._pending_resize is not None:
+            self._apply_pending_resize()
         if widget:
             return int(self._widget_max_position[1] - self._widget_min_position[1])
         elif not inner:
@@ -2127,6 +2321,8 @@ class Menu(Base):
         """
         if not self._render_enabled:
             return False  # Modify using Menu.disable_render() and Menu.enable_render()
+        if self._pending_resize is not None:
+            self._apply_pending_resize()
         t0: float = time.time()
         changed: bool = False
 
@@ -2144,6 +2340,14 @@ class Menu(Base):
         self._stats.total_rendering_time += time.time() - t0
         return changed
 
+    def _apply_pending_resize(self) -> None:
+        """
+        Apply the size requested by a recursive resize of a parent Menu, which is
+        deferred until the Menu is displayed.
+        """
+        width, height, screen_dimension, position = self._pending_resize
+        self.resize(width, height, screen_dimension, position)
+
     def disable_render(self) -> Menu:
         """
         Disable the render of the Menu. Useful to improve performance when
@@ -2208,6 +2412,17 @@ class Menu(Base):
         elif self._current._disable_draw:
             return self._current
 
+        # Swap in the images loaded in the background. Widgets are rendered
+        # before the menu so the layout accounts for the new sizes
+        resolved_images = _resolve_pending_images()
+        if resolved_images:
+            for widget in self._current._widgets:
+                if isinstance(widget, Image) and any(
+                    widget.get_image() is image for image in resolved_images
+                ):
+                    widget._render()
+            self._current._widget_surface_cache_need_update = True
+
         # Render menu; if True, the surface widget has changed, thus cache should
         # change if enabled
         render = self._current._render()
@@ -2231,7 +2446,9 @@ class Menu(Base):
                 self._top._background_function[1]()
 
         # Draw the prev decorator
-        self._current._decorator.draw_prev(surface)
+        menu_decorator = self._current._decorator
+        if menu_decorator is not None:
+            menu_decorator.draw_prev(surface)
 
         # Draw widgets, update cache if enabled
         if (
@@ -2248,37 +2465,65 @@ class Menu(Base):
             self._current._widgets_surface.fill((255, 255, 255, 0))
 
             # Call scrollarea draw decorator. This must be done before filling the
-            # surface. ScrollArea post decorator is drawn on _scroll.draw(surface) call
-            scrollarea_decorator = self._current._scrollarea.get_decorator()
-            scrollarea_decorator.force_cache_update()
-            scrollarea_decorator.draw_prev(self._current._widgets_surface)
+            # surface. ScrollArea post decorator is drawn on _scroll.draw(surface) call.
+            # The decorator cache is updated if the decorations or the surface change
+            scrollarea_decorator = self._current._scrollarea._decorator
+            if scrollarea_decorator is not None:
+                scrollarea_decorator.draw_prev(self._current._widgets_surface)
 
             # Iterate through widgets and draw them
             selected_widget_draw: tuple[Widget | None, pygame.Surface | None] = (
                 None,
                 None,
             )
+            incremental = self._current._render_budget is not None
+            pending: list[Widget] = []
 
             for widget in self._current._widgets:
                 # Widgets within frames are not drawn as it's frame draw these widgets
                 if widget.get_frame() is not None:
                     continue
+                elif (
+                    incremental
+                    and widget.get_id() not in self._current._rendered_widgets
+                    and widget.is_visible()
+                ):
+                    pending.append(widget)
+                    continue
                 elif widget.is_selected():
                     selected_widget_draw = widget, self._current._widgets_surface
                 widget.draw(self._current._widgets_surface)
 
+            self._current._pending_widgets = pending
+            if pending and self._current._draw_pending_widgets():
+                selected_widget_draw = (
+                    self._current.get_selected_widget(),
+                    self._current._widgets_surface,
+                )
+
             if selected_widget_draw[0] is not None:
                 selected_widget_draw[0].draw_after_if_selected(selected_widget_draw[1])
 
             self._current._stats.draw_update_cached += 1
 
+        # Draw the widgets left by the incremental render over the kept surface
+        elif self._current._pending_widgets:
+            if self._current._draw_pending_widgets():
+                self._current.get_selected_widget().draw_after_if_selected(
+                    self._current._widgets_surface
+                )
+
         self._current._scrollarea.draw(surface)
+        if self._current._pending_widgets:
+            self._current._draw_placeholders(surface)
         self._current._menubar.draw(surface)
 
         # Draw focus on selected if the widget is active
         self._current._draw_focus_widget(surface, self._current.get_selected_widget())
-        self._current._decorator.draw_post(surface)
+        if menu_decorator is not None:
+            menu_decorator.draw_post(surface)
         self._current._stats.draw += 1
+        _flush_scheduled_sounds()
 
         # Update cursor if not mainloop
         if self._current._mainloop:
@@ -2286,6 +2531,56 @@ class Menu(Base):
 
         return self._current
 
+    def _draw_pending_widgets(self) -> bool:
+        """
+        Draw the widgets not drawn yet within the incremental render time budget,
+        starting with the widgets within the visible area. The widgets surface
+        is kept between frames, thus, only the new widgets are drawn (and
+        rendered, if changed) on each frame.
+
+        :return: ``True`` if the selected widget has been drawn
+        """
+        ox, oy = self._scrollarea.get_offsets()
+        view_rect = self._scrollarea.get_view_rect()
+        view = pygame.Rect(ox, oy, view_rect.width, view_rect.height)
+        pending = [
+            w
+            for w in self._pending_widgets
+            if w.get_menu() is self and w.get_frame() is None and w.is_visible()
+        ]
+        pending.sort(key=lambda w: not view.colliderect(w.get_rect()))
+
+        # At least one widget is drawn on each frame
+        deadline = None
+        if self._render_budget is not None:
+            deadline = time.perf_counter() + self._render_budget / 1000
+        selected_drawn = False
+        drawn = 0
+        for widget in pending:
+            if drawn > 0 and deadline is not None and time.perf_counter() >= deadline:
+                break
+            widget.draw(self._widgets_surface)
+            self._rendered_widgets.add(widget.get_id())
+            selected_drawn = selected_drawn or widget.is_selected()
+            drawn += 1
+
+        # Continue on the next frame
+        self._pending_widgets = pending[drawn:]
+        self._stats.render_backlog = len(self._pending_widgets)
+        return selected_drawn
+
+    def _draw_placeholders(self, surface: pygame.Surface) -> None:
+        """
+        Draw the placeholder rects of the widgets not drawn yet, only those
+        within the visible area.
+
+        :param surface: Pygame surface to draw the Menu
+        """
+        for widget in self._pending_widgets:
+            rect = self._scrollarea.to_real_position(widget.get_rect(), visible=True)
+            if rect.width > 0 and rect.height > 0:
+                gfxdraw.box(surface, rect, _PLACEHOLDER_COLOR)
+
     def _draw_focus_widget(
         self, surface: pygame.Surface, widget: Widget | None, force: bool = False
     ) -> dict[int, Tuple4Tuple2IntType] | None:
@@ -2324,6 +2619,24 @@ class Menu(Base):
         if rect.width == 0 or rect.height == 0:
             return None
 
+        # The focus rect is in real coordinates, thus, it changes if the scroll
+        # offsets change. If the key is the same, blit the prerendered areas
+        focus_key = (
+            widget,
+            rect.x,
+            rect.y,
+            rect.width,
+            rect.height,
+            window_width,
+            window_height,
+            self._theme.focus_background_color,
+        )
+        if self._focus_last[0] == focus_key:
+            for area_surface, area_pos in self._focus_last[2]:
+                surface.blit(area_surface, area_pos)
+            self._stats.draw_focus_cached += 1
+            return self._focus_last[1]
+
         x1, y1, x2, y2 = rect.topleft + rect.bottomright
         x1 = int(x1)
         y1 = int(y1)
@@ -2368,10 +2681,28 @@ class Menu(Base):
                 (0, window_height),
             )
 
+        # Prerender each area. The filled polygon covers the bounding box of the
+        # area coords, both limits included
+        areas: list[tuple[pygame.Surface, Tuple2IntType]] = []
         for area in coords:
-            gfxdraw.filled_polygon(
-                surface, coords[area], self._theme.focus_background_color
+            xs = [c[0] for c in coords[area]]
+            ys = [c[1] for c in coords[area]]
+            areas.append(
+                (
+                    make_surface(
+                        max(xs) - min(xs) + 1,
+                        max(ys) - min(ys) + 1,
+                        alpha=True,
+                        fill_color=self._theme.focus_background_color,
+                    ),
+                    (min(xs), min(ys)),
+                )
             )
+        self._focus_last = (focus_key, coords, areas)
+        self._stats.draw_focus += 1
+
+        for area_surface, area_pos in areas:
+            surface.blit(area_surface, area_pos)
         return coords
 
     def set_controller(
@@ -3212,6 +3543,9 @@ class Menu(Base):
         if not self.is_enabled():
             updated = True
 
+        # Play the sounds scheduled within the update
+        _flush_scheduled_sounds()
+
         return updated
 
     def collide(self, event: EventType) -> bool:
@@ -3275,6 +3609,152 @@ class Menu(Base):
         :param kwargs: Optional keyword arguments
         :return: Self reference **(current)**
         """
+        loop_args = self._start_loop(surface, bgfun, kwargs)
+        if loop_args is None:
+            return self._current
+        surface, clear_surface, disable_loop, fps_limit, wait_for_event = loop_args
+
+        # Start loop
+        while True:
+            self._current._stats.loop += 1
+            self._current._clock.tick(fps_limit)
+
+            # Draw the menu
+            self.draw(surface=surface, clear_surface=clear_surface)
+
+            # Gather events by Menu
+            if wait_for_event:
+                self.update([pygame.event.wait()])
+            if (not wait_for_event or pygame.event.peek()) and self.is_enabled():
+                self.update(pygame.event.get())
+
+            self._finish_loop_frame()
+
+            # Menu closed or disabled
+            if not self.is_enabled() or disable_loop:
+                self._stop_loop()
+                return self._current
+
+    async def run_async(
+        self,
+        surface: pygame.Surface | None = None,
+        bgfun: Callable[[Menu], Any] | CallableNoArgsType | None = None,
+        **kwargs,
+    ) -> Menu:
+        """
+        Asynchronous main loop of the **current** Menu. Same as
+        :py:meth:`pygame_menu.menu.Menu.mainloop`, but this coroutine waits for
+        the next frame and the events using :py:func:`asyncio.sleep`, thus, other
+        tasks of the event loop (networking, asset streaming, etc.) run between
+        frames.
+
+        .. code-block:: python
+
+            menu = pygame_menu.Menu(...)
+            asyncio.run(menu.run_async(surface))
+
+        If a widget ``onreturn`` or ``onchange`` callback is a coroutine function,
+        the coroutine is scheduled as a task of the event loop, thus, the menu
+        keeps drawing while the callback runs.
+
+        .. note::
+
+            If the Menu is closed or disabled, this method waits for the pending
+            callback tasks before returning. Exceptions raised by the callbacks
+            are propagated by this method.
+
+        kwargs (Optional)
+            - ``clear_surface``     (bool) – If ``True`` surface is cleared using ``theme.surface_clear_color``. Default equals to ``True``
+            - ``disable_loop``      (bool) – If ``True`` the loop only runs once. Use for running draw and update in a single call
+            - ``fps_limit``         (int) – Maximum FPS of the loop. Default equals to ``theme.fps``. If ``0`` there's no limit
+            - ``wait_for_event``    (bool) – Holds the loop until an event is provided or a callback task finishes, useful to save CPU power
+
+        .. warning::
+
+            This method should not be used along :py:meth:`pygame_menu.menu.Menu.get_current`,
+            for example, ``menu.get_current().run_async(...)``.
+
+        :param surface: Pygame surface to draw the Menu. If None, the Menu will use the provided ``surface`` from the constructor
+        :param bgfun: Background function called on each loop iteration before drawing the Menu
+        :param kwargs: Optional keyword arguments
+        :return: Self reference **(current)**
+        """
+        loop_args = self._start_loop(surface, bgfun, kwargs)
+        if loop_args is None:
+            return self._current
+        surface, clear_surface, disable_loop, fps_limit, wait_for_event = loop_args
+        if self._async_tasks is None:
+            self._async_tasks = []
+
+        loop = asyncio.get_running_loop()
+        frame_time = 0 if fps_limit == 0 else 1 / fps_limit
+        next_frame = loop.time()
+
+        try:
+            while True:
+                self._current._stats.loop += 1
+                self._current._clock.tick()
+
+                # Draw the menu
+                self.draw(surface=surface, clear_surface=clear_surface)
+
+                # Gather events by Menu, waiting does not block the event loop
+                if wait_for_event:
+                    while not pygame.event.peek() and not self._reap_async_tasks():
+                        await asyncio.sleep(frame_time or 0.01)
+                if self.is_enabled():
+                    self.update(pygame.event.get())
+
+                self._finish_loop_frame()
+
+                # Check the finished callbacks, this raises their exceptions
+                self._reap_async_tasks()
+
+                # Menu closed or disabled
+                if not self.is_enabled() or disable_loop:
+                    break
+
+                # Wait until the next frame deadline
+                next_frame += frame_time
+                delay = next_frame - loop.time()
+                if delay < 0:
+                    next_frame = loop.time()
+                    delay = 0
+                await asyncio.sleep(delay)
+
+                # The callback tasks may close the menu while waiting
+                if not self.is_enabled():
+                    break
+
+            # Closed menu waits for the pending callbacks
+            if not self.is_enabled():
+                while self._async_tasks:
+                    await asyncio.wait(self._async_tasks)
+                    self._reap_async_tasks()
+
+        finally:
+            self._stop_loop()
+            if not self._async_tasks:  # Pending tasks are checked on the next call
+                self._async_tasks = None
+
+        return self._current
+
+    def _start_loop(
+        self,
+        surface: pygame.Surface | None,
+        bgfun: Callable[[Menu], Any] | CallableNoArgsType | None,
+        kwargs: dict[str, Any],
+    ) -> tuple[pygame.Surface, bool, bool, NumberType, bool] | None:
+        """
+        Check the arguments of the main loop, and set the loop state of the
+        current Menu. Used by :py:meth:`pygame_menu.menu.Menu.mainloop` and
+        :py:meth:`pygame_menu.menu.Menu.run_async`.
+
+        :param surface: Pygame surface to draw the Menu. If None, the Menu uses the surface from the constructor
+        :param bgfun: Background function called on each loop iteration before drawing the Menu
+        :param kwargs: Main loop keyword arguments
+        :return: Surface, clear surface, disable loop, fps limit and wait for event. ``None`` if the Menu is not enabled
+        """
         # Unpack kwargs
         clear_surface = kwargs.get("clear_surface", True)
         disable_loop = kwargs.get("disable_loop", False)
@@ -3298,7 +3778,7 @@ class Menu(Base):
             self._current._runtime_errors.throw(
                 self._current._runtime_errors.mainloop, "menu is not enabled"
             )
-            return self._current
+            return None
 
         # Check background function
         bgfun_accept_menu = False
@@ -3319,28 +3799,53 @@ class Menu(Base):
         # Force rendering before loop
         self._current._widgets_surface = None
 
-        # Start loop
-        while True:
-            self._current._stats.loop += 1
-            self._current._clock.tick(fps_limit)
+        return surface, clear_surface, disable_loop, fps_limit, wait_for_event
 
-            # Draw the menu
-            self.draw(surface=surface, clear_surface=clear_surface)
+    def _finish_loop_frame(self) -> None:
+        """
+        Flip the display and continue the pending prewarm work, at the end of
+        each main loop frame.
+        """
+        pygame.display.flip()
+        if self._prewarm is not None:
+            self.prewarm(self._prewarm.recursive, self._prewarm.budget_ms)
 
-            # Gather events by Menu
-            if wait_for_event:
-                self.update([pygame.event.wait()])
-            if (not wait_for_event or pygame.event.peek()) and self.is_enabled():
-                self.update(pygame.event.get())
+    def _stop_loop(self) -> None:
+        """
+        Restore the loop state of the current Menu once the main loop finishes.
+        """
+        self._current._mainloop = False
+        check_widget_mouseleave(force=True)
 
-            # Flip contents to screen
-            pygame.display.flip()
+    def _schedule_async_callback(self, value: Any) -> Any:
+        """
+        Schedule an awaitable returned by a widget callback as a task of the
+        running event loop. This is only applied within
+        :py:meth:`pygame_menu.menu.Menu.run_async`.
 
-            # Menu closed or disabled
-            if not self.is_enabled() or disable_loop:
-                self._current._mainloop = False
-                check_widget_mouseleave(force=True)
-                return self._current
+        :param value: Callback return value
+        :return: The scheduled task, or the same value if the Menu is not running asynchronously
+        """
+        if self._top._async_tasks is None or not inspect.isawaitable(value):
+            return value
+        task = asyncio.ensure_future(value)
+        self._top._async_tasks.append(task)
+        return task
+
+    def _reap_async_tasks(self) -> bool:
+        """
+        Remove the finished callback tasks. If a task raised an exception, it's
+        raised again.
+
+        :return: ``True`` if any task has finished
+        """
+        if not self._async_tasks:
+            return False
+        done = [task for task in self._async_tasks if task.done()]
+        for task in done:
+            self._async_tasks.remove(task)
+            task.result()
+        return len(done) > 0
 
     def get_input_data(self, recursive: bool = False) -> dict[str, Any]:
         """
@@ -3358,7 +3863,16 @@ class Menu(Base):
         :return: Input dict e.g.: ``{'id1': value, 'id2': value, ...}``
         """
         assert isinstance(recursive, bool)
-        return self._get_input_data(recursive, depth=0)
+        if not recursive:
+            return dict(self._get_input_data_snapshot())
+        if (
+            self._input_data_tree is None
+            or self._input_data_tree[0] != _INPUT_DATA_VERSION[0]
+            or self._input_data_tree[1] != _TREE_VERSION[0]
+        ):
+            data = self._get_input_data(recursive, depth=0)
+            self._input_data_tree = (_INPUT_DATA_VERSION[0], _TREE_VERSION[0], data)
+        return dict(self._input_data_tree[2])
 
     def _get_input_data(self, recursive: bool, depth: int) -> dict[str, Any]:
         """
@@ -3371,30 +3885,142 @@ class Menu(Base):
         :param depth: Depth of the input data
         :return: Input dict e.g.: ``{'id1': value, 'id2': value, ...}``
         """
-        data = {}
-        for widget in self._widgets:
-            try:
-                data[widget.get_id()] = widget.get_value()
-            except ValueError:  # Widget does not return data
-                pass
+        data = dict(self._get_input_data_snapshot())
         if recursive:
             depth += 1
             for menu in self._submenus.keys():
                 data_submenu = menu._get_input_data(recursive=recursive, depth=depth)
 
                 # Check if there is a collision between keys
-                data_keys = data.keys()
-                sub_data_keys = data_submenu.keys()
-                for key in sub_data_keys:
-                    if key in data_keys:
-                        raise ValueError(
-                            f'collision between widget data ID="{key}" at depth={depth}'
-                        )
+                if not data.keys().isdisjoint(data_submenu.keys()):
+                    for key in data_submenu.keys():
+                        if key in data:
+                            raise ValueError(
+                                f'collision between widget data ID="{key}" at depth={depth}'
+                            )
 
                 # Update data
                 data.update(data_submenu)
         return data
 
+    def get_input_data_delta(self, recursive: bool = False) -> dict[str, Any]:
+        """
+        Return the input data of the widgets whose value changed since the last
+        call of this method. The first call returns all the input data. The
+        results are given as a dict object, the keys are the ID of each element.
+
+        .. note::
+
+            Changes are tracked from the widget ``change`` event, the user input,
+            and the ``set_value``/``reset_value`` methods. Widgets whose value
+            cannot be retrieved anymore are not reported.
+
+        .. note::
+
+            This is applied only to the base Menu (not the currently displayed),
+            for such behavior apply to :py:meth:`pygame_menu.menu.Menu.get_current` object.
+
+        :param recursive: Look in Menu and sub-menus
+        :return: Input dict e.g.: ``{'id1': value, 'id2': value, ...}``
+        """
+        assert isinstance(recursive, bool)
+        data = {}
+        menus = (self,) + (self.get_submenus(recursive=True) if recursive else ())
+        for menu in menus:
+            snapshot = menu._get_input_data_snapshot()
+            if menu._input_data_delta is None:
+                data_menu = dict(snapshot)
+                menu._input_data_delta = {}
+            else:
+                values = menu._input_data_values
+                data_menu = {
+                    w.get_id(): values[w]
+                    for w in menu._input_data_delta
+                    if w in values
+                }
+                menu._input_data_delta.clear()
+            if not data.keys().isdisjoint(data_menu.keys()):
+                for key in data_menu.keys():
+                    if key in data:
+                        raise ValueError(f'collision between widget data ID="{key}"')
+            data.update(data_menu)
+        return data
+
+    def _get_input_data_snapshot(self) -> dict[str, Any]:
+        """
+        Return the input data of the Menu widgets. The snapshot is created on the
+        first call; later calls only retrieve the values of the widgets which
+        changed since then.
+
+        :return: Input dict, this object should not be modified
+        """
+        values = self._input_data_values
+        if values is None:
+            values = {}
+            for widget in self._widgets:
+                if _widget_has_value(widget):
+                    try:
+                        values[widget] = widget.get_value()
+                    except ValueError:  # Widget does not return data
+                        pass
+            self._input_data_values = values
+            self._input_data = None
+            self._input_data_dirty.clear()
+        elif self._input_data_dirty:
+            for widget in self._input_data_dirty:
+                try:
+                    value = widget.get_value()
+                except ValueError:  # Widget does not return data anymore
+                    if widget in values:
+                        del values[widget]
+                        self._input_data = None
+                    continue
+                if widget not in values:
+                    self._input_data = None
+                elif self._input_data is not None:
+                    self._input_data[widget.get_id()] = value
+                values[widget] = value
+            self._input_data_dirty.clear()
+        if self._input_data is None:
+            self._input_data = {
+                w.get_id(): values[w] for w in self._widgets if w in values
+            }
+        return self._input_data
+
+    def _input_data_changed(self, widget: Widget) -> None:
+        """
+        Mark the value of the widget as changed. Only widgets from the Menu are
+        tracked, once the input data has been requested.
+
+        :param widget: Widget
+        """
+        if (
+            self._input_data_values is None
+            or self._widgets_index.get(widget.get_id()) is not widget
+            or not _widget_has_value(widget)
+        ):
+            return
+        self._input_data_dirty.add(widget)
+        if self._input_data_delta is not None:
+            self._input_data_delta[widget] = None
+        _INPUT_DATA_VERSION[0] += 1
+
+    def _input_data_remove_widget(self, widget: Widget) -> None:
+        """
+        Remove the widget from the input data tracking.
+
+        :param widget: Widget
+        """
+        if self._input_data_values is None:
+            return
+        self._input_data_dirty.discard(widget)
+        if self._input_data_delta is not None:
+            self._input_data_delta.pop(widget, None)
+        if widget in self._input_data_values:
+            del self._input_data_values[widget]
+            self._input_data = None
+            _INPUT_DATA_VERSION[0] += 1
+
     def get_rect(self) -> pygame.Rect:
         """
         Return the :py:class:`pygame.Rect` object of the Menu.
@@ -3509,8 +4135,13 @@ class Menu(Base):
         for w in self._widgets.copy():
             self.remove_widget(w)
         del self._widgets[:]
+        self._widgets_index.clear()
+        self._layout_calls.clear()
+        self._pending_widgets.clear()
+        self._rendered_widgets.clear()
         del self._submenus
         self._submenus = {}
+        _TREE_VERSION[0] += 1
         self._index = -1
         self._stats.clear += 1
         self._render()
@@ -3531,8 +4162,12 @@ class Menu(Base):
 
         # Update pointers
         menu._top = self._top
+        prev_current = self._top._current
         self._top._current = menu._current
         self._top._prev = [self._top._prev, current]
+        _RETAINED_MENUS.pop(id(menu._current), None)
+        if menu._current._pending_resize is not None:
+            menu._current._apply_pending_resize()
 
         # Select the first widget (if not remember the selection)
         if not self._current._remember_selection:
@@ -3545,6 +4180,7 @@ class Menu(Base):
         # Re-render menu
         check_widget_mouseleave(force=True)
         self._render()
+        _retain_menu(prev_current)
 
     def reset(self, total: int) -> Menu:
         """
@@ -3563,6 +4199,7 @@ class Menu(Base):
         assert total > 0, "total must be greater than zero"
 
         i = 0
+        prev_current = self._top._current
         if self._top._prev is not None:
             while True:
                 if self._top._prev is not None:
@@ -3584,7 +4221,11 @@ class Menu(Base):
             except TypeError:
                 self._current._onreset()
 
-        self._current._widgets_surface = None
+        # The widget surface is retained while the Menu is inactive, widget
+        # changes request its update through the Menu
+        _RETAINED_MENUS.pop(id(self._current), None)
+        if self._current._pending_resize is not None:
+            self._current._apply_pending_resize()
         check_widget_mouseleave(force=True)
         self._current._select(
             self._top._current._index,
@@ -3593,6 +4234,8 @@ class Menu(Base):
             False,
             update_mouse_position=False,
         )
+        if prev_current != self._current:
+            _retain_menu(prev_current)
         self._current._stats.reset += 1
         return self._current
 
@@ -3644,49 +4287,28 @@ class Menu(Base):
                 self._widgets[i].select(False)
             self._index = 0
 
+        # Resolve the widget to select, the lookup table stores the resolution
+        # of each (index, direction) pair, thus, moving through long runs of
+        # non-selectable widgets does not traverse them on each key press
         old_widget = self._widgets[self._index]
-        new_widget = self._widgets[new_index]
-        if old_widget == new_widget and self._index != -1 and old_widget.is_selected():
-            return False
-
-        # If new widget is not selectable or visible
-        elif not new_widget.is_selectable or not new_widget.is_visible():
-            # If it is a frame, select the first selectable object
-            if isinstance(new_widget, Frame):
-                if dwidget == 1:
-                    min_index = new_widget.first_index
-                else:
-                    min_index = new_widget.last_index
-                current_frame = self._widgets[self._index].get_frame()
-                same_frame = (
-                    current_frame is not None and current_frame == new_widget
-                )  # Ignore cycles
-
-                # Check if recursive but same index as before
-                last_index = kwargs.get("last_index", -1)
-                if select_type == SELECT_RECURSIVE and last_index == min_index:
-                    min_index += 2 * dwidget
-
-                # A selectable widget has been found within frame
-                if min_index != -1 and not same_frame and min_index != self._index:
-                    kwargs["last_index"] = new_index
-                    return self._select(
-                        min_index, dwidget, SELECT_RECURSIVE, apply_sound, **kwargs
-                    )
-
-            # There's at least 1 selectable option
-            if self._index >= 0:
-                kwargs["last_index"] = new_index
-                return self._select(
-                    new_index + dwidget,
-                    dwidget,
-                    SELECT_RECURSIVE,
-                    apply_sound,
-                    **kwargs,
-                )
-
-            # No selectable options, quit
+        last_index = -1
+        if select_type == SELECT_RECURSIVE:
+            last_index = kwargs.get("last_index", -1)
+        version = (_TREE_VERSION[0], _SELECTION_VERSION[0], len(self._widgets))
+        if self._select_table[0] != version:
+            self._select_table = (version, {})
+        table = self._select_table[1]
+        key = (self._index, new_index, dwidget, last_index, old_widget.is_selected())
+        resolved = table.get(key)
+        if resolved is None:
+            resolved = self._resolve_select_index(new_index, dwidget, last_index)
+            table[key] = resolved
+        new_index, recursive = resolved
+        if recursive:
+            self._last_selected_type = select_type = SELECT_RECURSIVE
+        if new_index == -1:
             return False
+        new_widget = self._widgets[new_index]
 
         # Selecting widgets forces rendering
         old_widget.select(False)
@@ -3711,6 +4333,64 @@ class Menu(Base):
 
         return True
 
+    def _resolve_select_index(
+        self, new_index: int, dwidget: int, last_index: int
+    ) -> tuple[int, bool]:
+        """
+        Return the index of the widget to select starting from the given index.
+        If the widget is not selectable or visible, the search continues in the
+        given direction; if it is a Frame, the search jumps to its first (or
+        last) selectable widget.
+
+        :param new_index: Widget index
+        :param dwidget: Direction to search if ``new_index`` widget is non-selectable
+        :param last_index: Last index visited within a recursive selection, ``-1`` if not recursive
+        :return: Index to select (``-1`` if the selection does not change), and ``True`` if non-selectable widgets were skipped
+        """
+        n = len(self._widgets)
+        old_widget = self._widgets[self._index]
+        current_frame = old_widget.get_frame()
+        recursive = last_index != -1
+
+        # Each index is visited at most twice (once directly, and once from a frame)
+        for i in range(2 * n + 2):
+            new_index %= n
+            new_widget = self._widgets[new_index]
+            if (
+                old_widget == new_widget
+                and self._index != -1
+                and old_widget.is_selected()
+            ):
+                return -1, i > 0
+            elif new_widget.is_selectable and new_widget.is_visible():
+                return new_index, i > 0
+
+            # If it is a frame, select the first selectable object
+            if isinstance(new_widget, Frame):
+                if dwidget == 1:
+                    min_index = new_widget.first_index
+                else:
+                    min_index = new_widget.last_index
+                same_frame = (
+                    current_frame is not None and current_frame == new_widget
+                )  # Ignore cycles
+
+                # Check if recursive but same index as before
+                if recursive and last_index == min_index:
+                    min_index += 2 * dwidget
+
+                # A selectable widget has been found within frame
+                if min_index != -1 and not same_frame and min_index != self._index:
+                    last_index, new_index, recursive = new_index, min_index, True
+                    continue
+
+            # No selectable options, quit
+            if self._index < 0:
+                return -1, i > 0
+            last_index, new_index, recursive = new_index, new_index + dwidget, True
+
+        return -1, True
+
     def scroll_to_widget(
         self, widget: Widget | None, scroll_parent: bool = True
     ) -> Menu:
@@ -3782,6 +4462,8 @@ class Menu(Base):
 
         :return: Window size in px
         """
+        if self._pending_resize is not None:
+            self._apply_pending_resize()
         return self._window_size
 
     def get_col_rows(self) -> tuple[int, list[int]]:
@@ -3798,6 +4480,182 @@ class Menu(Base):
         """
         return self._columns, self._rows
 
+    @contextmanager
+    def record_layout(self) -> Generator[Menu, None, None]:
+        """
+        Record the ``Menu.add`` calls made within the context, thus, the Menu
+        can be exported by :py:meth:`pygame_menu.menu.Menu.export_layout`. The
+        calls keep a reference to their arguments until the widgets are removed.
+
+        .. code-block:: python
+
+            with menu.record_layout():
+                menu.add.button('Play', start_game, button_id='play')
+
+        .. note::
+
+            Only the Menu widgets are recorded, the submenus must be created
+            within their own recording context.
+
+        :return: Self reference
+        """
+        recording = self._layout_recording
+        self._layout_recording = True
+        try:
+            yield self
+        finally:
+            self._layout_recording = recording
+
+    def export_layout(self, path: str | Path | None = None, key: str = "") -> bytes:
+        """
+        Export the layout of the Menu and its submenus as compressed JSON: the
+        ``Menu.add`` calls recorded by :py:meth:`pygame_menu.menu.Menu.record_layout`,
+        with their arguments and widget IDs, the hidden widgets, and the hash of
+        the themes and of the files they refer to (fonts, images). The layout
+        can be restored by :py:meth:`pygame_menu.menu.Menu.from_layout`, which
+        replays the calls.
+
+        .. code-block:: python
+
+            menu = pygame_menu.Menu.from_layout('menu.layout', callbacks, theme)
+            if menu is None:  # Not exported, or the layout is outdated
+                menu = pygame_menu.Menu('Main', 600, 400, theme=theme)
+                with menu.record_layout():
+                    build_menu(menu)
+                menu.export_layout('menu.layout')
+
+        .. note::
+
+            The layout is not a snapshot of the Menu. No rendered surface,
+            computed position or resolved style is stored, and the changes made
+            to the widgets after adding them, for example, by
+            :py:meth:`pygame_menu.widgets.core.widget.Widget.set_title`, are lost.
+
+        .. note::
+
+            Callbacks are not stored. These are rebound by name while restoring,
+            using ``"<widget_id>.<parameter>"`` or ``"<widget_id>"`` keys, for
+            example, ``"play.action"`` for the action of the button ``"play"``.
+            Menu callbacks use the Menu ID instead. Events are restored from
+            :py:mod:`pygame_menu.events`; nothing else is resolved by name, thus,
+            every other callback must be provided.
+
+        .. note::
+
+            The arguments must be strings, numbers, lists, tuples, dicts, paths,
+            colors, images, surfaces, menus, events or callbacks. Menu subclasses,
+            widgets packed within frames, or not added by a recorded call, for
+            example, using
+            :py:meth:`pygame_menu._widgetmanager.WidgetManager.generic_widget`,
+            cannot be exported.
+
+        :param path: File to write the layout. If ``None`` the layout is only returned
+        :param key: Layout key, for example, the application version. The layout is discarded if it is restored with another key
+        :return: Layout data
+        """
+        assert isinstance(path, (str, Path, type(None)))
+        assert isinstance(key, str)
+        layout = export_layout(self, key)
+        if path is not None:
+            Path(path).write_bytes(layout)
+        return layout
+
+    @staticmethod
+    def from_layout(
+        layout: str | Path | bytes,
+        callbacks: dict[str, Callable] | None = None,
+        theme: Theme | None = None,
+        key: str = "",
+    ) -> Menu | None:
+        """
+        Restore a Menu and its submenus from a layout exported by
+        :py:meth:`pygame_menu.menu.Menu.export_layout`. The recorded ``Menu.add``
+        calls are replayed within :py:meth:`pygame_menu.menu.Menu.record_layout`
+        with the rendering disabled; thus, the widget positions are computed
+        once instead of after each addition, and the restored Menu can be
+        exported again. The widgets are rendered as usual, nothing is read from
+        a cache.
+
+        The layout is discarded if it was exported by another pygame-menu
+        version or with another key, or if the theme or any referenced file has
+        changed since.
+
+        :param layout: Layout file, or layout data
+        :param callbacks: Callbacks by name. See :py:meth:`pygame_menu.menu.Menu.export_layout`
+        :param theme: Theme of the menus. If ``None`` uses a copy of :py:data:`pygame_menu.themes.THEME_DEFAULT`
+        :param key: Layout key
+        :return: Restored Menu, ``None`` if the layout does not exist or it is outdated
+        """
+        assert isinstance(layout, (str, Path, bytes))
+        assert isinstance(callbacks, (dict, type(None)))
+        assert isinstance(theme, (Theme, type(None)))
+        assert isinstance(key, str)
+        if not isinstance(layout, bytes):
+            try:
+                layout = Path(layout).read_bytes()
+            except OSError:
+                return None
+        return load_layout(layout, callbacks, theme, key)
+
+    def prewarm(
+        self, recursive: bool = True, budget_ms: NumberType | None = None
+    ) -> float:
+        """
+        Render the widgets and build the surfaces of the menus which have not
+        been displayed yet, thus, opening them for the first time does not stall
+        the frame.
+
+        If a time budget is given, the work stops once it has been spent; the rest
+        continues on the next call, or on each frame of
+        :py:meth:`pygame_menu.menu.Menu.mainloop` and
+        :py:meth:`pygame_menu.menu.Menu.run_async`.
+
+        .. code-block:: python
+
+            while menu.prewarm(budget_ms=8) < 1:
+                draw_loading_screen(menu.get_prewarm_progress())
+
+        .. note::
+
+            The work runs on the main thread, as the fonts and surfaces used by
+            the widgets cannot be rendered concurrently with the drawing. Fonts and
+            images can be loaded in the background using
+            :py:class:`pygame_menu.loader.AssetLoader`.
+
+        .. note::
+
+            The surfaces of the menus not displayed count against the memory
+            budget of :py:func:`pygame_menu.utils.configure_menu_retention`; if
+            exceeded, only their widgets are kept rendered.
+
+        :param recursive: If ``True`` prewarm all submenus in a recursive fashion
+        :param budget_ms: Time budget in ms. If ``None`` all the work is done at once
+        :return: Progress, from ``0`` to ``1``
+        """
+        assert isinstance(recursive, bool)
+        assert isinstance(budget_ms, (NumberInstance, type(None)))
+        if budget_ms is not None:
+            assert budget_ms > 0, "budget must be greater than zero"
+        if self._prewarm is None or self._prewarm.recursive != recursive:
+            menus = (self,) + self.get_submenus(True) if recursive else (self,)
+            self._prewarm = _MenuPrewarm(menus, recursive)
+        self._prewarm.budget_ms = budget_ms
+        progress = self._prewarm.run()
+        if progress == 1:
+            self._prewarm = None
+        return progress
+
+    def get_prewarm_progress(self) -> float:
+        """
+        Return the progress of the pending prewarm work. See
+        :py:meth:`pygame_menu.menu.Menu.prewarm`.
+
+        :return: Progress, from ``0`` to ``1``. If there is no pending work returns ``1``
+        """
+        if self._prewarm is None:
+            return 1
+        return self._prewarm.get_progress()
+
     def get_submenus(self, recursive: bool = False) -> tuple[Menu, ...]:
         """
         Return the Menu submenus as a tuple.
@@ -3814,13 +4672,7 @@ class Menu(Base):
         assert isinstance(recursive, bool)
         if not recursive:
             return tuple(self._submenus.keys())
-        sm = list(self._submenus.keys())
-        for m in self._submenus:
-            m_sm = m.get_submenus(recursive=recursive)
-            for i in m_sm:
-                if i not in sm:
-                    sm.append(i)
-        return tuple(sm)
+        return self._get_tree_index()[0]
 
     def get_menubar(self) -> MenuBar:
         """
@@ -3872,15 +4724,9 @@ class Menu(Base):
         """
         assert isinstance(widget_id, str)
         assert isinstance(recursive, bool)
-        for widget in self._widgets:
-            if widget.get_id() == widget_id:
-                return widget
-        if recursive:
-            for menu in self._submenus.keys():
-                widget = menu.get_widget(widget_id, recursive)
-                if widget:
-                    return widget
-        return None
+        if not recursive:
+            return self._widgets_index.get(widget_id)
+        return self._get_tree_index()[1].get(widget_id)
 
     def get_widgets_column(self, col: int) -> tuple[Widget, ...]:
         """
@@ -3908,10 +4754,8 @@ class Menu(Base):
         """
         if not ids:
             return tuple(self._widgets)
-        widgets = []
-        for i in ids:
-            widgets.append(self.get_widget(i, recursive=True))
-        return tuple(widgets)
+        index = self._get_tree_index()[1]
+        return tuple(index.get(i) for i in ids)
 
     def reset_value(self, recursive: bool = False) -> Menu:
         """
@@ -3976,6 +4820,7 @@ class Menu(Base):
             # If total hooks are empty, remove the menu
             if not self._submenus[menu]:
                 del self._submenus[menu]
+                _TREE_VERSION[0] += 1
             self._update_after_remove_or_hidden(self._index)
             return True
         elif recursive:
@@ -4101,6 +4946,8 @@ class Menu(Base):
 
         :return: Decorator API
         """
+        if self._decorator is None:
+            self._decorator = Decorator(self, verbose=self._verbose)  # type: ignore
         return self._decorator
 
     def _test_widgets_status(self) -> tuple[tuple[Any, ...], ...]:
@@ -4142,6 +4989,7 @@ class Menu(Base):
         :return: The new indices of the widget and the previous index element
         """
         depth: int = kwargs.get("depth", 0)
+        _SELECTION_VERSION[0] += 1
 
         # Update only selected index
         if kwargs.get("update_selected_index", False):
@@ -4385,6 +5233,108 @@ class Menu(Base):
         self._theme = self._theme.copy()
 
 
+def _widget_has_value(widget: Widget) -> bool:
+    """
+    Return ``True`` if the widget class implements ``get_value``.
+
+    :param widget: Widget
+    :return: ``True`` if the widget may return a value
+    """
+    return type(widget).get_value is not Widget.get_value
+
+
+def _retain_menu(menu: Menu) -> None:
+    """
+    Register an inactive Menu which retains its widget surface. If the retained
+    surfaces exceed the memory budget, the least recently displayed menus
+    release them.
+
+    :param menu: Menu
+    """
+    _RETAINED_MENUS.pop(id(menu), None)
+    surface = menu._widgets_surface
+    if surface is not None:
+        size = surface.get_width() * surface.get_height() * surface.get_bytesize()
+        _RETAINED_MENUS[id(menu)] = (weakref.ref(menu), size)
+    total = sum(item[1] for item in _RETAINED_MENUS.values())
+    while total > _MENU_RETENTION_BUDGET[0]:
+        ref, size = _RETAINED_MENUS.popitem(last=False)[1]
+        total -= size
+        retained = ref()
+        if retained is not None and retained._top._current != retained:
+            retained._release_widget_surface()
+
+
+class _MenuPrewarm:
+    """
+    Pending prewarm work, see :py:meth:`pygame_menu.menu.Menu.prewarm`.
+
+    :param menus: Menus to prewarm, the first one owns the work. The widgets of the menus already built are not rendered again
+    :param recursive: If the submenus are included
+    """
+
+    budget_ms: NumberType | None
+    recursive: bool
+    _index: int
+    _owner: Menu
+    _tasks: list[Callable[[], Any]]
+
+    def __init__(self, menus: tuple[Menu, ...], recursive: bool) -> None:
+        self.budget_ms = None
+        self.recursive = recursive
+        self._index = 0
+        self._owner = menus[0]
+        self._tasks = []
+        for menu in menus:
+            if menu._widgets_surface is None:
+                self._tasks.append(menu._menubar._render)
+                for widget in menu._widgets:
+                    if widget.is_visible():
+                        self._tasks.append(widget._render)
+            self._tasks.append(partial(self._build_surface, menu))
+
+    def _build_surface(self, menu: Menu) -> None:
+        """
+        Build the widget surface of the menu, if not built. If the menu is not
+        displayed, its surface counts against the memory budget of the inactive
+        menus, see :py:func:`pygame_menu.utils.configure_menu_retention`.
+
+        :param menu: Menu
+        """
+        menu._render()
+        if menu is self._owner._top._current or menu._widgets_surface is None:
+            return
+        _retain_menu(menu)
+        if id(menu) not in _RETAINED_MENUS:  # Exceeds the budget
+            menu._release_widget_surface()
+
+    def get_progress(self) -> float:
+        """
+        Return the work progress.
+
+        :return: Progress, from ``0`` to ``1``
+        """
+        if not self._tasks:
+            return 1
+        return self._index / len(self._tasks)
+
+    def run(self) -> float:
+        """
+        Run the pending tasks until the time budget is spent. At least one task
+        is run on each call.
+
+        :return: Progress, from ``0`` to ``1``
+        """
+        t0 = time.time()
+        budget = None if self.budget_ms is None else self.budget_ms / 1000
+        while self._index < len(self._tasks):
+            self._tasks[self._index]()
+            self._index += 1
+            if budget is not None and time.time() - t0 >= budget:
+                break
+        return self.get_progress()
+
+
 class _MenuStats:
     """
     Menu stats.
@@ -4396,8 +5346,10 @@ class _MenuStats:
         self.removed_widgets = 0
 
         # Widget position
+        self.build_background = 0
         self.build_surface = 0
         self.position_update = 0
+        self.release_surface = 0
         self.center_content = 0
 
         # Render
@@ -4410,8 +5362,11 @@ class _MenuStats:
         # Other
         self.clear = 0
         self.draw = 0
+        self.draw_focus = 0
+        self.draw_focus_cached = 0
         self.draw_update_cached = 0
         self.loop = 0
+        self.render_backlog = 0
         self.reset = 0
         self.select = 0
         self.update = 0
@@ -39,9 +39,10 @@ __all__ = [
 ]
 
 import time
+import weakref
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from pygame import error as pygame_error, mixer, vernum as pygame_version
 
@@ -49,6 +50,9 @@ from pygame_menu._base import Base
 from pygame_menu._types import NumberInstance, NumberType
 from pygame_menu.utils import warn
 
+if TYPE_CHECKING:
+    from pygame_menu.loader import AssetLoader
+
 try:  # pygame<2.0.0 compatibility
     from pygame import AUDIO_ALLOW_CHANNELS_CHANGE, AUDIO_ALLOW_FREQUENCY_CHANGE
 except ImportError:
@@ -125,6 +129,89 @@ class SoundInitState:
 
 SOUND_INITIALIZED = SoundInitState()
 
+# Sounds with plays scheduled within the frame, see Sound.set_scheduler
+_SCHEDULED_SOUNDS: weakref.WeakSet[Sound] = weakref.WeakSet()
+
+# Mixer channels left unreserved for other sounds if channels are reserved
+_FREE_CHANNELS = 8
+
+# Sounds which reserve the mixer channels, and the number of channels reserved
+# before the first one did
+_RESERVING_SOUNDS: weakref.WeakSet[Sound] = weakref.WeakSet()
+_RESERVED_BEFORE: list[int | None] = [None]
+
+
+def _flush_scheduled_sounds() -> int:
+    """
+    Play the sounds scheduled within the frame. Called by the Menu at the end
+    of the update and draw.
+
+    :return: Number of played sounds
+    """
+    if not _SCHEDULED_SOUNDS:
+        return 0
+    played = 0
+    for sound in list(_SCHEDULED_SOUNDS):
+        played += sound.flush()
+    return played
+
+
+def _get_reserved_channels() -> int:
+    """
+    Return the number of reserved mixer channels. pygame does not provide it,
+    thus, a silent sound is played on the first free channel not reserved, whose
+    index is returned; the busy channels before it are counted as reserved.
+
+    :return: Number of reserved channels
+    """
+    probe = mixer.Sound(buffer=bytes(64))
+    channel = probe.play()
+    if channel is None:  # All channels not reserved are busy
+        return mixer.get_num_channels()
+    reserved = 0
+    for i in range(mixer.get_num_channels()):
+        if mixer.Channel(i).get_sound() is probe:
+            reserved = i
+            break
+    channel.stop()
+    return reserved
+
+
+def _reserve_sound_channels(sound: Sound) -> dict[str, mixer.Channel]:
+    """
+    Reserve one mixer channel for each sound type. Reserved channels are not
+    used by ``Sound.play()``. A greater reservation made by the
+    application is kept.
+
+    :param sound: Sound engine which reserves the channels
+    :return: Channel of each sound type. Empty if the mixer is not initialized
+    """
+    if not SOUND_INITIALIZED.available or mixer.get_init() is None:
+        return {}
+    if not _RESERVING_SOUNDS:
+        _RESERVED_BEFORE[0] = _get_reserved_channels()
+    _RESERVING_SOUNDS.add(sound)
+    total = len(SOUND_TYPES)
+    if mixer.get_num_channels() < total + _FREE_CHANNELS:
+        mixer.set_num_channels(total + _FREE_CHANNELS)
+    mixer.set_reserved(max(total, _RESERVED_BEFORE[0]))
+    return {sound_type: mixer.Channel(i) for i, sound_type in enumerate(SOUND_TYPES)}
+
+
+def _release_sound_channels(sound: Sound) -> None:
+    """
+    Release the mixer channels reserved by a sound engine. Once no engine
+    reserves them, the previous reservation is restored.
+
+    :param sound: Sound engine which reserved the channels
+    """
+    _RESERVING_SOUNDS.discard(sound)
+    if _RESERVING_SOUNDS or _RESERVED_BEFORE[0] is None:
+        return
+    if mixer.get_init() is not None:
+        mixer.set_reserved(_RESERVED_BEFORE[0])
+    _RESERVED_BEFORE[0] = None
+
 
 class Sound(Base):
     """
@@ -146,6 +233,7 @@ class Sound(Base):
     _last_play: str
     _last_time: float
     _mixer_configs: dict[str, bool | int | str]
+    _scheduler: _SoundScheduler | None
     _sound: dict[str, dict[str, Any]]
     _uniquechannel: bool
 
@@ -242,6 +330,9 @@ class Sound(Base):
         self._last_play = ""
         self._last_time = 0
 
+        # Plays are immediate unless a scheduler is set
+        self._scheduler = None
+
     def copy(self) -> Sound:
         """
         Return a copy of the object.
@@ -264,6 +355,12 @@ class Sound(Base):
                     maxtime=s["maxtime"],
                     fade_ms=s["fade_ms"],
                 )
+        if self._scheduler is not None:
+            new_sound.set_scheduler(
+                rate_limit=self._scheduler.rate_limit,
+                rate_limits=self._scheduler.rate_limits,
+                reserve_channels=self._scheduler.reserve_channels,
+            )
         return new_sound
 
     def __copy__(self) -> Sound:
@@ -305,17 +402,25 @@ class Sound(Base):
         loops: int = 0,
         maxtime: NumberType = 0,
         fade_ms: NumberType = 0,
+        loader: AssetLoader | None = None,
     ) -> bool:
         """
         Link a sound file to a sound type.
 
+        .. note::
+
+            If ``loader`` is provided the file is decoded on the loader thread
+            pool. The sound type is linked immediately, but it does not play
+            until the load has finished.
+
         :param sound_type: Sound type
         :param sound_file: Sound file. If ``None`` disable the given sound type
         :param volume: Volume of the sound, from ``0.0`` to ``1.0``
         :param loops: Loops of the sound
         :param maxtime: Max playing time of the sound
         :param fade_ms: Fading ms
-        :return: The status of the sound load, ``True`` if the sound was loaded
+        :param loader: Asset loader used to load the sound in the background. If ``None`` the sound is loaded synchronously
+        :return: The status of the sound load, ``True`` if the sound was loaded (or scheduled)
         """
         assert isinstance(sound_type, str)
         assert isinstance(sound_file, (str, type(None), Path))
@@ -342,44 +447,99 @@ class Sound(Base):
         if not sound_path.is_file():
             raise OSError(f'sound file "{sound_path}" does not exist')
 
+        # Store the sound
+        self._sound[sound_type] = {
+            "fade_ms": fade_ms,
+            "file": None,
+            "length": 0,
+            "loops": loops,
+            "maxtime": maxtime,
+            "path": sound_file,
+            "pending": None,
+            "type": sound_type,
+            "volume": volume,
+        }
+
+        # Load the sound in the background, it is configured once ready
+        if loader is not None:
+            self._sound[sound_type]["pending"] = loader.load_sound(sound_path)
+            return True
+
         # Load the sound
         try:
             sound_data = mixer.Sound(file=str(sound_path))
         except pygame_error:
+            sound_data = None
+        return self._configure_sound(sound_type, sound_data)
+
+    def _configure_sound(
+        self, sound_type: str, sound_data: mixer.Sound | None
+    ) -> bool:
+        """
+        Configure the loaded sound data of a sound type.
+
+        :param sound_type: Sound type
+        :param sound_data: Loaded sound. If ``None`` the sound could not be loaded
+        :return: ``True`` if the sound was configured
+        """
+        sound = self._sound[sound_type]
+        if sound_data is None:
             # Failed to load sound file; disable this sound type.
             if self._verbose:
                 warn(
-                    f'the sound file "{sound_file}" could not be loaded, it has been disabled'
+                    f'the sound file "{sound.get("path")}" could not be loaded, it has been disabled'
                 )
             self._sound[sound_type] = {}
             return False
+        sound_data.set_volume(float(sound["volume"]))
+        sound["file"] = sound_data
+        sound["length"] = sound_data.get_length()
+        return True
 
-        # Configure the sound
-        sound_data.set_volume(float(volume))
+    def _check_pending(self, sound: dict[str, Any]) -> bool:
+        """
+        Configure the sound if its background load has finished.
 
-        # Store the sound
-        self._sound[sound_type] = {
-            "fade_ms": fade_ms,
-            "file": sound_data,
-            "length": sound_data.get_length(),
-            "loops": loops,
-            "maxtime": maxtime,
-            "path": sound_file,
-            "type": sound_type,
-            "volume": volume,
-        }
-        return True
+        :param sound: Sound data
+        :return: ``True`` if the sound is ready to be played
+        """
+        future = sound["pending"]
+        if future is None:
+            return True
+        elif not future.done():
+            return False
+        sound["pending"] = None
+        try:
+            sound_data = future.result()
+        except pygame_error:
+            sound_data = None
+        return self._configure_sound(sound["type"], sound_data)
+
+    def is_pending(self) -> bool:
+        """
+        Return ``True`` if any sound is still being loaded in the background.
+
+        :return: ``True`` if pending
+        """
+        pending = False
+        for sound in list(self._sound.values()):
+            if sound and not self._check_pending(sound):
+                pending = True
+        return pending
 
-    def load_example_sounds(self, volume: float = 0.5) -> Sound:
+    def load_example_sounds(
+        self, volume: float = 0.5, loader: AssetLoader | None = None
+    ) -> Sound:
         """
         Load the example sounds provided by the package.
 
         :param volume: Volume of the sound, from ``0`` to ``1``
+        :param loader: Asset loader used to load the sounds in the background. If ``None`` the sounds are loaded synchronously
         :return: Self reference
         """
         assert isinstance(volume, NumberInstance) and 0 <= volume <= 1
         for sound_type, example in zip(SOUND_TYPES, SOUND_EXAMPLES):
-            self.set_sound(sound_type, example, volume=float(volume))
+            self.set_sound(sound_type, example, volume=float(volume), loader=loader)
         return self
 
     def _play_sound(self, sound: dict[str, Any] | None) -> bool:
@@ -389,9 +549,15 @@ class Sound(Base):
         :param sound: Sound to be played
         :return: ``True`` if the sound was played
         """
-        if not sound:
+        if not sound or not self._check_pending(sound):
             return False
 
+        # Defer the play to the frame end
+        if self._scheduler is not None:
+            self._scheduler.schedule(sound)
+            _SCHEDULED_SOUNDS.add(self)
+            return True
+
         # Find an available channel
         channel = self.get_channel()  # This will set the channel if it's None
         if channel is None:  # The sound can't be played because all channels are busy
@@ -426,6 +592,132 @@ class Sound(Base):
         self._last_time = sound_time
         return True
 
+    def set_scheduler(
+        self,
+        enabled: bool = True,
+        rate_limit: NumberType = 0.05,
+        rate_limits: dict[str, NumberType] | None = None,
+        reserve_channels: bool = True,
+    ) -> Sound:
+        """
+        Enable or disable the playback scheduler. If enabled, sounds are not
+        played immediately; the requests are queued and played once per frame
+        by :py:meth:`pygame_menu.sound.Sound.flush`, which the Menu calls at the
+        end of its update and draw. Identical requests within the same frame are
+        coalesced, and plays of a sound type within ``rate_limit`` seconds of its
+        last play are dropped.
+
+        .. note::
+
+            If ``reserve_channels=True`` the first mixer channels are reserved,
+            one for each sound type, and the number of mixer channels is
+            increased if needed. A new play of a sound type replaces the one
+            still playing on its channel. The channels are shared among all the
+            sound engines that reserve them. A greater reservation made by the
+            application is kept, and the previous reservation is restored once
+            no scheduler reserves the channels.
+
+        :param enabled: Enable the scheduler. If ``False`` sounds are played immediately
+        :param rate_limit: Minimum time in seconds between two plays of the same sound type
+        :param rate_limits: Rate limit of specific sound types, overrides ``rate_limit``
+        :param reserve_channels: Reserve a mixer channel for each sound type
+        :return: Self reference
+        """
+        assert isinstance(enabled, bool)
+        assert isinstance(rate_limit, NumberInstance)
+        assert isinstance(rate_limits, (dict, type(None)))
+        assert isinstance(reserve_channels, bool)
+        assert rate_limit >= 0, "rate limit must be equal or greater than zero"
+        if rate_limits is None:
+            rate_limits = {}
+        for sound_type, limit in rate_limits.items():
+            if sound_type not in SOUND_TYPES:
+                raise ValueError("sound type not valid, check the manual")
+            assert isinstance(limit, NumberInstance) and limit >= 0, (
+                "rate limit must be equal or greater than zero"
+            )
+        if self._scheduler is not None:
+            self.flush()
+            if self._scheduler.channels:
+                _release_sound_channels(self)
+        if not enabled:
+            self._scheduler = None
+            return self
+        self._scheduler = _SoundScheduler(
+            self, rate_limit, rate_limits, reserve_channels
+        )
+        return self
+
+    def flush(self) -> int:
+        """
+        Play the sounds queued by the scheduler since the last flush. Each sound
+        type is played at most once.
+
+        :return: Number of played sounds
+        """
+        _SCHEDULED_SOUNDS.discard(self)
+        scheduler = self._scheduler
+        if scheduler is None or not scheduler.queue:
+            return 0
+        played = 0
+        sound_time = time.time()
+        stats = scheduler.stats
+        for sound_type, sound in scheduler.queue.items():
+            last_time = scheduler.last_time.get(sound_type)
+            if (
+                last_time is not None
+                and sound_time - last_time
+                < scheduler.rate_limits.get(sound_type, scheduler.rate_limit)
+            ):
+                stats["dropped"] += 1
+                continue
+            channel = scheduler.channels.get(sound_type)
+            if channel is None:
+                channel = self.get_channel()
+                if channel is None:  # All channels are busy
+                    stats["dropped"] += 1
+                    continue
+            try:
+                channel.play(
+                    sound["file"],
+                    loops=sound["loops"],
+                    maxtime=sound["maxtime"],
+                    fade_ms=sound["fade_ms"],
+                )
+            except pygame_error:
+                # Ignore playback errors; sound is optional.
+                pass
+            scheduler.last_time[sound_type] = sound_time
+            self._last_play = sound_type
+            self._last_time = sound_time
+            played += 1
+        stats["played"] += played
+        scheduler.queue.clear()
+        return played
+
+    def get_scheduler_stats(self) -> dict[str, int]:
+        """
+        Return the scheduler statistics: number of ``played``, ``coalesced`` and
+        ``dropped`` sounds, and sounds ``queued`` to the next flush.
+
+        :return: Statistics. Empty if the scheduler is disabled
+        """
+        if self._scheduler is None:
+            return {}
+        stats = self._scheduler.stats.copy()
+        stats["queued"] = len(self._scheduler.queue)
+        return stats
+
+    def _get_channels(self) -> list[mixer.Channel | None]:
+        """
+        Return the channels affected by stop, pause and unpause.
+
+        :return: Channel list
+        """
+        if self._scheduler is not None and self._scheduler.channels:
+            return list(self._scheduler.channels.values())
+        return [self.get_channel()]
+
     def play_sound_type(self, sound_type: str) -> Sound:
         """
         Play a sound based on its type.
@@ -519,18 +811,20 @@ class Sound(Base):
 
     def stop(self) -> Sound:
         """
-        Stop the channel.
+        Stop the channel. Also drops the plays queued by the scheduler.
 
         :return: Self reference
         """
-        channel = self.get_channel()
-        if channel is None:  # The sound can't be played because all channels are busy
-            return self
-        try:
-            channel.stop()
-        except pygame_error:
-            # Stopping may fail if the channel is invalid; safe to ignore.
-            pass
+        if self._scheduler is not None:
+            self._scheduler.queue.clear()
+        for channel in self._get_channels():
+            if channel is None:  # All channels are busy
+                continue
+            try:
+                channel.stop()
+            except pygame_error:
+                # Stopping may fail if the channel is invalid; safe to ignore.
+                pass
         return self
 
     def pause(self) -> Sound:
@@ -539,14 +833,14 @@ class Sound(Base):
 
         :return: Self reference
         """
-        channel = self.get_channel()
-        if channel is None:  # The sound can't be played because all channels are busy
-            return self
-        try:
-            channel.pause()
-        except pygame_error:
-            # Pausing may fail if the channel is invalid; safe to ignore.
-            pass
+        for channel in self._get_channels():
+            if channel is None:  # All channels are busy
+                continue
+            try:
+                channel.pause()
+            except pygame_error:
+                # Pausing may fail if the channel is invalid; safe to ignore.
+                pass
         return self
 
     def unpause(self) -> Sound:
@@ -555,14 +849,14 @@ class Sound(Base):
 
         :return: Self reference
         """
-        channel = self.get_channel()
-        if channel is None:  # The sound can't be played because all channels are busy
-            return self
-        try:
-            channel.unpause()
-        except pygame_error:
-            # Unpausing may fail if the channel is invalid; safe to ignore.
-            pass
+        for channel in self._get_channels():
+            if channel is None:  # All channels are busy
+                continue
+            try:
+                channel.unpause()
+            except pygame_error:
+                # Unpausing may fail if the channel is invalid; safe to ignore.
+                pass
         return self
 
     def get_channel_info(self) -> dict[str, Any]:
@@ -602,7 +896,53 @@ class Sound(Base):
             return False
         sound_data = self._sound.get(sound_type)
         if sound_data:
-            sound_data["file"].set_volume(volume)
+            if sound_data["file"] is not None:
+                sound_data["file"].set_volume(volume)
             sound_data["volume"] = volume
             return True
         return False
+
+
+class _SoundScheduler:
+    """
+    Playback scheduler state of a sound engine.
+
+    :param sound: Sound engine
+    :param rate_limit: Minimum time in seconds between two plays of the same sound type
+    :param rate_limits: Rate limit of specific sound types
+    :param reserve_channels: Reserve a mixer channel for each sound type
+    """
+
+    channels: dict[str, mixer.Channel]
+    last_time: dict[str, float]
+    queue: dict[str, dict[str, Any]]
+    rate_limit: NumberType
+    rate_limits: dict[str, NumberType]
+    reserve_channels: bool
+    stats: dict[str, int]
+
+    def __init__(
+        self,
+        sound: Sound,
+        rate_limit: NumberType,
+        rate_limits: dict[str, NumberType],
+        reserve_channels: bool,
+    ) -> None:
+        self.channels = _reserve_sound_channels(sound) if reserve_channels else {}
+        self.last_time = {}
+        self.queue = {}
+        self.rate_limit = rate_limit
+        self.rate_limits = dict(rate_limits)
+        self.reserve_channels = reserve_channels
+        self.stats = {"coalesced": 0, "dropped": 0, "played": 0}
+
+    def schedule(self, sound: dict[str, Any]) -> None:
+        """
+        Queue a sound, identical requests are coalesced.
+
+        :param sound: Sound to be played
+        """
+        if sound["type"] in self.queue:
+            self.stats["coalesced"] += 1
+        else:
+            self.queue[sound["type"]] = sound
@@ -27,6 +27,7 @@ from typing import TYPE_CHECKING, Any
 
 from pygame_menu._scrollarea import get_scrollbars_from_position
 from pygame_menu._types import (
+    ColorInputGradientType,
     ColorInputType,
     ColorType,
     CursorType,
@@ -39,7 +40,7 @@ from pygame_menu._types import (
     Tuple3IntType,
     VectorInstance,
 )
-from pygame_menu.baseimage import BaseImage
+from pygame_menu.baseimage import BaseImage, GradientImage
 from pygame_menu.font import FONT_OPEN_SANS, FontType, assert_font
 from pygame_menu.locals import (
     ALIGN_CENTER,
@@ -99,6 +100,22 @@ def _check_menubar_style(style: int) -> bool:
     )
 
 
+def _is_gradient(value: Any) -> bool:
+    """
+    Return ``True`` if the value is a gradient ``(from color, to color, vertical, forward)``.
+
+    :param value: Value
+    :return: ``True`` if gradient
+    """
+    return (
+        isinstance(value, VectorInstance)
+        and len(value) == 4
+        and not isinstance(value[0], NumberInstance)
+        and isinstance(value[2], bool)
+        and isinstance(value[3], bool)
+    )
+
+
 class Theme:
     """
     Class defining the visual rendering of menus and widgets.
@@ -119,7 +136,7 @@ class Theme:
         like rows/columns, enabling or disabling overflow, position, or Menu
         width/height see Menu parameters.
 
-    :param background_color: Menu background color
+    :param background_color: Menu background color. It can be a color, an image, or a gradient ``(from color, to color, vertical, forward)``; ``to color`` can be a list of colors for multi-stop gradients
     :type background_color: tuple, list, str, int, :py:class:`pygame.Color`, :py:class:`pygame_menu.baseimage.BaseImage`
     :param border_color: Menu border color. If border is an image, it will be split in 9 tiles to use top, left, bottom, right, and the corners
     :type border_color: tuple, list, str, int, :py:class:`pygame.Color`, :py:class:`pygame_menu.baseimage.BaseImage`, None
@@ -169,8 +186,8 @@ class Theme:
     :type surface_clear_color: tuple, list, str, int, :py:class:`pygame.Color`
     :param title: Title is enabled/disabled. If disabled the object is ``hidden``
     :type title: bool
-    :param title_background_color: Title background color
-    :type title_background_color: tuple, list, str, int, :py:class:`pygame.Color`
+    :param title_background_color: Title background color. It can be a color, an image, or a gradient ``(from color, to color, vertical, forward)``
+    :type title_background_color: tuple, list, str, int, :py:class:`pygame.Color`, :py:class:`pygame_menu.baseimage.BaseImage`
     :param title_bar_modify_scrollarea: If ``True`` title bar modifies the scrollbars of the scrollarea depending on the style
     :type title_bar_modify_scrollarea: bool
     :param title_bar_style: Style of the title, use :py:class:`pygame_menu.widgets.MenuBar` widget styles
@@ -209,7 +226,7 @@ class Theme:
     :type widget_alignment: str
     :param widget_alignment_ignore_scrollbar_thickness: Widget positioning ignores the scrollbar thickness. If ``True``, the widgets only consider the menu size, ignoring the thickness of the visible scrollbars
     :type widget_alignment_ignore_scrollbar_thickness: bool
-    :param widget_background_color: Background color of a widget, it can be a color, ``None`` (transparent), or a BaseImage object. Background fills the entire widget + the padding
+    :param widget_background_color: Background color of a widget, it can be a color, ``None`` (transparent), a gradient ``(from color, to color, vertical, forward)``, or a BaseImage object. Background fills the entire widget + the padding
     :type widget_background_color: tuple, list, str, int, :py:class:`pygame.Color`, :py:class:`pygame_menu.baseimage.BaseImage`, None
     :param widget_background_inflate: Inflate background on x-axis and y-axis (x, y) in px. By default, it uses the highlight margin. This parameter is visual only. For modifying widget size use padding instead
     :type widget_background_inflate: tuple, list
@@ -308,7 +325,7 @@ class Theme:
     selection_color: ColorType
     surface_clear_color: ColorType
     title: bool
-    title_background_color: ColorType
+    title_background_color: ColorType | BaseImage
     title_bar_modify_scrollarea: bool
     title_bar_style: int
     title_close_button: bool
@@ -402,7 +419,7 @@ class Theme:
         # Menubar/Title
         self.title = self._get(kwargs, "title", bool, True)
         self.title_background_color = self._get(
-            kwargs, "title_background_color", "color", (70, 70, 70)
+            kwargs, "title_background_color", "color_image", (70, 70, 70)
         )
         self.title_bar_modify_scrollarea = self._get(
             kwargs, "title_bar_modify_scrollarea", bool, True
@@ -650,7 +667,9 @@ class Theme:
 
         # Format colors, this converts all color lists to tuples automatically,
         # if it is an image, return the same object
-        self.background_color = self._format_color_opacity(self.background_color)
+        self.background_color = self._format_color_opacity(
+            self.background_color, gradient=True
+        )
         self.border_color = self._format_color_opacity(self.border_color, none=True)
         self.cursor_color = self._format_color_opacity(self.cursor_color)
         self.cursor_selection_color = self._format_color_opacity(
@@ -676,7 +695,7 @@ class Theme:
         self.selection_color = self._format_color_opacity(self.selection_color)
         self.surface_clear_color = self._format_color_opacity(self.surface_clear_color)
         self.title_background_color = self._format_color_opacity(
-            self.title_background_color
+            self.title_background_color, gradient=True
         )
         self.title_close_button_background_color = self._format_color_opacity(
             self.title_close_button_background_color
@@ -686,7 +705,7 @@ class Theme:
             self.title_font_shadow_color
         )
         self.widget_background_color = self._format_color_opacity(
-            self.widget_background_color, none=True
+            self.widget_background_color, none=True, gradient=True
         )
         self.widget_border_color = self._format_color_opacity(self.widget_border_color)
         self.widget_box_arrow_color = self._format_color_opacity(
@@ -872,7 +891,9 @@ class Theme:
 
     @staticmethod
     def _format_color_opacity(
-        color: ColorInputType | BaseImage | None, none: bool = False
+        color: ColorInputType | ColorInputGradientType | BaseImage | None,
+        none: bool = False,
+        gradient: bool = False,
     ) -> ColorType | BaseImage | None:
         """
         Adds opacity to a 3 channel color. (R,G,B) -> (R,G,B,A) if the color
@@ -883,13 +904,17 @@ class Theme:
 
         - If the color is a list, return a tuple.
         - If the color is ``None``, return ``None`` if ``None`` is True.
+        - If the color is a gradient, return a :py:class:`pygame_menu.baseimage.GradientImage` if ``gradient`` is True.
 
         :param color: Color object
         :param none: If ``True`` Color can be ``None``
+        :param gradient: If ``True`` Color can be a gradient
         :return: Color in the same format
         """
         if isinstance(color, BaseImage):
             return color
+        elif gradient and _is_gradient(color):
+            return GradientImage(*color)
         elif color is None and none:
             return color
         color = format_color(color)
@@ -921,8 +946,8 @@ class Theme:
             -   alignment           – pygame-menu alignment (locals)
             -   callable            – Is callable type, same as ``"function"``
             -   color               – Check color
-            -   color_image         – Color or :py:class:`pygame_menu.baseimage.BaseImage`
-            -   color_image_none    – Color, :py:class:`pygame_menu.baseimage.BaseImage`, or None
+            -   color_image         – Color, gradient, or :py:class:`pygame_menu.baseimage.BaseImage`
+            -   color_image_none    – Color, gradient, :py:class:`pygame_menu.baseimage.BaseImage`, or None
             -   color_none          – Color or None
             -   cursor              – Cursor object (pygame)
             -   font                – Font type
@@ -962,11 +987,15 @@ class Theme:
                     value = assert_color(value)
 
                 elif val_type == "color_image":
-                    if not isinstance(value, BaseImage):
+                    if _is_gradient(value):
+                        value = GradientImage(*value)
+                    elif not isinstance(value, BaseImage):
                         value = assert_color(value)
 
                 elif val_type == "color_image_none":
-                    if not (value is None or isinstance(value, BaseImage)):
+                    if _is_gradient(value):
+                        value = GradientImage(*value)
+                    elif not (value is None or isinstance(value, BaseImage)):
                         value = assert_color(value)
 
                 elif val_type == "color_none":
@@ -1022,59 +1051,79 @@ class Theme:
         return value
 
 
-THEME_DEFAULT = Theme()
-
-THEME_DARK = Theme(
-    background_color=(40, 41, 35),
-    cursor_color=(255, 255, 255),
-    cursor_selection_color=(80, 80, 80, 120),
-    scrollbar_color=(39, 41, 42),
-    scrollbar_slider_color=(65, 66, 67),
-    scrollbar_slider_hover_color=(90, 89, 88),
-    selection_color=(255, 255, 255),
-    title_background_color=(47, 48, 51),
-    title_font_color=(215, 215, 215),
-    widget_font_color=(200, 200, 200),
-)
-
-THEME_BLUE = Theme(
-    background_color=(228, 230, 246),
-    scrollbar_shadow=True,
-    scrollbar_slider_color=(150, 200, 230),
-    scrollbar_slider_hover_color=(123, 173, 202),
-    scrollbar_slider_pad=2,
-    selection_color=(100, 62, 132),
-    title_background_color=(62, 149, 195),
-    title_font_color=(228, 230, 246),
-    title_font_shadow=True,
-    widget_font_color=(61, 170, 220),
-)
-
-THEME_GREEN = Theme(
-    background_color=(186, 214, 177),
-    scrollbar_slider_color=(125, 121, 114),
-    scrollbar_slider_hover_color=(100, 96, 90),
-    scrollbar_slider_pad=2,
-    selection_color=(125, 121, 114),
-    title_background_color=(125, 121, 114),
-    title_font_color=(228, 230, 246),
-    widget_font_color=(255, 255, 255),
-)
-
-THEME_ORANGE = Theme(
-    background_color=(228, 100, 36),
-    selection_color=(255, 255, 255),
-    title_background_color=(170, 65, 50),
-    widget_font_color=(0, 0, 0),
-    widget_font_size=30,
-)
+# Predefined themes, built on first access
+if TYPE_CHECKING:
+    THEME_BLUE: Theme
+    THEME_DARK: Theme
+    THEME_DEFAULT: Theme
+    THEME_GREEN: Theme
+    THEME_ORANGE: Theme
+    THEME_SOLARIZED: Theme
+
+_THEMES: dict[str, dict[str, Any]] = {
+    "THEME_DEFAULT": {},
+    "THEME_DARK": {
+        "background_color": (40, 41, 35),
+        "cursor_color": (255, 255, 255),
+        "cursor_selection_color": (80, 80, 80, 120),
+        "scrollbar_color": (39, 41, 42),
+        "scrollbar_slider_color": (65, 66, 67),
+        "scrollbar_slider_hover_color": (90, 89, 88),
+        "selection_color": (255, 255, 255),
+        "title_background_color": (47, 48, 51),
+        "title_font_color": (215, 215, 215),
+        "widget_font_color": (200, 200, 200),
+    },
+    "THEME_BLUE": {
+        "background_color": (228, 230, 246),
+        "scrollbar_shadow": True,
+        "scrollbar_slider_color": (150, 200, 230),
+        "scrollbar_slider_hover_color": (123, 173, 202),
+        "scrollbar_slider_pad": 2,
+        "selection_color": (100, 62, 132),
+        "title_background_color": (62, 149, 195),
+        "title_font_color": (228, 230, 246),
+        "title_font_shadow": True,
+        "widget_font_color": (61, 170, 220),
+    },
+    "THEME_GREEN": {
+        "background_color": (186, 214, 177),
+        "scrollbar_slider_color": (125, 121, 114),
+        "scrollbar_slider_hover_color": (100, 96, 90),
+        "scrollbar_slider_pad": 2,
+        "selection_color": (125, 121, 114),
+        "title_background_color": (125, 121, 114),
+        "title_font_color": (228, 230, 246),
+        "widget_font_color": (255, 255, 255),
+    },
+    "THEME_ORANGE": {
+        "background_color": (228, 100, 36),
+        "selection_color": (255, 255, 255),
+        "title_background_color": (170, 65, 50),
+        "widget_font_color": (0, 0, 0),
+        "widget_font_size": 30,
+    },
+    "THEME_SOLARIZED": {
+        "background_color": (239, 231, 211),
+        "cursor_color": (0, 0, 0),
+        "cursor_selection_color": (146, 160, 160, 120),
+        "selection_color": (207, 62, 132),
+        "title_background_color": (4, 47, 58),
+        "title_font_color": (38, 158, 151),
+        "widget_font_color": (102, 122, 130),
+    },
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Build the predefined themes on first access.
 
-THEME_SOLARIZED = Theme(
-    background_color=(239, 231, 211),
-    cursor_color=(0, 0, 0),
-    cursor_selection_color=(146, 160, 160, 120),
-    selection_color=(207, 62, 132),
-    title_background_color=(4, 47, 58),
-    title_font_color=(38, 158, 151),
-    widget_font_color=(102, 122, 130),
-)
+    :param name: Attribute name
+    :return: Attribute value
+    """
+    if name not in _THEMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    theme = Theme(**_THEMES[name])
+    globals()[name] = theme
+    return theme
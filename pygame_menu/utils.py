@@ -20,15 +20,22 @@ __all__ = [
     "assert_vector",
     "check_key_pressed_valid",
     "configure_alpha",
+    "configure_display_optimization",
+    "configure_menu_retention",
+    "configure_surface_pool",
     "fill_gradient",
     "format_color",
     "get_cursor",
     "get_finger_pos",
+    "get_surface_pool",
     "load_pygame_image_file",
+    "make_gradient",
     "make_surface",
     "mouse_motion_current_mouse_position",
+    "optimize_surface",
     "parse_padding",
     "print_menu_widget_structure",
+    "release_surface",
     "set_pygame_cursor",
     "uuid4",
     "warn",
@@ -37,6 +44,7 @@ __all__ = [
     "PYGAME_V2",
     # Classes
     "ShadowGenerator",
+    "SurfacePool",
     "TerminalColors",
 ]
 
@@ -44,6 +52,8 @@ import sys
 import traceback
 import uuid
 import warnings
+import weakref
+from collections import OrderedDict
 from typing import Any
 
 import pygame
@@ -88,6 +98,11 @@ from pygame_menu.locals import (
 )
 
 _ALPHA_CHANNEL: list[bool] = [True]
+_DISPLAY_OPTIMIZATION: list[bool] = [False]
+_GRADIENT_CACHE: dict[tuple[Any, ...], pygame.Surface] = {}
+_GRADIENT_CACHE_SIZE = 32
+_MENU_RETENTION_BUDGET: list[int] = [32 * 1024 * 1024]
+_SURFACE_POOL: list[SurfacePool | None] = [None]
 PYGAME_V2 = pygame.version.vernum[0] >= 2
 WARNINGS_LAST_MESSAGES: dict[int, bool] = {}
 
@@ -270,10 +285,63 @@ def configure_alpha(state: bool) -> None:
     _ALPHA_CHANNEL[0] = state
 
 
+def configure_display_optimization(state: bool) -> None:
+    """
+    Configures the display optimization mode. If enabled, image and opaque widget
+    surfaces are converted to the display pixel format once a display exists,
+    see :py:func:`pygame_menu.utils.optimize_surface`.
+
+    :param state: State on/off
+    """
+    assert isinstance(state, bool)
+    _DISPLAY_OPTIMIZATION[0] = state
+
+
+def configure_menu_retention(max_bytes: int) -> None:
+    """
+    Configures the memory budget of the inactive menus. Each Menu retains its
+    widget surface and layout while other Menu is displayed, thus, going back to
+    an unchanged Menu does not rebuild it. If the retained surfaces exceed the
+    budget, the least recently displayed menus release them.
+
+    :param max_bytes: Memory budget in bytes. If ``0`` the inactive menus do not retain their surface
+    """
+    assert isinstance(max_bytes, int)
+    assert max_bytes >= 0, "max bytes cannot be negative"
+    _MENU_RETENTION_BUDGET[0] = max_bytes
+
+
+def configure_surface_pool(state: bool, max_surfaces: int = 64) -> None:
+    """
+    Configures the surface pool. If enabled, :py:func:`pygame_menu.utils.make_surface`
+    reuses the surfaces the widgets release on re-render, instead of allocating
+    new ones. See :py:class:`pygame_menu.utils.SurfacePool`.
+
+    :param state: State on/off. Disabling the pool discards its surfaces
+    :param max_surfaces: Maximum number of surfaces retained by the pool
+    """
+    assert isinstance(state, bool)
+    _SURFACE_POOL[0] = SurfacePool(max_surfaces) if state else None
+
+
+def _display_optimization_available() -> bool:
+    """
+    Return ``True`` if the display optimization is enabled and a display surface
+    exists, thus, surfaces can be converted to its pixel format.
+
+    :return: ``True`` if available
+    """
+    return (
+        _DISPLAY_OPTIMIZATION[0]
+        and pygame.display.get_init()
+        and pygame.display.get_surface() is not None
+    )
+
+
 def fill_gradient(
     surface: pygame.Surface,
     color: ColorInputType,
-    gradient: ColorInputType,
+    gradient: ColorInputType | list[ColorInputType] | tuple[ColorInputType, ...],
     rect: pygame.Rect | None = None,
     vertical: bool = True,
     forward: bool = True,
@@ -281,45 +349,31 @@ def fill_gradient(
     """
     Fill a surface with a gradient pattern.
 
+    .. note::
+
+        The gradient is computed once for each size and colors, see
+        :py:func:`pygame_menu.utils.make_gradient`, thus, filling a surface
+        costs a blit.
+
     :param surface: Surface to fill
     :param color: Starting color
-    :param gradient: Final color
+    :param gradient: Final color, or list of colors (the last is the final) for a multi-stop gradient
     :param rect: Area to fill; default is surface's rect
     :param vertical: True=vertical; False=horizontal
     :param forward: True=forward; False=reverse
     """
     if rect is None:
         rect = surface.get_rect()
-    x1, x2 = rect.left, rect.right
-    y1, y2 = rect.top, rect.bottom
-    color = assert_color(color)
-    gradient = assert_color(gradient)
-    if vertical:
-        h = y2 - y1
-    else:
-        h = x2 - x1
-    if forward:
-        a, b = color, gradient
+    if isinstance(gradient, VectorInstance) and not (
+        len(gradient) > 0 and isinstance(gradient[0], NumberInstance)
+    ):
+        colors = (color, *gradient)
     else:
-        b, a = color, gradient
-    rate = (float(b[0] - a[0]) / h, float(b[1] - a[1]) / h, float(b[2] - a[2]) / h)
-    fn_line = pygame.draw.line
-    if vertical:
-        for line in range(y1, y2):
-            color = (
-                int(min(max(a[0] + (rate[0] * (line - y1)), 0), 255)),
-                int(min(max(a[1] + (rate[1] * (line - y1)), 0), 255)),
-                int(min(max(a[2] + (rate[2] * (line - y1)), 0), 255)),
-            )
-            fn_line(surface, color, (x1, line), (x2, line))
-    else:
-        for col in range(x1, x2):
-            color = (
-                int(min(max(a[0] + (rate[0] * (col - x1)), 0), 255)),
-                int(min(max(a[1] + (rate[1] * (col - x1)), 0), 255)),
-                int(min(max(a[2] + (rate[2] * (col - x1)), 0), 255)),
-            )
-            fn_line(surface, color, (col, y1), (col, y2))
+        colors = (color, gradient)
+    if rect.width <= 0 or rect.height <= 0:
+        return
+    gradient_surface = make_gradient(rect.width, rect.height, colors, vertical, forward)
+    surface.blit(gradient_surface, rect)
 
 
 def format_color(
@@ -414,6 +468,15 @@ def is_callable(func: Any) -> bool:
     return callable(func)
 
 
+def get_surface_pool() -> SurfacePool | None:
+    """
+    Return the surface pool, or ``None`` if it is disabled.
+
+    :return: Surface pool
+    """
+    return _SURFACE_POOL[0]
+
+
 def load_pygame_image_file(image_path: str, **kwargs) -> pygame.Surface:
     """
     Loads an image and returns a surface.
@@ -464,6 +527,75 @@ def load_pygame_image_file(image_path: str, **kwargs) -> pygame.Surface:
     return surface
 
 
+def _make_gradient_strip(
+    length: int, colors: tuple[tuple[int, int, int], ...], vertical: bool
+) -> pygame.Surface:
+    """
+    Create a 1 px wide gradient strip, the colors are evenly spaced.
+
+    :param length: Strip length in px
+    :param colors: Color stops (R, G, B)
+    :param vertical: If ``True`` the strip is vertical
+    :return: Strip surface
+    """
+    segments = len(colors) - 1
+    seg_length = length / segments
+    data = bytearray(3 * length)
+    for i in range(length):
+        k = min(int(i / seg_length), segments - 1)
+        a, b = colors[k], colors[k + 1]
+        p = i - k * seg_length
+        for c in range(3):
+            rate = float(b[c] - a[c]) / seg_length
+            data[3 * i + c] = int(min(max(a[c] + rate * p, 0), 255))
+    size = (1, length) if vertical else (length, 1)
+    return pygame.image.frombuffer(bytes(data), size, "RGB")
+
+
+def make_gradient(
+    width: int,
+    height: int,
+    colors: list[ColorInputType] | tuple[ColorInputType, ...],
+    vertical: bool = True,
+    forward: bool = True,
+) -> pygame.Surface:
+    """
+    Create a gradient surface. A 1 px strip is computed and scaled to the size,
+    the results are cached by size, colors and direction.
+
+    .. note::
+
+        The returned surface is shared by the cache, thus, it must not be modified.
+
+    :param width: Surface width in px
+    :param height: Surface height in px
+    :param colors: Colors of the gradient, at least two. These are evenly spaced (multi-stop gradient)
+    :param vertical: True=vertical; False=horizontal
+    :param forward: True=forward; False=reverse
+    :return: Gradient surface
+    """
+    assert isinstance(width, int) and isinstance(height, int)
+    assert width > 0 and height > 0, (
+        "gradient width and height must be greater than zero"
+    )
+    assert isinstance(colors, VectorInstance) and len(colors) >= 2, (
+        "gradient must have at least two colors"
+    )
+    assert isinstance(vertical, bool) and isinstance(forward, bool)
+    colors = tuple(tuple(assert_color(c)[0:3]) for c in colors)
+    key = (width, height, colors, vertical, forward)
+    surface = _GRADIENT_CACHE.get(key)
+    if surface is None:
+        if not forward:
+            colors = colors[::-1]
+        strip = _make_gradient_strip(height if vertical else width, colors, vertical)
+        surface = optimize_surface(pygame.transform.scale(strip, (width, height)))
+        if len(_GRADIENT_CACHE) >= _GRADIENT_CACHE_SIZE:
+            del _GRADIENT_CACHE[next(iter(_GRADIENT_CACHE))]
+        _GRADIENT_CACHE[key] = surface
+    return surface
+
+
 def make_surface(
     width: NumberType,
     height: NumberType,
@@ -478,6 +610,11 @@ def make_surface(
     :param alpha: Enable alpha channel on surface
     :param fill_color: Fill surface with a certain color
     :return: Pygame surface
+
+    .. note::
+
+        If the surface pool is enabled (see :py:func:`pygame_menu.utils.configure_surface_pool`)
+        the surface may be a recycled one, cleared or filled as a new surface.
     """
     assert isinstance(width, NumberInstance)
     assert isinstance(height, NumberInstance)
@@ -485,13 +622,41 @@ def make_surface(
     assert width >= 0 and height >= 0, (
         "surface width and height must be equal or greater than zero"
     )
-    surface = pygame.Surface((int(width), int(height)), pygame.SRCALPHA, 32)
+    width, height = int(width), int(height)
+    if fill_color is not None:
+        fill_color = assert_color(fill_color)
+    pool = _SURFACE_POOL[0]
+
+    # Opaque surfaces use the display format, which is faster to blit
+    if (
+        not alpha
+        and fill_color is not None
+        and fill_color[3] == 255
+        and _display_optimization_available()
+    ):
+        depth = pygame.display.get_surface().get_bitsize()
+        surface = None if pool is None else pool.acquire(width, height, 0, depth)
+        try:
+            if surface is None:
+                surface = pygame.Surface((width, height)).convert()
+        except pygame.error:
+            pass
+        else:
+            surface.fill(fill_color)
+            return surface if pool is None else pool.register(surface)
+
+    surface = None
+    if pool is not None:
+        surface = pool.acquire(width, height, pygame.SRCALPHA, 32)
+        if surface is not None:
+            surface.fill(fill_color if fill_color is not None else (0, 0, 0, 0))
+            return surface
+    surface = pygame.Surface((width, height), pygame.SRCALPHA, 32)
     if alpha and _ALPHA_CHANNEL[0]:
         surface = pygame.Surface.convert_alpha(surface)
     if fill_color is not None:
-        fill_color = assert_color(fill_color)
         surface.fill(fill_color)
-    return surface
+    return surface if pool is None else pool.register(surface)
 
 
 def mouse_motion_current_mouse_position() -> EventType:
@@ -504,6 +669,45 @@ def mouse_motion_current_mouse_position() -> EventType:
     return pygame.event.Event(pygame.MOUSEMOTION, {"pos": (int(x), int(y))})
 
 
+def optimize_surface(surface: pygame.Surface) -> pygame.Surface:
+    """
+    Convert a surface to the display pixel format, so it does not need to be
+    converted on each blit. Colorkeyed and sparse (mostly transparent) surfaces
+    are also RLE accelerated. Fully opaque surfaces lose their alpha channel.
+
+    .. note::
+
+        The surface is returned unchanged if the display optimization is disabled
+        (see :py:func:`pygame_menu.utils.configure_display_optimization`), if there
+        is no display yet, or if the conversion fails (for example, within some
+        headless drivers).
+
+    :param surface: Surface to optimize
+    :return: Optimized surface; it may be the same object
+    """
+    assert isinstance(surface, pygame.Surface)
+    if not _display_optimization_available():
+        return surface
+    colorkey = surface.get_colorkey()
+    try:
+        if colorkey is not None:
+            optimized = surface.convert()
+            optimized.set_colorkey(colorkey, pygame.RLEACCEL)
+        elif surface.get_flags() & pygame.SRCALPHA:
+            area = surface.get_width() * surface.get_height()
+            if pygame.mask.from_surface(surface, 254).count() == area:
+                optimized = surface.convert()
+            else:
+                optimized = surface.convert_alpha()
+                if 2 * pygame.mask.from_surface(surface).count() < area:
+                    optimized.set_alpha(255, pygame.RLEACCEL)
+        else:
+            optimized = surface.convert()
+    except pygame.error:
+        return surface
+    return optimized
+
+
 def parse_padding(padding: PaddingType) -> Tuple4IntType:
     """
     Get the padding value from tuple.
@@ -638,6 +842,18 @@ def print_menu_widget_structure(
     close_frames(0)
 
 
+def release_surface(surface: pygame.Surface | None) -> None:
+    """
+    Return a surface created by :py:func:`pygame_menu.utils.make_surface` to the
+    surface pool, if enabled. The surface must not be used after its release.
+
+    :param surface: Surface no longer used. If ``None`` does nothing
+    """
+    pool = _SURFACE_POOL[0]
+    if pool is not None and surface is not None:
+        pool.release(surface)
+
+
 def set_pygame_cursor(cursor: CursorInputType) -> None:  # type: ignore
     """
     Set pygame cursor.
@@ -1153,3 +1369,134 @@ class ShadowGenerator:
         final_surface = pygame.transform.smoothscale(shadow_surface, (width, height))
         self._created_ellipse_shadows[ellipse_id] = final_surface
         return final_surface
+
+
+class SurfacePool:
+    """
+    Pool of surfaces keyed by size, flags and depth. Widgets release the surfaces
+    created by :py:func:`pygame_menu.utils.make_surface` once re-rendered, and later
+    calls reuse them instead of allocating new ones. Only the surfaces created
+    while the pool is enabled are accepted. If the pool is full, the least recently
+    released surfaces are discarded.
+
+    .. note::
+
+        A released surface may be handed out again, thus, it must not be drawn
+        or referenced after its release (for example, the one returned by
+        :py:meth:`pygame_menu.widgets.core.widget.Widget.get_surface`).
+
+    :param max_surfaces: Maximum number of retained surfaces
+    """
+
+    _max_surfaces: int
+    _owned: weakref.WeakSet[pygame.Surface]
+    _retained: int
+    _stats: dict[str, int]
+    _surfaces: OrderedDict[tuple[int, int, int, int], list[pygame.Surface]]
+
+    def __init__(self, max_surfaces: int = 64) -> None:
+        assert isinstance(max_surfaces, int)
+        assert max_surfaces > 0, "max surfaces must be greater than zero"
+        self._max_surfaces = max_surfaces
+        self._owned = weakref.WeakSet()
+        self._retained = 0
+        self._stats = {"discarded": 0, "missed": 0, "released": 0, "reused": 0}
+        self._surfaces = OrderedDict()
+
+    def __len__(self) -> int:
+        return self._retained
+
+    def acquire(
+        self, width: int, height: int, flags: int, depth: int
+    ) -> pygame.Surface | None:
+        """
+        Take a retained surface from the pool. Its contents are not cleared.
+
+        :param width: Surface width
+        :param height: Surface height
+        :param flags: Surface flags, only ``pygame.SRCALPHA`` is considered
+        :param depth: Surface bit depth
+        :return: Surface, or ``None`` if the pool has no surface of that kind
+        """
+        key = (width, height, flags & pygame.SRCALPHA, depth)
+        surfaces = self._surfaces.get(key)
+        if not surfaces:
+            self._stats["missed"] += 1
+            return None
+        surface = surfaces.pop()
+        if not surfaces:
+            del self._surfaces[key]
+        self._retained -= 1
+        self._stats["reused"] += 1
+        surface.set_colorkey(None)
+        surface.set_alpha(255 if flags & pygame.SRCALPHA else None)
+        return surface
+
+    def register(self, surface: pygame.Surface) -> pygame.Surface:
+        """
+        Mark a surface as created for the pool, so it can be released later.
+
+        :param surface: Surface
+        :return: The same surface
+        """
+        self._owned.add(surface)
+        return surface
+
+    def release(self, surface: pygame.Surface) -> bool:
+        """
+        Return a surface to the pool.
+
+        :param surface: Surface no longer used
+        :return: ``True`` if the surface has been retained
+        """
+        assert isinstance(surface, pygame.Surface)
+        if (
+            surface not in self._owned
+            or surface.get_width() == 0
+            or surface.get_height() == 0
+            or surface.get_locked()
+        ):
+            return False
+        key = (
+            surface.get_width(),
+            surface.get_height(),
+            surface.get_flags() & pygame.SRCALPHA,
+            surface.get_bitsize(),
+        )
+        surfaces = self._surfaces.setdefault(key, [])
+        for s in surfaces:
+            if s is surface:  # Already released
+                return False
+        surfaces.append(surface)
+        self._surfaces.move_to_end(key)
+        self._retained += 1
+        self._stats["released"] += 1
+
+        # Discard the least recently released surfaces
+        while self._retained > self._max_surfaces:
+            oldest = next(iter(self._surfaces))
+            self._surfaces[oldest].pop(0)
+            if not self._surfaces[oldest]:
+                del self._surfaces[oldest]
+            self._retained -= 1
+            self._stats["discarded"] += 1
+        return True
+
+    def clear(self) -> None:
+        """
+        Discard all retained surfaces.
+        """
+        self._stats["discarded"] += self._retained
+        self._surfaces.clear()
+        self._retained = 0
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Return the pool statistics: number of ``reused`` and ``missed`` surface
+        requests, and ``released``, ``discarded`` and ``retained`` surfaces.
+
+        :return: Statistics
+        """
+        stats = self._stats.copy()
+        stats["retained"] = self._retained
+        return stats
@@ -31,6 +31,7 @@ from pygame_menu.widgets.widget import (
     HMargin,
     Image,
     Label,
+    ListView,
     MenuBar,
     MenuLink,
     NoneWidget,
@@ -30,6 +30,7 @@ __all__ = [
 import random
 import time
 from collections.abc import Callable
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, Optional, Union
 
 import pygame
@@ -58,6 +59,7 @@ from pygame_menu._types import (
     VectorInstance,
 )
 from pygame_menu.controls import Controller
+from pygame_menu.font import measure_text
 from pygame_menu.locals import (
     ALIGN_CENTER,
     POSITION_CENTER,
@@ -102,6 +104,14 @@ WIDGET_MOUSEOVER: list[Any] = [None, []]
 WIDGET_TOP_CURSOR: list[Any] = [None]
 WIDGET_TOP_CURSOR_WARNING = False
 
+# Mouse motion event reused by the mouseleave check if no event is provided, this
+# avoids creating a new event on each frame. It is never passed to the callbacks
+_MOUSELEAVE_EVENT = pygame.event.Event(pygame.MOUSEMOTION, {"pos": (0, 0)})
+
+# Increased each time a widget changes its selectable/visible status or its frame,
+# used by the Menu to invalidate the selection lookup table
+_SELECTION_VERSION: list[int] = [0]
+
 WIDGET_BORDER_POSITION_NONE = "border-none"
 WIDGET_BORDER_POSITION_FULL = "border-position-border-full"
 WIDGET_FULL_BORDER = (POSITION_NORTH, POSITION_SOUTH, POSITION_EAST, POSITION_WEST)
@@ -144,7 +154,8 @@ def _check_widget_mouseleave(
         return
 
     if event is None:
-        event = mouse_motion_current_mouse_position()
+        event = _MOUSELEAVE_EVENT
+        event.pos = pygame.mouse.get_pos()
 
     # Check widget is still over
     current: Widget = WIDGET_MOUSEOVER[0]
@@ -271,6 +282,13 @@ class Widget(Base):
 
         Widget cannot be copied or deep-copied.
 
+    .. note::
+
+        The core state of the widget is stored in ``__slots__``, and auxiliary
+        objects (decorator, sound engine, callbacks and shadow) are only created
+        once used. Subclasses keep an instance ``__dict__`` for their own
+        attributes.
+
     :param title: Widget title
     :param widget_id: Widget identifier
     :param onchange: Callback when updating the status of the widget, executed in :py:meth:`pygame_menu.widgets.core.widget.Widget.change`
@@ -280,6 +298,98 @@ class Widget(Base):
     :param kwargs: Optional keyword arguments
     """
 
+    __slots__ = (
+        "_accept_events",
+        "_alignment",
+        "_angle",
+        "_args",
+        "_background_color",
+        "_background_inflate",
+        "_background_surface",
+        "_border_color",
+        "_border_inflate",
+        "_border_position",
+        "_border_width",
+        "_check_mouseleave_call_render",
+        "_col_row_index",
+        "_ctrl",
+        "_cursor",
+        "_decorator_obj",
+        "_default_value",
+        "_draw_callbacks",
+        "_events",
+        "_flip",
+        "_floating",
+        "_floating_origin_position",
+        "_font",
+        "_font_antialias",
+        "_font_background_color",
+        "_font_color",
+        "_font_name",
+        "_font_readonly_color",
+        "_font_readonly_selected_color",
+        "_font_selected_color",
+        "_font_shadow",
+        "_font_shadow_color",
+        "_font_shadow_offset",
+        "_font_shadow_position",
+        "_font_shadow_tuple",
+        "_font_size",
+        "_frame",
+        "_joystick_enabled",
+        "_keyboard_enabled",
+        "_keyboard_ignore_nonphysical",
+        "_kwargs",
+        "_last_render_hash",
+        "_margin",
+        "_max_height",
+        "_max_width",
+        "_menu",
+        "_menu_hook",
+        "_mouse_enabled",
+        "_mouseleave_called",
+        "_mouseover",
+        "_mouseover_called",
+        "_mouseover_check_rect",
+        "_onchange",
+        "_onmouseleave",
+        "_onmouseover",
+        "_onreturn",
+        "_onselect",
+        "_padding",
+        "_padding_transform",
+        "_position",
+        "_rect",
+        "_rect_size_delta",
+        "_scale",
+        "_scale_factor",
+        "_scrollarea",
+        "_selectable",
+        "_selected",
+        "_selection_effect",
+        "_selection_effect_draw_post",
+        "_selection_time",
+        "_shadow",
+        "_sound_obj",
+        "_surface",
+        "_tab_size",
+        "_title",
+        "_touchscreen_enabled",
+        "_translate",
+        "_translate_virtual",
+        "_update_callbacks",
+        "_visible",
+        "active",
+        "configured",
+        "force_menu_draw_focus",
+        "is_scrollable",
+        "last_surface",
+        "lock_position",
+        "readonly",
+        "receive_menu_update_events",
+        "selection_expand_background",
+    )
+
     _alignment: str
     _angle: NumberType
     _args: list[Any]
@@ -294,9 +404,11 @@ class Widget(Base):
     _col_row_index: Tuple3IntType
     _ctrl: Controller
     _cursor: CursorType  # type: ignore
-    _decorator: Decorator
+    _decorator_obj: Decorator | None
     _default_value: Any
-    _draw_callbacks: dict[str, Callable[[Widget, pygame_menu.Menu | None], Any]]
+    _draw_callbacks: (
+        dict[str, Callable[[Widget, pygame_menu.Menu | None], Any]] | None
+    )
     _events: EventListType
     _flip: Tuple2BoolType
     _floating: bool
@@ -345,21 +457,22 @@ class Widget(Base):
     _rect_size_delta: Tuple2IntType
     _scale: list[bool | NumberType]
     _scrollarea: pygame_menu._scrollarea.ScrollArea | None  # Parent scrollarea
+    _selectable: bool
     _selected: bool
     _selection_effect: Selection
     _selection_effect_draw_post: bool
     _selection_time: NumberType
     _shadow: WidgetShadowType
-    _sound: Sound
+    _sound_obj: Sound | None
     _surface: pygame.Surface | None
     _tab_size: int
     _title: str
     _touchscreen_enabled: bool
     _translate: Tuple2IntType  # Translation made by user
     _translate_virtual: Tuple2IntType  # Virtual translation applied by api
-    _update_callbacks: dict[
-        str, Callable[[EventListType, Widget, pygame_menu.Menu], Any]
-    ]
+    _update_callbacks: (
+        dict[str, Callable[[EventListType, Widget, pygame_menu.Menu], Any]] | None
+    )
     configured: bool
     force_menu_draw_focus: bool
     last_surface: pygame.Surface | None
@@ -398,8 +511,8 @@ class Widget(Base):
         self._check_mouseleave_call_render = False
         self._col_row_index = (-1, -1, -1)
         self._cursor = None
-        self._decorator = Decorator(self)
-        self._default_value = _WidgetNoValue()
+        self._decorator_obj = None  # Created on first use, see _decorator
+        self._default_value = _NO_VALUE
         self._events = []
         self._frame = None
         self._margin = (0, 0)
@@ -414,7 +527,7 @@ class Widget(Base):
         self._scrollarea = None  # Widget scrollarea container
         self._selected = False  # Use select() to modify this status
         self._selection_time = 0
-        self._sound = Sound()
+        self._sound_obj = None  # Created on first use, see _sound
         self._tab_size = 0  # Tab spaces
         self._title = str(title)
         self._visible = visible  # Use show() or hide() to modify this status
@@ -425,8 +538,8 @@ class Widget(Base):
         self._floating_origin_position = False
 
         # Which function is used to get the rect which checks if the widget is
-        # active or not
-        self._mouseover_check_rect = lambda: self.get_rect(to_real_position=True)
+        # active or not. If None, the real widget rect is used
+        self._mouseover_check_rect = None
 
         # Widget transforms
         self._angle = 0  # Rotation angle (degrees)
@@ -447,9 +560,9 @@ class Widget(Base):
         self._rect = pygame.Rect(0, 0, 0, 0)
         self._rect_size_delta = (0, 0)  # Size added to rect width/height
 
-        # Callbacks
-        self._draw_callbacks = {}
-        self._update_callbacks = {}
+        # Callbacks, the dicts are created once a callback is added
+        self._draw_callbacks = None
+        self._update_callbacks = None
 
         self.set_onchange(onchange)
         self.set_onmouseleave(onmouseleave)
@@ -487,13 +600,8 @@ class Widget(Base):
         self._font_shadow_position = POSITION_NORTHWEST
         self._font_shadow_tuple = (0, 0)  # (x px offset, y px offset)
 
-        # Widget shadow
-        self._shadow = {
-            "enabled": False,
-            "properties": (),
-            "rect": None,
-            "surface": None,
-        }
+        # Widget shadow, the dict is created once configured by shadow()
+        self._shadow = _NO_SHADOW
 
         # Border
         self._border_color = (0, 0, 0)
@@ -531,7 +639,7 @@ class Widget(Base):
         self.is_scrollable = (
             scrollable  # Some widgets can be scrolled, such as the Frame
         )
-        self.is_selectable = selectable  # Some widgets cannot be selected like labels
+        self._selectable = selectable  # Some widgets cannot be selected like labels
         self.last_surface = None  # Stores the last surface the widget has been drawn
         self.lock_position = False  # If True, the widget don't update the position if .set_position() is executed
         self.readonly = False  # If True, widget ignores all input
@@ -783,7 +891,11 @@ class Widget(Base):
             return True
 
         if rect is None:
-            rect = self._mouseover_check_rect()
+            rect = (
+                self.get_rect(to_real_position=True)
+                if self._mouseover_check_rect is None
+                else self._mouseover_check_rect()
+            )
         updated: bool = False
 
         # Check if menu is active
@@ -805,6 +917,8 @@ class Widget(Base):
         else:
             if self._mouseover:
                 self._mouseover = False
+                if event is _MOUSELEAVE_EVENT:  # Callbacks receive their own event
+                    event = mouse_motion_current_mouse_position()
                 self.mouseleave(event, check_all_widget_mouseleave)
                 updated = True
 
@@ -831,6 +945,28 @@ class Widget(Base):
         """
         return self._sound
 
+    @property
+    def _sound(self) -> Sound:
+        """
+        Return the Widget sound engine, which is created on first use.
+
+        :return: Sound API
+        """
+        if self._sound_obj is None:
+            self._sound_obj = Sound()
+        return self._sound_obj
+
+    @property
+    def _decorator(self) -> Decorator:
+        """
+        Return the Widget decorator, which is created on first use.
+
+        :return: Decorator API
+        """
+        if self._decorator_obj is None:
+            self._decorator_obj = Decorator(self)
+        return self._decorator_obj
+
     def is_selected(self) -> bool:
         """
         Return ``True`` if the Widget is selected.
@@ -847,6 +983,22 @@ class Widget(Base):
         """
         return self
 
+    @property
+    def is_selectable(self) -> bool:
+        """
+        Return ``True`` if the Widget can be selected. Some widgets, like labels,
+        cannot be selected.
+
+        :return: Selectable status
+        """
+        return self._selectable
+
+    @is_selectable.setter
+    def is_selectable(self, selectable: bool) -> None:
+        if selectable != self._selectable:
+            _SELECTION_VERSION[0] += 1
+        self._selectable = selectable
+
     def is_visible(self, check_frame: bool = True) -> bool:
         """
         Return ``True`` if the Widget is visible.
@@ -930,7 +1082,8 @@ class Widget(Base):
             # an Error. The usage of _widgets_surface_need_update is only on
             # Menu _render()
             self._menu._widgets_surface_need_update = True
-        self._shadow["surface"] = None
+        if self._shadow["surface"] is not None:
+            self._shadow["surface"] = None
         return self
 
     def force_menu_surface_cache_update(self) -> Widget:
@@ -951,7 +1104,8 @@ class Widget(Base):
             # Menu _widget_surface_cache_need_update property is only accessed on
             # draw method. This does not set _menu._widgets_surface to None
             self._menu._widget_surface_cache_need_update = True
-            self._decorator.force_cache_update()
+            if self._decorator_obj is not None:
+                self._decorator_obj.force_cache_update()
         return self
 
     def render(self) -> bool | None:
@@ -1146,15 +1300,17 @@ class Widget(Base):
             or self._background_surface[0] != rect
             or self._background_surface[2] != bg
         ):
-            background_surface = make_surface(rect.width, rect.height, alpha=True)
             if isinstance(bg, pygame_menu.BaseImage):
+                background_surface = make_surface(rect.width, rect.height, alpha=True)
                 bg.draw(
                     surface=background_surface,
                     area=background_surface.get_rect(),
                     position=(0, 0),
                 )
-            else:
-                background_surface.fill(bg, background_surface.get_rect())
+            else:  # Opaque colors may use the display format
+                background_surface = make_surface(
+                    rect.width, rect.height, fill_color=bg
+                )
             if self._background_surface is None:
                 self._background_surface = [rect, background_surface, bg]
             else:
@@ -1363,7 +1519,7 @@ class Widget(Base):
                 args.insert(0, self.get_value())
             except ValueError:
                 pass
-            return self._onreturn(*args, **self._kwargs)
+            return self._schedule_async_callback(self._onreturn(*args, **self._kwargs))
         return None
 
     def change(self, *args) -> Any:
@@ -1389,6 +1545,7 @@ class Widget(Base):
         :return: Callback return value
         """
         val = None
+        self._notify_value_change()
         self.scroll_to_widget(scroll_parent=False)
         if self.readonly:
             return val
@@ -1398,11 +1555,32 @@ class Widget(Base):
                 args.insert(0, self.get_value())
             except ValueError:
                 pass
-            val = self._onchange(*args, **self._kwargs)
+            val = self._schedule_async_callback(self._onchange(*args, **self._kwargs))
         if self._menu is not None and self._menu._onwidgetchange is not None:
             self._menu._onwidgetchange(self._menu, self)
         return val
 
+    def _notify_value_change(self) -> None:
+        """
+        Notify the Menu that the Widget value may have changed, thus, the input
+        data returned by the Menu is updated.
+        """
+        if self._menu is not None:
+            self._menu._input_data_changed(self)
+
+    def _schedule_async_callback(self, value: Any) -> Any:
+        """
+        Schedule the callback return value as a task if it's awaitable and the
+        Menu runs within :py:meth:`pygame_menu.menu.Menu.run_async`.
+
+        :param value: Callback return value
+        :return: Callback return value, or the scheduled task
+        """
+        if self._menu is None:
+            return value
+        # noinspection PyProtectedMember
+        return self._menu._schedule_async_callback(value)
+
     def value_changed(self) -> bool:
         """
         Return ``True`` if the Widget's value changed from the default value.
@@ -1492,12 +1670,15 @@ class Widget(Base):
         if self.is_selected() and not self._selection_effect_draw_post:
             self._selection_effect.draw(surface, self)
 
+        decorator = self._decorator_obj
         self._draw_shadow(surface)
         self._draw_background_color(surface)
-        self._decorator.draw_prev(surface)
+        if decorator is not None:
+            decorator.draw_prev(surface)
         self._draw(surface)
         self._draw_border(surface)
-        self._decorator.draw_post(surface)
+        if decorator is not None:
+            decorator.draw_post(surface)
 
         # Apply callbacks
         self.apply_draw_callbacks()
@@ -1889,6 +2070,15 @@ class Widget(Base):
         assert isinstance(corner_radius, int) and corner_radius >= 0
         assert isinstance(aa_amount, int) and aa_amount > 0
         color = assert_color(color)
+        if self._shadow is _NO_SHADOW:
+            if shadow_width == 0:
+                return self
+            self._shadow = {
+                "enabled": False,
+                "properties": (),
+                "rect": None,
+                "surface": None,
+            }
         self._shadow["enabled"] = shadow_width > 0
         self._shadow["properties"] = (  # type: ignore
             shadow_type,
@@ -2799,6 +2989,75 @@ class Widget(Base):
             apply_padding=apply_padding, apply_selection=apply_selection
         ), self.get_height(apply_padding=apply_padding, apply_selection=apply_selection)
 
+    def measure(
+        self, apply_padding: bool = True, apply_selection: bool = False
+    ) -> Tuple2IntType:
+        """
+        Return the Widget size, same as
+        :py:meth:`pygame_menu.widgets.core.widget.Widget.get_size`, but without
+        rendering the Widget surface if the size can be computed from the Widget
+        properties (for example, the font metrics of the title). Menu uses this
+        method to compute the layout; thus, the surfaces are rendered only when
+        the widgets are drawn.
+
+        .. note::
+
+            If the Widget cannot be measured (for example, if it has rotation or
+            scaling transforms), this method renders the Widget.
+
+        :param apply_padding: Apply padding
+        :param apply_selection: Apply selection
+        :return: Widget width and height in px
+        """
+        assert isinstance(apply_padding, bool)
+        assert isinstance(apply_selection, bool)
+        size: Tuple2IntType | None = None
+        if (
+            self._angle == 0
+            and not (self._scale[0] and (self._scale[1] != 1 or self._scale[2] != 1))
+            and self._max_width[0] is None
+            and self._max_height[0] is None
+        ):
+            size = self._measure()
+
+        if size is None:
+            rect: pygame.Rect = self.get_rect(apply_padding=apply_padding, render=True)
+            width, height = rect.width, rect.height
+        else:
+            width, height = size
+            if apply_padding:
+                width += self._padding[1] + self._padding[3]
+                height += self._padding[0] + self._padding[2]
+            width += self._rect_size_delta[0]
+            height += self._rect_size_delta[1]
+
+        if apply_selection:
+            width += self._selection_effect.get_width()
+            height += self._selection_effect.get_height()
+        return int(width), int(height)
+
+    def _measure(self) -> Tuple2IntType | None:
+        """
+        Compute the size of the Widget surface (without padding, border, or
+        selection) without rendering it. Widgets that can compute their size
+        should override this method.
+
+        :return: Surface width and height in px, ``None`` if the Widget must be rendered to know its size
+        """
+        return None
+
+    def _font_measure_string(self, text: str) -> Tuple2IntType | None:
+        """
+        Measure a text as :py:meth:`pygame_menu.widgets.core.widget.Widget._render_string`
+        would render it, without rasterizing the text.
+
+        :param text: Text to measure
+        :return: Text width and height in px, ``None`` if the text cannot be measured
+        """
+        if self._font is None:
+            return None
+        return measure_text(self._font, text.replace("\t", " " * self._tab_size))
+
     def _focus(self) -> None:
         """
         Function that is executed when the Widget receives the user focus (is
@@ -2831,7 +3090,7 @@ class Widget(Base):
         :param sound: Sound object
         :return: Self reference
         """
-        self._sound = sound
+        self._sound_obj = sound
         return self
 
     def set_controls(
@@ -2936,7 +3195,10 @@ class Widget(Base):
         """
         if not self.receive_menu_update_events:
             return False
-        return self.update(events)
+        updated = self.update(events)
+        if updated:
+            self._notify_value_change()
+        return updated
 
     def add_draw_callback(
         self, draw_callback: Callable[[Widget, pygame_menu.Menu], Any]
@@ -2977,6 +3239,8 @@ class Widget(Base):
         """
         assert callable(draw_callback), "draw callback must be callable (function-type)"
         callback_id: str = uuid4()
+        if self._draw_callbacks is None:
+            self._draw_callbacks = {}
         self._draw_callbacks[callback_id] = draw_callback
         return callback_id
 
@@ -2988,7 +3252,7 @@ class Widget(Base):
         :return: Self reference
         """
         assert isinstance(callback_id, str)
-        if callback_id not in self._draw_callbacks.keys():
+        if not self._draw_callbacks or callback_id not in self._draw_callbacks:
             raise IndexError(f'callback ID "{callback_id}" does not exist')
         del self._draw_callbacks[callback_id]
         return self
@@ -3032,6 +3296,8 @@ class Widget(Base):
             "update callback must be callable (function-type)"
         )
         callback_id: str = uuid4()
+        if self._update_callbacks is None:
+            self._update_callbacks = {}
         self._update_callbacks[callback_id] = update_callback
         return callback_id
 
@@ -3043,7 +3309,7 @@ class Widget(Base):
         :return: Self reference
         """
         assert isinstance(callback_id, str)
-        if callback_id not in self._update_callbacks.keys():
+        if not self._update_callbacks or callback_id not in self._update_callbacks:
             raise IndexError(f'callback<"{callback_id}"> does not exist')
         del self._update_callbacks[callback_id]
         return self
@@ -3147,6 +3413,8 @@ class Widget(Base):
         :param prev_visible: Previous visible status
         :return: Self reference
         """
+        if prev_visible != self._visible:
+            _SELECTION_VERSION[0] += 1
         self._render()
         if self._menu is not None:
             self._menu._update_selection_if_hidden()
@@ -3235,6 +3503,7 @@ class Widget(Base):
         assert self._frame is None, "widget is already in another frame"
         assert isinstance(frame, pygame_menu.widgets.Frame)
         self._frame = frame
+        _SELECTION_VERSION[0] += 1
         return self
 
     def get_frame_depth(self) -> int:
@@ -3369,6 +3638,18 @@ class _WidgetNoValue:
     pass
 
 
+# Shared default values, these are replaced by the widget before being modified
+_NO_SHADOW: WidgetShadowType = MappingProxyType(  # type: ignore
+    {
+        "enabled": False,
+        "properties": (),
+        "rect": None,
+        "surface": None,
+    }
+)
+_NO_VALUE = _WidgetNoValue()
+
+
 class WidgetTransformationNotImplemented(Exception):
     """
     Exception raised if widget does not implement a transformation.
@@ -16,6 +16,7 @@ from pygame_menu.widgets.widget.frame import Frame
 from pygame_menu.widgets.widget.hmargin import HMargin
 from pygame_menu.widgets.widget.image import Image
 from pygame_menu.widgets.widget.label import Label
+from pygame_menu.widgets.widget.listview import ListView
 from pygame_menu.widgets.widget.menubar import MenuBar
 from pygame_menu.widgets.widget.menulink import MenuLink
 from pygame_menu.widgets.widget.none import NoneWidget
@@ -1142,6 +1142,7 @@ class DropSelect(Widget):
 
         # Force render
         self._render()
+        self._notify_value_change()
 
     def update_items(self, items: list[tuple[Any, ...]] | list[str]) -> None:
         """
@@ -1171,6 +1172,7 @@ class DropSelect(Widget):
         self._drop_frame = None
         self.active = False
         self._make_selection_drop()
+        self._notify_value_change()
 
     def _check_drop_made(self) -> None:
         """
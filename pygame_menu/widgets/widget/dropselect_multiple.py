@@ -453,12 +453,14 @@ class DropSelectMultiple(DropSelect):
             else:
                 self._sound.play_event_error()
         self._update_buttons()
+        self._notify_value_change()
 
     def reset_value(self) -> DropSelectMultiple:
         self._index = -1
         self._selected_indices = self._default_value.copy()
         self._update_buttons()
         self._render()
+        self._notify_value_change()
         return self
 
     def value_changed(self) -> bool:
@@ -511,6 +513,7 @@ class DropSelectMultiple(DropSelect):
 
         # Update options background selection
         self._update_buttons()
+        self._notify_value_change()
 
     def _update_buttons(self) -> None:
         """
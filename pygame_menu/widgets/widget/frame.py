@@ -66,10 +66,12 @@ from pygame_menu.utils import (
     get_finger_pos,
     make_surface,
     parse_padding,
+    release_surface,
     uuid4,
     warn,
 )
 from pygame_menu.widgets.core.widget import (
+    _SELECTION_VERSION,
     AbstractWidgetManager,
     Widget,
     WidgetTransformationNotImplemented,
@@ -802,7 +804,8 @@ class Frame(Widget):
         if self._height == max_height:
             self._frame_scrollarea.hide_scrollbars(ORIENTATION_VERTICAL)
 
-        # Create surface
+        # Create surface, the previous one is no longer the scrollarea world
+        release_surface(self._surface)
         self._surface = make_surface(self._width, self._height, alpha=True)
 
         # Configure area
@@ -931,9 +934,11 @@ class Frame(Widget):
         # Simple case, no scrollarea
         if not self.is_scrollable:
             self.last_surface = surface
+            decorator = self._decorator_obj
             self._draw_shadow(surface)
             self._draw_background_color(surface)
-            self._decorator.draw_prev(surface)
+            if decorator is not None:
+                decorator.draw_prev(surface)
             for widget in self._widgets.values():
                 if widget.is_selected():
                     selected_widget = widget
@@ -941,7 +946,8 @@ class Frame(Widget):
             if selected_widget is not None:
                 selected_widget.draw_after_if_selected(surface)
             self._draw_border(surface)
-            self._decorator.draw_post(surface)
+            if decorator is not None:
+                decorator.draw_post(surface)
 
         # Scrollarea
         else:
@@ -949,9 +955,9 @@ class Frame(Widget):
             self._surface.fill((255, 255, 255, 0))
             self._draw_shadow(self._surface, rect=self._real_rect)
             self._draw_background_color(self._surface, rect=self._real_rect)
-            scrollarea_decorator = self.get_decorator()
-            scrollarea_decorator.force_cache_update()
-            scrollarea_decorator.draw_prev(self._surface)
+            scrollarea_decorator = self._frame_scrollarea._decorator
+            if scrollarea_decorator is not None:
+                scrollarea_decorator.draw_prev(self._surface)
             for widget in self._widgets.values():
                 if widget.is_selected():
                     selected_widget = widget
@@ -1459,6 +1465,7 @@ class Frame(Widget):
         if self._menu is not None:
             widget.set_scrollarea(self._menu.get_scrollarea())
         widget._frame = None
+        _SELECTION_VERSION[0] += 1
         widget._translate_virtual = (0, 0)
         del self._widgets[wid]
         try:
@@ -1789,6 +1796,7 @@ class Frame(Widget):
         """
         Private update indices method.
         """
+        prev_indices = (self.first_index, self.last_index)
         self.first_index = -1
         self.last_index = -1
         for widget in self.get_widgets(unpack_subframes=False):
@@ -1804,6 +1812,8 @@ class Frame(Widget):
                 else:
                     self.first_index = min(self.first_index, windex)
                     self.last_index = max(self.last_index, windex)
+        if prev_indices != (self.first_index, self.last_index):
+            _SELECTION_VERSION[0] += 1
         if self.get_frame() is not None:
             self.get_frame()._update_indices()
 
@@ -22,6 +22,7 @@ from pygame_menu._types import (
     EventVectorType,
     NumberInstance,
     NumberType,
+    Tuple2IntType,
     Tuple2NumberType,
     Vector2NumberType,
 )
@@ -188,12 +189,17 @@ class Image(Widget):
     def _draw(self, surface: pygame.Surface) -> None:
         surface.blit(self._surface, self._rect.topleft)
 
+    def _measure(self) -> Tuple2IntType | None:
+        return self._image.get_size()
+
     def _render(self) -> bool | None:
-        if self._surface is not None:
+        # The image surface changes if a pending source has been loaded
+        surface = self._image.get_surface(new=False)
+        if self._surface is surface:
             return True
-        self._surface = self._image.get_surface(new=False)
+        self._surface = surface
         self._rect.width, self._rect.height = self._surface.get_size()
-        if not self._render_hash_changed(self._visible):
+        if not self._render_hash_changed(self._visible, surface):
             return True
         self.force_menu_surface_update()
         return None
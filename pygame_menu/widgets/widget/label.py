@@ -16,18 +16,19 @@ from abc import ABC
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any, Optional
 
-import pygame
-
 import pygame_menu
 from pygame_menu.utils import assert_color, make_surface, uuid4, warn
 from pygame_menu.widgets.core.widget import AbstractWidgetManager, Widget
 
 if TYPE_CHECKING:
+    import pygame
+
     from pygame_menu._types import (
         CallbackType,
         ColorInputType,
         ColorType,
         EventVectorType,
+        Tuple2IntType,
     )
 
 LabelTitleGeneratorType = Optional[Callable[[], str]]
@@ -52,6 +53,7 @@ class Label(Widget):
     _last_underline: list[str | tuple[ColorType, int, int] | None]
     _leading: int | None
     _lines: list[str]
+    _lines_surfaces: tuple[tuple[Any, ...] | None, dict[str, pygame.Surface]]
     _max_nlines: int | None
     _overflow_lines: list[str]  # Store how many lines are overflowed
     _title_generator: LabelTitleGeneratorType
@@ -79,6 +81,7 @@ class Label(Widget):
         self._last_underline = ["", None]  # deco id, (color, offset, width)
         self._leading = leading
         self._lines = []  # Lines of text displayed
+        self._lines_surfaces = (None, {})  # Style, rendered surface of each line
         self._max_nlines = max_nlines
         self._overflow_lines = []
         self._title_generator = None
@@ -182,37 +185,67 @@ class Label(Widget):
         font: pygame.font.Font,
         max_width: int,
         tab_size: int,
+        widths: dict[str, int] | None = None,
     ) -> list[str]:
         """
-        Wordwraps line.
+        Wordwraps line. Each word is measured once, the line breaks are estimated
+        from the sum of the word and space widths. Then, each line is measured to
+        account for the kerning, removing or adding words until the line is the
+        longest that fits. Words wider than ``max_width`` are not split; if the
+        last word is such, an empty line is appended after it.
 
         :param line: Line
         :param font: Font
         :param max_width: Max width
         :param tab_size: Tab size
+        :param widths: Cache of the measured words width, it can be shared between lines of the same font
         :return: List of strings
         """
+        if widths is None:
+            widths = {}
+        tab = " " * tab_size
+
+        def measure(text: str) -> int:
+            width = widths.get(text)
+            if width is None:
+                width = font.size(text.replace("\t", tab))[0] if text else 0
+                widths[text] = width
+            return width
+
+        def line_width(first: int, last: int) -> int:
+            return font.size(" ".join(words[first:last]).replace("\t", tab))[0]
+
         final_lines: list[str] = []
         words: list[str] = line.split(" ")
+        words_width: list[int] = [measure(word) for word in words]
+        space_width = measure(" ")
+        total_words = len(words)
 
+        start = 0
         while True:
-            split_line: bool = False
-            current_line: str = ""
-            i: int = 0
-            for i, _ in enumerate(words):
-                current_line = " ".join(words[: i + 1]).replace("\t", " " * tab_size)
-                current_line_size = font.size(current_line)
-                if current_line_size[0] > max_width:
-                    split_line = True
+            # Add words while the estimated width fits
+            end = start + 1
+            width = words_width[start]
+            while end < total_words:
+                width += space_width + words_width[end]
+                if width > max_width:
                     break
-
-            if split_line:
-                i = i if i > 0 else 1
-                final_lines.append(" ".join(words[:i]))
-                words = words[i:]
-            else:
-                final_lines.append(current_line)
+                end += 1
+
+            # Fix the estimation with the actual width of the line
+            while end - start > 1 and line_width(start, end) > max_width:
+                end -= 1
+            while end < total_words and line_width(start, end + 1) <= max_width:
+                end += 1
+
+            if end == total_words:
+                if end - start > 1 or words_width[start] <= max_width:
+                    final_lines.append(" ".join(words[start:]).replace("\t", tab))
+                else:  # The last word does not fit, an empty line follows
+                    final_lines.extend((words[start], ""))
                 break
+            final_lines.append(" ".join(words[start:end]))
+            start = end
 
         return final_lines
 
@@ -252,6 +285,11 @@ class Label(Widget):
         assert isinstance(self._max_nlines, int), "max_nlines must be defined"
         return self._overflow_lines
 
+    def _measure(self) -> Tuple2IntType | None:
+        if self._wordwrap:
+            return None
+        return self._font_measure_string(self._title)
+
     def _render(self) -> bool | None:
         font_color: ColorType = self.get_font_color_status()
         if not self._render_hash_changed(
@@ -281,18 +319,18 @@ class Label(Widget):
                 self._surface = make_surface(0, 0, alpha=True)
             else:
                 max_width = self._get_max_container_width()
-                lines: list[str] = sum(
-                    (
+                lines: list[str] = []
+                widths: dict[str, int] = {}
+                for line in self._title.split("\n"):
+                    lines.extend(
                         self._wordwrap_line(
                             line=line,
                             font=self._font,
                             max_width=max_width,
                             tab_size=self._tab_size,
+                            widths=widths,
                         )
-                        for line in self._title.split("\n")
-                    ),
-                    [],
-                )
+                    )
                 num_lines = len(lines)
                 if isinstance(self._max_nlines, int):
                     if num_lines > self._max_nlines:
@@ -306,20 +344,37 @@ class Label(Widget):
                     alpha=True,
                 )
 
-                for n_line, line in enumerate(lines):
-                    line_surface = self._render_string(line, font_color)
-                    self._surface.blit(
-                        line_surface,
-                        pygame.Rect(
-                            0,
-                            n_line * self._get_leading(),
-                            self._rect.width,
-                            self._rect.height,
-                        ),
-                    )
+                # Render the displayed lines. Surfaces of the lines from the
+                # previous render are reused, thus, a resize only renders the
+                # lines whose text changed
+                style = (
+                    self._font,
+                    font_color,
+                    self._font_antialias,
+                    self._font_background_color,
+                    self._font_shadow,
+                    self._font_shadow_color,
+                    self._font_shadow_tuple,
+                    self._tab_size,
+                )
+                prev_style, prev_surfaces = self._lines_surfaces
+                if prev_style != style:
+                    prev_surfaces = {}
+                surfaces: dict[str, pygame.Surface] = {}
+                leading = self._get_leading()
+                blits = []
+                for n_line in range(num_lines):
+                    line = lines[n_line]
+                    line_surface = surfaces.get(line)
+                    if line_surface is None:
+                        line_surface = prev_surfaces.get(line)
+                        if line_surface is None:
+                            line_surface = self._render_string(line, font_color)
+                        surfaces[line] = line_surface
+                    blits.append((line_surface, (0, n_line * leading)))
                     self._lines.append(line)
-                    if n_line + 1 == num_lines:
-                        break
+                self._surface.blits(blits, doreturn=False)
+                self._lines_surfaces = (style, surfaces)
 
         # Apply max width if wordwrap exceeds size
         if self._wordwrap and self.get_width() > max_width > 0:
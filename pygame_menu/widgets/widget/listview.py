@@ -0,0 +1,878 @@
+"""
+pygame-menu
+https://github.com/ppizarror/pygame-menu
+
+LIST VIEW
+Virtualized list widget, which renders only the visible rows of a source.
+"""
+
+from __future__ import annotations
+
+__all__ = [
+    # Class
+    "ListView",
+    "ListViewManager",
+    # Types
+    "ListViewItemRendererType",
+    "ListViewSourceType",
+]
+
+from abc import ABC
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING, Any, Union
+
+import pygame
+
+import pygame_menu
+from pygame_menu.locals import FINGERUP
+from pygame_menu.utils import (
+    assert_color,
+    assert_vector,
+    check_key_pressed_valid,
+    get_finger_pos,
+    make_surface,
+    release_surface,
+)
+from pygame_menu.widgets.core.widget import (
+    AbstractWidgetManager,
+    Widget,
+    WidgetTransformationNotImplemented,
+)
+
+if TYPE_CHECKING:
+    from pygame_menu._types import (
+        CallbackType,
+        ColorInputType,
+        ColorType,
+        EventVectorType,
+        Tuple2IntType,
+    )
+
+ListViewItemRendererType = Callable[[Any, int, bool], Union[str, pygame.Surface]]
+ListViewSourceType = Union[Sequence[Any], Callable[[int], Any]]
+
+
+# noinspection PyMissingOrEmptyDocstring
+class ListView(Widget):
+    """
+    List view widget. Displays the items of a source within a fixed number of
+    rows, rendering only the visible ones; thus, the memory used by the widget
+    does not depend on the number of items.
+
+    The source can be any sequence (``list``, ``tuple``, ``range``, etc.), or a
+    function ``source(index) -> item`` together with the number of items
+    (``length``). Each row is rendered by ``item_renderer``, which must return a
+    string or a :py:class:`pygame.Surface`:
+
+    .. code-block:: python
+
+        item_renderer(item, index, selected) -> str | pygame.Surface
+
+    If the source changes, call :py:meth:`pygame_menu.widgets.ListView.notify_changed`
+    with the indices of the changed items; only those rows are rendered again.
+
+    .. note::
+
+        ListView only accepts translation transformation.
+
+    :param source: Sequence of items, or function that returns the item of an index
+    :param item_renderer: Function that renders an item. If ``None`` the item string is rendered using the widget font
+    :param length: Number of items (int) or function that returns it. Required if ``source`` is a function
+    :param listview_id: ID of the list view
+    :param default: Index of the default selected item. If ``-1`` no item is selected
+    :param onchange: Callback when changing the selected item
+    :param onreturn: Callback when pressing return on the selected item
+    :param onselect: Function when selecting the widget
+    :param rows: Number of visible rows
+    :param width: Width of the list in px
+    :param row_height: Height of each row in px. If ``None`` uses the font height plus the row padding
+    :param row_padding: Padding of the row text on x-axis and y-axis (x, y) in px
+    :param row_selected_background_color: Background color of the selected row. If ``None`` the row is not highlighted
+    :param scrollbar_color: Color of the scroll indicator track
+    :param scrollbar_slider_color: Color of the scroll indicator slider
+    :param scrollbar_thickness: Thickness of the scroll indicator in px. If ``0`` the indicator is disabled
+    :param args: Optional arguments for callbacks
+    :param kwargs: Optional keyword arguments
+    """
+
+    _default_value: int
+    _index: int
+    _item_renderer: ListViewItemRendererType | None
+    _length: int
+    _length_source: int | Callable[[], int] | None
+    _offset: int
+    _row_cache: dict[int, pygame.Surface]
+    _row_cache_status: tuple[bool, bool]
+    _row_height: int
+    _row_height_source: int | None
+    _row_padding: Tuple2IntType
+    _row_selected_background_color: ColorType | None
+    _rows: int
+    _scrollbar_color: ColorType
+    _scrollbar_slider_color: ColorType
+    _scrollbar_thickness: int
+    _source: ListViewSourceType
+    _version: int
+    _width: int
+
+    def __init__(
+        self,
+        source: ListViewSourceType,
+        item_renderer: ListViewItemRendererType | None = None,
+        length: int | Callable[[], int] | None = None,
+        listview_id: str = "",
+        default: int = -1,
+        onchange: CallbackType = None,
+        onreturn: CallbackType = None,
+        onselect: CallbackType = None,
+        rows: int = 8,
+        width: int = 300,
+        row_height: int | None = None,
+        row_padding: Tuple2IntType = (4, 2),
+        row_selected_background_color: ColorInputType | None = (200, 200, 200),
+        scrollbar_color: ColorInputType = (235, 235, 235),
+        scrollbar_slider_color: ColorInputType = (200, 200, 200),
+        scrollbar_thickness: int = 6,
+        *args,
+        **kwargs,
+    ) -> None:
+        super().__init__(
+            args=args,
+            kwargs=kwargs,
+            onchange=onchange,
+            onreturn=onreturn,
+            onselect=onselect,
+            title="",
+            widget_id=listview_id,
+        )
+
+        # Check the source
+        if callable(source) and not isinstance(source, Sequence):
+            assert length is not None, (
+                "length must be provided if the source is a function"
+            )
+        else:
+            assert isinstance(source, Sequence), (
+                "source must be a sequence or a function that returns the item "
+                "of an index"
+            )
+        assert length is None or isinstance(length, int) or callable(length), (
+            "length must be an integer, a function, or None"
+        )
+        if isinstance(length, int):
+            assert length >= 0, "length must be equal or greater than zero"
+        assert item_renderer is None or callable(item_renderer), (
+            "item renderer must be callable (function-type) or None"
+        )
+
+        # Check dimensions
+        assert isinstance(rows, int)
+        assert rows > 0, "rows must be greater than zero"
+        assert isinstance(width, int)
+        assert width > 0, "width must be greater than zero"
+        assert row_height is None or isinstance(row_height, int)
+        if row_height is not None:
+            assert row_height > 0, "row height must be greater than zero"
+        assert_vector(row_padding, 2, int)
+        assert isinstance(scrollbar_thickness, int)
+        assert 0 <= scrollbar_thickness < width, (
+            "scrollbar thickness must be equal or greater than zero, and lower "
+            "than the width"
+        )
+
+        # Check colors
+        if row_selected_background_color is not None:
+            row_selected_background_color = assert_color(row_selected_background_color)
+        scrollbar_color = assert_color(scrollbar_color)
+        scrollbar_slider_color = assert_color(scrollbar_slider_color)
+
+        # Store properties
+        self._item_renderer = item_renderer
+        self._length_source = length
+        self._row_height_source = row_height
+        self._row_padding = (row_padding[0], row_padding[1])
+        self._row_selected_background_color = row_selected_background_color
+        self._rows = rows
+        self._scrollbar_color = scrollbar_color
+        self._scrollbar_slider_color = scrollbar_slider_color
+        self._scrollbar_thickness = scrollbar_thickness
+        self._source = source
+        self._width = width
+
+        # Internals
+        self._offset = 0
+        self._row_cache = {}
+        self._row_cache_status = (False, False)
+        self._row_height = 0
+        self._version = 0
+        self._length = self._read_length()
+
+        # Check the default value
+        assert isinstance(default, int)
+        assert -1 <= default < self._length, (
+            "default index must be -1 or an index of the source"
+        )
+        self._default_value = default
+        self._index = default
+        self._scroll_to_index()
+
+    def scale(self, *args, **kwargs) -> ListView:
+        raise WidgetTransformationNotImplemented()
+
+    def resize(self, *args, **kwargs) -> ListView:
+        raise WidgetTransformationNotImplemented()
+
+    def set_max_width(self, *args, **kwargs) -> ListView:
+        raise WidgetTransformationNotImplemented()
+
+    def set_max_height(self, *args, **kwargs) -> ListView:
+        raise WidgetTransformationNotImplemented()
+
+    def rotate(self, *args, **kwargs) -> ListView:
+        raise WidgetTransformationNotImplemented()
+
+    def flip(self, *args, **kwargs) -> ListView:
+        raise WidgetTransformationNotImplemented()
+
+    def _read_length(self) -> int:
+        """
+        Read the number of items of the source.
+
+        :return: Number of items
+        """
+        if self._length_source is None:
+            return len(self._source)
+        length = (
+            self._length_source()
+            if callable(self._length_source)
+            else self._length_source
+        )
+        assert isinstance(length, int) and length >= 0, (
+            "length must be an integer equal or greater than zero"
+        )
+        return length
+
+    def _get_item(self, index: int) -> Any:
+        """
+        Return the item of the source at the given index.
+
+        :param index: Item index
+        :return: Item
+        """
+        if isinstance(self._source, Sequence):
+            return self._source[index]
+        return self._source(index)
+
+    def get_index(self) -> int:
+        """
+        Get the selected index.
+
+        :return: Selected index, ``-1`` if no item is selected
+        """
+        return self._index
+
+    def get_offset(self) -> int:
+        """
+        Return the index of the first visible row.
+
+        :return: First visible index
+        """
+        return self._offset
+
+    def get_rows(self) -> int:
+        """
+        Return the number of visible rows.
+
+        :return: Number of rows
+        """
+        return self._rows
+
+    def get_row_height(self) -> int:
+        """
+        Return the height of each row in px. It is zero until the widget font
+        has been set.
+
+        :return: Row height in px
+        """
+        return self._row_height
+
+    def get_value(self) -> tuple[Any, int]:
+        """
+        Return the selected item. This method raises ``ValueError`` if no item
+        has been selected.
+
+        :return: Item and index as a tuple, (item, index)
+        """
+        if self._index == -1:
+            raise ValueError("no item has been selected")
+        return self._get_item(self._index), self._index
+
+    def set_value(self, index: int) -> None:
+        """
+        Select the item of the given index, and scroll the list to make it
+        visible.
+
+        .. note::
+
+            This method does not trigger any event (change).
+
+        :param index: Index of the item. If ``-1`` the selection is removed
+        """
+        assert isinstance(index, int)
+        assert -1 <= index < self._length, (
+            f"index must be -1 or between 0 and {self._length - 1}"
+        )
+        self._set_index(index)
+
+    def value_changed(self) -> bool:
+        return self._index != self._default_value
+
+    def _set_index(self, index: int) -> bool:
+        """
+        Set the selected index. The rows of the previous and the new selected
+        items are rendered again.
+
+        :param index: New index
+        :return: ``True`` if the index changed
+        """
+        if index == self._index:
+            return False
+        self._release_row(self._index)
+        self._release_row(index)
+        self._index = index
+        self._scroll_to_index()
+        self._render()
+        self._notify_value_change()
+        return True
+
+    def _move(self, delta: int) -> bool:
+        """
+        Move the selected index, and trigger the change event. If no item is
+        selected, the first or the last item is selected.
+
+        :param delta: Index delta
+        :return: ``True`` if the index changed. ``False`` if the list boundary was reached
+        """
+        if self._index == -1:
+            return self._move_to(0 if delta > 0 else self._length - 1)
+        return self._move_to(self._index + delta)
+
+    def _move_to(self, index: int) -> bool:
+        """
+        Select an index, clamped to the list boundaries, and trigger the change
+        event.
+
+        :param index: Item index
+        :return: ``True`` if the index changed
+        """
+        if self.readonly or self._length == 0:
+            return False
+        if not self._set_index(max(0, min(self._length - 1, index))):
+            return False
+        self.change()
+        self._sound.play_key_add()
+        return True
+
+    def _scroll_to_index(self) -> None:
+        """
+        Scroll the list to make the selected index visible.
+        """
+        if self._index == -1:
+            return
+        if self._index < self._offset:
+            self._offset = self._index
+        elif self._index >= self._offset + self._rows:
+            self._offset = self._index - self._rows + 1
+
+    def scroll(self, rows: int) -> bool:
+        """
+        Scroll the list, without changing the selected index.
+
+        :param rows: Number of rows to scroll, positive scrolls down
+        :return: ``True`` if the list scrolled
+        """
+        assert isinstance(rows, int)
+        offset = max(0, min(max(0, self._length - self._rows), self._offset + rows))
+        if offset == self._offset:
+            return False
+        self._offset = offset
+        self._render()
+        return True
+
+    def notify_changed(self, *indices: int) -> ListView:
+        """
+        Notify the widget that the source has changed. Only the rows of the
+        given indices are rendered again, if visible. If no indices are given,
+        the number of items is read again and all the rows are rendered.
+
+        :param indices: Indices of the changed items
+        :return: Self reference
+        """
+        if len(indices) == 0:
+            self._length = self._read_length()
+            if self._index >= self._length:
+                self._index = self._length - 1
+            self._offset = max(0, min(self._offset, self._length - self._rows))
+            self._clear_row_cache()
+            self._version += 1
+            self._render()
+            self._notify_value_change()
+            return self
+
+        if self._index in indices:
+            self._notify_value_change()
+        if self._font is None or self._surface is None:
+            return self
+        updated = False
+        for index in indices:
+            assert isinstance(index, int)
+            if not self._offset <= index < min(self._offset + self._rows, self._length):
+                continue
+            self._release_row(index)
+            y = (index - self._offset) * self._row_height
+            self._surface.fill(
+                (0, 0, 0, 0), (0, y, self._get_row_width(), self._row_height)
+            )
+            self._surface.blit(self._get_row(index), (0, y))
+            updated = True
+        if updated:
+            self.force_menu_surface_cache_update()
+        return self
+
+    def get_row_index(self, y: int) -> int:
+        """
+        Return the index of the item at the given y-coordinate within the window.
+
+        :param y: Y-coordinate in px
+        :return: Item index, ``-1`` if there is no item at the given position
+        """
+        if self._row_height == 0:
+            return -1
+        rect = self.get_rect(
+            apply_padding=False, to_real_position=True, real_position_visible=False
+        )
+        if not rect.top <= y < rect.top + self._rows * self._row_height:
+            return -1
+        index = self._offset + (y - rect.top) // self._row_height
+        return index if index < self._length else -1
+
+    def _get_row_width(self) -> int:
+        """
+        Return the width of the rows, without the scroll indicator.
+
+        :return: Row width in px
+        """
+        return self._width - self._scrollbar_thickness
+
+    def _release_row(self, index: int) -> None:
+        """
+        Remove a row from the cache.
+
+        :param index: Item index
+        """
+        release_surface(self._row_cache.pop(index, None))
+
+    def _clear_row_cache(self) -> None:
+        """
+        Remove all the rows from the cache.
+        """
+        for row in self._row_cache.values():
+            release_surface(row)
+        self._row_cache.clear()
+
+    def _get_row(self, index: int) -> pygame.Surface:
+        """
+        Return the surface of a row, rendering it if not cached.
+
+        :param index: Item index
+        :return: Row surface
+        """
+        row = self._row_cache.get(index)
+        if row is not None:
+            return row
+        item = self._get_item(index)
+        selected = index == self._index
+        row = make_surface(self._get_row_width(), self._row_height, alpha=True)
+        if selected and self._row_selected_background_color is not None:
+            row.fill(self._row_selected_background_color)
+        if self._item_renderer is None:
+            content = str(item)
+        else:
+            content = self._item_renderer(item, index, selected)
+        if isinstance(content, str):
+            text = self._render_string(
+                content, self.get_font_color_status(check_selection=selected)
+            )
+            row.blit(
+                text,
+                (
+                    self._row_padding[0],
+                    int((self._row_height - text.get_height()) / 2),
+                ),
+            )
+            release_surface(text)
+        else:
+            assert isinstance(content, pygame.Surface), (
+                "item renderer must return a string or a pygame Surface"
+            )
+            row.blit(content, (0, 0))
+        self._row_cache[index] = row
+        return row
+
+    def _apply_font(self) -> None:
+        if self._row_height_source is not None:
+            self._row_height = self._row_height_source
+        else:
+            self._row_height = self._font.get_height() + 2 * self._row_padding[1]
+        self._clear_row_cache()
+
+    def _measure(self) -> Tuple2IntType | None:
+        if self._font is None:
+            return None
+        return self._width, self._rows * self._row_height
+
+    def _draw(self, surface: pygame.Surface) -> None:
+        surface.blit(self._surface, self._rect.topleft)
+
+    def _render(self) -> bool | None:
+        if self._font is None:
+            return False
+
+        elif not self._render_hash_changed(
+            self._selected,
+            self._visible,
+            self.readonly,
+            self._index,
+            self._offset,
+            self._length,
+            self._row_height,
+            self._version,
+        ):
+            return True
+
+        # Rows depend on the widget status
+        if self._row_cache_status != (self._selected, self.readonly):
+            self._row_cache_status = (self._selected, self.readonly)
+            self._clear_row_cache()
+
+        # Remove rows no longer visible
+        last = min(self._offset + self._rows, self._length)
+        for index in [i for i in self._row_cache if not self._offset <= i < last]:
+            self._release_row(index)
+
+        # Compose the visible rows
+        resized = self._surface is None
+        release_surface(self._surface)
+        height = self._rows * self._row_height
+        self._surface = make_surface(self._width, height, alpha=True)
+        for index in range(self._offset, last):
+            self._surface.blit(
+                self._get_row(index), (0, (index - self._offset) * self._row_height)
+            )
+
+        # Draw the scroll indicator
+        if self._scrollbar_thickness > 0 and self._length > self._rows:
+            x = self._get_row_width()
+            pygame.draw.rect(
+                self._surface,
+                self._scrollbar_color,
+                (x, 0, self._scrollbar_thickness, height),
+            )
+            slider = max(self._scrollbar_thickness, height * self._rows // self._length)
+            y = (height - slider) * self._offset // (self._length - self._rows)
+            pygame.draw.rect(
+                self._surface,
+                self._scrollbar_slider_color,
+                (x, y, self._scrollbar_thickness, slider),
+            )
+
+        resized = resized or (self._rect.width, self._rect.height) != (
+            self._width,
+            height,
+        )
+        self._rect.width, self._rect.height = self._width, height
+
+        # The size only changes on the first render or if the font changes
+        if resized:
+            self.force_menu_surface_update()
+        else:
+            self.force_menu_surface_cache_update()
+        return None
+
+    def update(self, events: EventVectorType) -> bool:
+        self.apply_update_callbacks(events)
+
+        if self.readonly or not self.is_visible():
+            self._readonly_check_mouseover(events)
+            return False
+
+        for event in events:
+            if event.type == pygame.KEYDOWN:  # Check key is valid
+                if self._ignores_keyboard_nonphysical() and not check_key_pressed_valid(
+                    event
+                ):
+                    continue
+
+            # Check mouse over
+            self._check_mouseover(event)
+
+            # Events
+            keydown = self._keyboard_enabled and event.type == pygame.KEYDOWN
+            joy_hatmotion = self._joystick_enabled and event.type == pygame.JOYHATMOTION
+            joy_axismotion = (
+                self._joystick_enabled and event.type == pygame.JOYAXISMOTION
+            )
+            joy_button_down = (
+                self._joystick_enabled and event.type == pygame.JOYBUTTONDOWN
+            )
+
+            # Previous item. If the first item is selected, the event is left to
+            # the Menu, which selects the previous widget
+            if (
+                keydown
+                and self._ctrl.move_down(event, self)
+                or joy_hatmotion
+                and self._ctrl.joy_up(event, self)
+                or joy_axismotion
+                and self._ctrl.joy_axis_y_up(event, self)
+            ):
+                if self._move(-1):
+                    return True
+
+            # Next item
+            elif (
+                keydown
+                and self._ctrl.move_up(event, self)
+                or joy_hatmotion
+                and self._ctrl.joy_down(event, self)
+                or joy_axismotion
+                and self._ctrl.joy_axis_y_down(event, self)
+            ):
+                if self._move(1):
+                    return True
+
+            # First and last items
+            elif keydown and self._ctrl.home(event, self):
+                if self._move_to(0):
+                    return True
+
+            elif keydown and self._ctrl.end(event, self):
+                if self._move_to(self._length - 1):
+                    return True
+
+            # Press enter
+            elif (
+                keydown
+                and self._ctrl.apply(event, self)
+                or joy_button_down
+                and self._ctrl.joy_select(event, self)
+            ):
+                if self._index != -1:
+                    self._sound.play_key_add()
+                    self.apply()
+                    return True
+
+            # Scroll the list with the mouse wheel (button 4 & 5)
+            elif (
+                event.type == pygame.MOUSEBUTTONDOWN
+                and self._mouse_enabled
+                and event.button in (4, 5)
+                and self.get_rect(to_real_position=True).collidepoint(*event.pos)
+            ):
+                if self.scroll(-1 if event.button == 4 else 1):
+                    return True
+
+            # Click on a row; don't consider the mouse wheel (button 4 & 5)
+            elif (
+                event.type == pygame.MOUSEBUTTONUP
+                and self._mouse_enabled
+                and event.button in (1, 2, 3)
+                or event.type == FINGERUP
+                and self._touchscreen_enabled
+                and self._menu is not None
+            ):
+                event_pos = get_finger_pos(self._menu, event)
+                if not self.get_rect(to_real_position=True).collidepoint(*event_pos):
+                    continue
+                index = self.get_row_index(event_pos[1])
+                if index == -1:
+                    continue
+                if event.type == pygame.MOUSEBUTTONUP:
+                    self._sound.play_click_mouse()
+                else:
+                    self._sound.play_click_touch()
+                if index == self._index:
+                    self.apply()
+                else:
+                    self._set_index(index)
+                    self.change()
+                return True
+
+        return False
+
+
+class ListViewManager(AbstractWidgetManager, ABC):
+    """
+    ListView manager.
+    """
+
+    def list_view(
+        self,
+        source: ListViewSourceType,
+        item_renderer: ListViewItemRendererType | None = None,
+        default: int = -1,
+        length: int | Callable[[], int] | None = None,
+        list_view_id: str = "",
+        onchange: CallbackType = None,
+        onreturn: CallbackType = None,
+        onselect: CallbackType = None,
+        rows: int = 8,
+        width: int = 300,
+        **kwargs,
+    ) -> pygame_menu.widgets.ListView:
+        """
+        Add a list view, which displays the items of a source within a fixed
+        number of rows. Only the visible rows are rendered, thus, the source can
+        be as large as needed (for example, ``range(1_000_000)``) without
+        creating one widget per item.
+
+        The source can be any sequence, or a function ``source(index) -> item``
+        together with the number of items (``length``), which can also be a
+        function. Each row is rendered by ``item_renderer``:
+
+        .. code-block:: python
+
+            item_renderer(item, index, selected) -> str | pygame.Surface
+
+        If ``onchange`` callback is defined, it is executed when the user
+        selects another item; if ``onreturn`` is defined, it is executed when
+        the user presses return on the selected item, or clicks it again:
+
+        .. code-block:: python
+
+            onchange((item, index), *args, **kwargs)
+            onreturn((item, index), *args, **kwargs)
+
+        If ``onselect`` is defined, the callback is executed as follows, where
+        ``selected`` is a boolean representing the selected status:
+
+        .. code-block:: python
+
+            onselect(selected, widget, menu)
+
+        kwargs (Optional)
+            - ``align``                         (str) – Widget `alignment <https://pygame-menu.readthedocs.io/en/latest/_source/themes.html#alignment>`_
+            - ``background_color``              (tuple, list, str, int, :py:class:`pygame.Color`, :py:class:`pygame_menu.baseimage.BaseImage`) – Color of the background. ``None`` for no-color
+            - ``background_inflate``            (tuple, list) – Inflate background on x-axis and y-axis (x, y) in px
+            - ``border_color``                  (tuple, list, str, int, :py:class:`pygame.Color`) – Widget border color. ``None`` for no-color
+            - ``border_inflate``                (tuple, list) – Widget border inflate on x-axis and y-axis (x, y) in px
+            - ``border_position``               (str, tuple, list) – Widget border positioning. It can be a single position, or a tuple/list of positions. Only are accepted: north, south, east, and west. See :py:mod:`pygame_menu.locals`
+            - ``border_width``                  (int) – Border width in px. If ``0`` disables the border
+            - ``cursor``                        (int, :py:class:`pygame.cursors.Cursor`, None) – Cursor of the widget if the mouse is placed over
+            - ``float``                         (bool) - If ``True`` the widget don't contribute width/height to the Menu widget positioning computation, and don't add one unit to the rows
+            - ``float_origin_position``         (bool) - If ``True`` the widget position is set to the top-left position of the Menu if the widget is floating
+            - ``font_background_color``         (tuple, list, str, int, :py:class:`pygame.Color`, None) – Widget font background color
+            - ``font_color``                    (tuple, list, str, int, :py:class:`pygame.Color`) – Widget font color
+            - ``font_name``                     (str, :py:class:`pathlib.Path`, :py:class:`pygame.font.Font`) – Widget font path
+            - ``font_shadow_color``             (tuple, list, str, int, :py:class:`pygame.Color`) – Font shadow color
+            - ``font_shadow_offset``            (int) – Font shadow offset in px
+            - ``font_shadow_position``          (str) – Font shadow position, see locals for position
+            - ``font_shadow``                   (bool) – Font shadow is enabled or disabled
+            - ``font_size``                     (int) – Font size of the widget
+            - ``margin``                        (tuple, list) – Widget (left, bottom) margin in px
+            - ``padding``                       (int, float, tuple, list) – Widget padding according to CSS rules. General shape: (top, right, bottom, left)
+            - ``readonly_color``                (tuple, list, str, int, :py:class:`pygame.Color`) – Color of the widget if readonly mode
+            - ``readonly_selected_color``       (tuple, list, str, int, :py:class:`pygame.Color`) – Color of the widget if readonly mode and is selected
+            - ``row_height``                    (int, None) – Height of each row in px. If ``None`` uses the font height plus the row padding
+            - ``row_padding``                   (tuple, list) – Padding of the row text on x-axis and y-axis (x, y) in px
+            - ``row_selected_background_color`` (tuple, list, str, int, :py:class:`pygame.Color`, None) – Background color of the selected row. ``None`` for no-color
+            - ``scrollbar_color``               (tuple, list, str, int, :py:class:`pygame.Color`) – Color of the scroll indicator track
+            - ``scrollbar_slider_color``        (tuple, list, str, int, :py:class:`pygame.Color`) – Color of the scroll indicator slider
+            - ``scrollbar_thickness``           (int) – Thickness of the scroll indicator in px. If ``0`` the indicator is disabled
+            - ``selection_color``               (tuple, list, str, int, :py:class:`pygame.Color`) – Color of the selected widget; only affects the font color
+            - ``selection_effect``              (:py:class:`pygame_menu.widgets.core.Selection`) – Widget selection effect
+            - ``shadow_color``                  (tuple, list, str, int, :py:class:`pygame.Color`) – Color of the widget shadow
+            - ``shadow_radius``                 (int) - Border radius of the shadow
+            - ``shadow_type``                   (str) - Shadow type, it can be ``'rectangular'`` or ``'ellipse'``
+            - ``shadow_width``                  (int) - Width of the shadow. If ``0`` the shadow is disabled
+            - ``tab_size``                      (int) – Width of a tab character
+
+        .. note::
+
+            The list receives the keyboard and joystick events before the Menu;
+            once the first or the last item is selected, the events are left to
+            the Menu, which selects the previous or the next widget.
+
+        .. note::
+
+            If the source changes call :py:meth:`pygame_menu.widgets.ListView.notify_changed`.
+            Only the visible rows of the given indices are rendered again.
+
+        .. note::
+
+            All theme-related optional kwargs use the default Menu theme if not
+            defined.
+
+        .. note::
+
+            This is applied only to the base Menu (not the currently displayed,
+            stored in ``_current`` pointer); for such behavior apply to
+            :py:meth:`pygame_menu.menu.Menu.get_current` object.
+
+        .. warning::
+
+            Be careful with kwargs collision. Consider that all optional documented
+            kwargs keys are removed from the object.
+
+        :param source: Sequence of items, or function that returns the item of an index
+        :param item_renderer: Function that renders an item, ``item_renderer(item, index, selected) -> str | pygame.Surface``. If ``None`` the item string is rendered using the widget font
+        :param default: Index of the default selected item. If ``-1`` no item is selected
+        :param length: Number of items (int) or function that returns it. Required if ``source`` is a function
+        :param list_view_id: ID of the list view
+        :param onchange: Callback when changing the selected item
+        :param onreturn: Callback when pressing return on the selected item
+        :param onselect: Callback executed when selecting the widget
+        :param rows: Number of visible rows
+        :param width: Width of the list in px
+        :param kwargs: Optional keyword arguments
+        :return: Widget object
+        :rtype: :py:class:`pygame_menu.widgets.ListView`
+        """
+        # Filter widget attributes to avoid passing them to the callbacks
+        attributes = self._filter_widget_attributes(kwargs)
+
+        row_height = kwargs.pop("row_height", None)
+        row_padding = kwargs.pop("row_padding", (4, 2))
+        row_selected_background_color = kwargs.pop(
+            "row_selected_background_color", self._theme.scrollbar_slider_color
+        )
+        scrollbar_color = kwargs.pop("scrollbar_color", self._theme.scrollbar_color)
+        scrollbar_slider_color = kwargs.pop(
+            "scrollbar_slider_color", self._theme.scrollbar_slider_color
+        )
+        scrollbar_thickness = kwargs.pop("scrollbar_thickness", 6)
+
+        widget = pygame_menu.widgets.ListView(
+            source=source,
+            item_renderer=item_renderer,
+            length=length,
+            listview_id=list_view_id,
+            default=default,
+            onchange=onchange,
+            onreturn=onreturn,
+            onselect=onselect,
+            rows=rows,
+            width=width,
+            row_height=row_height,
+            row_padding=row_padding,
+            row_selected_background_color=row_selected_background_color,
+            scrollbar_color=scrollbar_color,
+            scrollbar_slider_color=scrollbar_slider_color,
+            scrollbar_thickness=scrollbar_thickness,
+            **kwargs,
+        )
+
+        self._configure_widget(widget=widget, **attributes)
+        self._append_widget(widget)
+
+        return widget
@@ -29,6 +29,7 @@ from typing import Any
 import pygame
 import pygame.gfxdraw as gfxdraw
 
+import pygame_menu
 from pygame_menu._types import (
     CallbackType,
     ColorInputType,
@@ -46,7 +47,7 @@ from pygame_menu.locals import (
     POSITION_SOUTH,
     POSITION_WEST,
 )
-from pygame_menu.utils import assert_color, get_finger_pos, warn
+from pygame_menu.utils import assert_color, get_finger_pos, make_surface, warn
 from pygame_menu.widgets.core.widget import Widget, WidgetTransformationNotImplemented
 
 # Menubar styles
@@ -76,7 +77,7 @@ class MenuBar(Widget):
 
     :param title: Title of the menubar
     :param width: Width of the widget, generally the same as the width of the menu
-    :param background_color: Background color
+    :param background_color: Background color. If it is an image (for example, a :py:class:`pygame_menu.baseimage.GradientImage`) the bar is filled with it
     :param menubar_id: ID of the MenuBar
     :param back_box: Draw a back-box button on header
     :param back_box_background_color: Back-box button color
@@ -99,6 +100,7 @@ class MenuBar(Widget):
     _offsetx: NumberType
     _offsety: NumberType
     _polygon_pos: Any
+    _polygon_surface: tuple[Any, pygame.Surface, Tuple2IntType] | None
     _scrollbar_deltas: list[tuple[int, Tuple2IntType]]
     _style: int
     _width: int
@@ -108,7 +110,7 @@ class MenuBar(Widget):
         self,
         title: Any,
         width: NumberType,
-        background_color: ColorInputType,
+        background_color: ColorInputType | pygame_menu.BaseImage,
         menubar_id: str = "",
         back_box: bool = False,
         back_box_background_color: ColorInputType = (0, 0, 0),
@@ -125,7 +127,8 @@ class MenuBar(Widget):
 
         assert width > 0, "width must be greater or equal than zero"
 
-        background_color = assert_color(background_color)
+        if not isinstance(background_color, pygame_menu.BaseImage):
+            background_color = assert_color(background_color)
         back_box_background_color = assert_color(back_box_background_color)
 
         # MenuBar has no ID
@@ -150,6 +153,7 @@ class MenuBar(Widget):
         self._offsetx = 0
         self._offsety = 0
         self._polygon_pos = None
+        self._polygon_surface = None
         # north, east, south, west
         self._scrollbar_deltas = [(0, (0, 0)), (0, (0, 0)), (0, (0, 0)), (0, (0, 0))]
         self._style = mode
@@ -260,7 +264,12 @@ class MenuBar(Widget):
 
     def _draw(self, surface: pygame.Surface) -> None:
         if len(self._polygon_pos) > 2:
-            gfxdraw.filled_polygon(surface, self._polygon_pos, self._background_color)
+            if isinstance(self._background_color, pygame_menu.BaseImage):
+                self._draw_polygon_image(surface)
+            else:
+                gfxdraw.filled_polygon(
+                    surface, self._polygon_pos, self._background_color
+                )
 
         # Draw backbox if enabled
         if self._backbox_visible():
@@ -282,6 +291,31 @@ class MenuBar(Widget):
             ),
         )
 
+    def _draw_polygon_image(self, surface: pygame.Surface) -> None:
+        """
+        Draw the bar polygon filled with the background image. The filled polygon
+        is cached until the polygon changes.
+
+        :param surface: Surface to draw
+        """
+        if (
+            self._polygon_surface is None
+            or self._polygon_surface[0] != self._polygon_pos
+        ):
+            xs = [p[0] for p in self._polygon_pos]
+            ys = [p[1] for p in self._polygon_pos]
+            x, y = min(xs), min(ys)
+            w, h = max(xs) - x + 1, max(ys) - y + 1
+            poly = make_surface(w, h, alpha=True)
+            gfxdraw.filled_polygon(
+                poly, [(p[0] - x, p[1] - y) for p in self._polygon_pos], (255, 255, 255)
+            )
+            fill = make_surface(w, h)
+            self._background_color.draw(fill, fill.get_rect())
+            poly.blit(fill, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+            self._polygon_surface = (self._polygon_pos, poly, (x, y))
+        surface.blit(self._polygon_surface[1], self._polygon_surface[2])
+
     def get_scrollbar_style_change(self, position: str) -> tuple[int, Tuple2IntType]:
         """
         Return scrollbar change (width, position) depending on the style of the
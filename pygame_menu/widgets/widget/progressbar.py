@@ -42,6 +42,7 @@ from pygame_menu.utils import (
     assert_vector,
     make_surface,
     parse_padding,
+    release_surface,
 )
 from pygame_menu.widgets.core.widget import (
     AbstractWidgetManager,
@@ -83,7 +84,7 @@ class ProgressBar(Widget):
     :param kwargs: Optional keyword arguments
     """
 
-    _box: pygame.Surface
+    _box: pygame.Surface | None
     _box_background_color: ColorType
     _box_border_color: ColorType
     _box_border_width: int
@@ -176,6 +177,7 @@ class ProgressBar(Widget):
 
         # Store properties
         self._default_value = default
+        self._box = None
         self._box_background_color = box_background_color
         self._box_border_color = box_border_color
         self._box_border_width = box_border_width
@@ -198,6 +200,7 @@ class ProgressBar(Widget):
         assert 0 <= value <= 100, "value must be between 0 and 100"
         self._progress = value
         self._render()
+        self._notify_value_change()
 
     def scale(self, *args, **kwargs) -> ProgressBar:
         raise WidgetTransformationNotImplemented()
@@ -256,6 +259,10 @@ class ProgressBar(Widget):
         ):
             return True
 
+        # Return the previous surfaces to the pool
+        release_surface(self._surface)
+        release_surface(self._box)
+
         # Create basic title
         self._surface = self._render_string(self._title, self.get_font_color_status())
         self._rect.width, self._rect.height = self._surface.get_size()
@@ -274,6 +281,7 @@ class ProgressBar(Widget):
         self._box.blit(
             box_progress, (self._box_progress_padding[1], self._box_progress_padding[0])
         )
+        release_surface(box_progress)
         self._box_pos = self._rect.width
 
         # Create progress text
@@ -55,6 +55,7 @@ from pygame_menu.utils import (
     get_finger_pos,
     make_surface,
     parse_padding,
+    release_surface,
 )
 from pygame_menu.widgets.core.widget import (
     AbstractWidgetManager,
@@ -150,7 +151,7 @@ class RangeSlider(Widget):
     _keyrepeat_counters: dict[int, int]
     _keyrepeat_initial_interval_ms: NumberType
     _keyrepeat_interval_ms: NumberType
-    _range_box: pygame.Surface
+    _range_box: pygame.Surface | None
     _range_box_color: ColorType
     _range_box_color_readonly: ColorType
     _range_box_enabled: bool
@@ -158,7 +159,7 @@ class RangeSlider(Widget):
     _range_box_height_factor: NumberType
     _range_box_pos: Tuple2IntType
     _range_box_single_slider: bool
-    _range_line: pygame.Surface
+    _range_line: pygame.Surface | None
     _range_line_color: ColorType
     _range_line_height: int
     _range_line_pos: Tuple2IntType
@@ -450,11 +451,13 @@ class RangeSlider(Widget):
         self._keyrepeat_counters = {}  # {event.key: (counter_int, event.unicode)} (look for "***")
         self._keyrepeat_initial_interval_ms = repeat_keys_initial_ms
         self._keyrepeat_interval_ms = repeat_keys_interval_ms
+        self._range_box = None
         self._range_box_color = range_box_color
         self._range_box_color_readonly = range_box_color_readonly
         self._range_box_enabled = range_box_enabled
         self._range_box_height_factor = range_box_height_factor
         self._range_box_single_slider = range_box_single_slider
+        self._range_line = None
         self._range_line_color = range_line_color
         self._range_line_height = range_line_height
         self._range_margin = range_margin
@@ -471,12 +474,14 @@ class RangeSlider(Widget):
         self._range_text_value_tick_height = 0
         self._range_text_value_tick_height_factor = range_text_value_tick_hfactor
         self._range_text_value_tick_number = range_text_value_tick_number
+        self._range_text_value_tick_surfaces = []
         self._range_text_value_tick_thickness = range_text_value_tick_thick
         self._range_values = tuple(range_values)
         self._range_width = range_width
         self._scrolling = False
         self._selected_mouse = False
         self._single = single
+        self._slider = []
         self._slider_color = slider_color
         self._slider_height = 0
         self._slider_height_factor = slider_height_factor
@@ -493,6 +498,7 @@ class RangeSlider(Widget):
         self._slider_text_value_margin_factor = slider_text_value_margin_f
         self._slider_text_value_padding = slider_text_value_padding
         self._slider_text_value_position = slider_text_value_position
+        self._slider_text_value_surfaces = []
         self._slider_text_value_triangle = slider_text_value_triangle
         self._slider_text_value_vmargin = 0
         self._slider_thickness = slider_thickness
@@ -563,6 +569,7 @@ class RangeSlider(Widget):
         self._value = value
         self._value_hidden = self._value.copy()
         self._render()
+        self._notify_value_change()
 
     def scale(self, *args, **kwargs) -> RangeSlider:
         raise WidgetTransformationNotImplemented()
@@ -781,6 +788,16 @@ class RangeSlider(Widget):
         ):
             return True
 
+        # Return the previous surfaces to the pool
+        release_surface(self._surface)
+        for s in (
+            *self._slider,
+            self._range_line,
+            *self._range_text_value_tick_surfaces,
+            *self._slider_text_value_surfaces,
+        ):
+            release_surface(s)
+
         # Create basic title
         self._surface = self._render_string(self._title, self.get_font_color_status())
         self._rect.width, self._rect.height = self._surface.get_size()
@@ -912,6 +929,7 @@ class RangeSlider(Widget):
         if not self._single or self._range_box_single_slider:
             r_pos = 0 if self._single else self._get_pos_range(self._value[0])
             r_width = self._get_distance_between_sliders()
+            release_surface(self._range_box)
             self._range_box = make_surface(
                 max(0, r_width),
                 self._range_box_height,
@@ -974,6 +992,8 @@ class RangeSlider(Widget):
                 - st.get_height()
             )
             self._slider_text_value_surfaces_pos.append((st_x, st_y))
+            if st_root is not st:
+                release_surface(st)
 
         # Update maximum rect height
         self._rect.height = max(
@@ -467,6 +467,7 @@ class Selector(Widget):
             )
             self._index = item
         self._render()
+        self._notify_value_change()
 
     def update_items(self, items: list[tuple[Any, ...]] | list[str]) -> None:
         """
@@ -488,6 +489,7 @@ class Selector(Widget):
             if self._index >= len(self._items):
                 self._index = 0
                 self._default_value = 0
+        self._notify_value_change()
 
     def update(self, events: EventVectorType) -> bool:
         self.apply_update_callbacks(events)
@@ -25,7 +25,7 @@ if TYPE_CHECKING:
     from collections.abc import Callable
 
     import pygame_menu
-    from pygame_menu._types import CallbackType, EventVectorType
+    from pygame_menu._types import CallbackType, EventVectorType, Tuple2IntType
 
 
 class SurfaceWidget(Widget):
@@ -98,6 +98,9 @@ class SurfaceWidget(Widget):
     def get_surface(self) -> pygame.Surface:
         return self._surface_obj
 
+    def _measure(self) -> Tuple2IntType | None:
+        return self._surface_obj.get_size()
+
     def _render(self) -> bool | None:
         self._rect.width, self._rect.height = self._surface_obj.get_size()
         return None
@@ -1250,6 +1250,7 @@ class TextInput(Widget):
             )
         self._update_renderbox()  # Updates cursor
         self._render()  # Renders the selection box
+        self._notify_value_change()
 
     def _check_input_size(self) -> bool:
         """
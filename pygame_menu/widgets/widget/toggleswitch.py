@@ -34,6 +34,7 @@ from pygame_menu.utils import (
     check_key_pressed_valid,
     get_finger_pos,
     make_surface,
+    release_surface,
 )
 from pygame_menu.widgets.core.widget import (
     AbstractWidgetManager,
@@ -270,9 +271,11 @@ class ToggleSwitch(Widget):
             self._state_width_accum.append(accum_width)
 
         # Inner properties
+        self._slider = None
         self._slider_height = 0
         self._slider_pos = (0, 0)  # to add to (rect.x, rect.y)
         self._state_font = None
+        self._switch = None
         self._switch_font_rendered = []  # Stores font render for each state
         self._switch_height = 0
         self._switch_pos = (0, 0)  # horizontal pos, and delta to title
@@ -282,6 +285,7 @@ class ToggleSwitch(Widget):
         assert 0 <= state < self._total_states, "state value exceeds the total states"
         self._state = state
         self._render()
+        self._notify_value_change()
 
     def scale(self, *args, **kwargs) -> ToggleSwitch:
         raise WidgetTransformationNotImplemented()
@@ -381,6 +385,11 @@ class ToggleSwitch(Widget):
         ):
             return True
 
+        # Return the previous surfaces to the pool
+        release_surface(self._surface)
+        release_surface(self._slider)
+        release_surface(self._switch)
+
         # Create basic title
         self._surface = self._render_string(self._title, self.get_font_color_status())
         self._rect.width, self._rect.height = self._surface.get_size()
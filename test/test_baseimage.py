@@ -9,6 +9,8 @@ Test base image management.
 import base64
 import copy
 import io
+import threading
+from concurrent.futures import Future
 from pathlib import Path
 
 import pygame
@@ -22,9 +24,10 @@ from pygame_menu.baseimage import (
     IMAGE_MODE_REPEAT_XY,
     IMAGE_MODE_REPEAT_Y,
     IMAGE_MODE_SIMPLE,
+    _resolve_pending_images,
 )
-from pygame_menu.utils import load_pygame_image_file
-from test._utils import PYGAME_V2, surface
+from pygame_menu.utils import configure_display_optimization, load_pygame_image_file
+from test._utils import PYGAME_V2, MenuUtils, surface
 
 
 def test_pathlib():
@@ -388,6 +391,7 @@ def test_drawing_position(position, expected_delta):
     )
     w, h = image.get_size()
     image.set_drawing_position(position)
+    assert image.get_drawing_position() == position
     if callable(expected_delta):
         expected = expected_delta(w, h)
     else:
@@ -441,6 +445,61 @@ def test_cache():
     assert image._last_transform[0] == 300
 
 
+def test_display_surface():
+    """Test the display-format surface used on draw."""
+    image = pygame_menu.BaseImage(
+        pygame_menu.baseimage.IMAGE_EXAMPLE_PYGAME_MENU, drawing_mode=IMAGE_MODE_CENTER
+    )
+    image.draw(surface)
+    assert image._display_surface == (None, None)
+
+    configure_display_optimization(True)
+    try:
+        image.draw(surface)
+        source, display = image._display_surface
+        assert source is image._surface and display is not image._surface
+        image.draw(surface)
+        assert image._display_surface[1] is display
+
+        # Pixel changes, or new surfaces, convert the image again
+        image.set_at((0, 0), "red")
+        assert image._display_surface == (None, None)
+        image.draw(surface)
+        assert image._display_surface[1].get_at((0, 0)) == (255, 0, 0, 255)
+        image.flip(True, False)
+        image.draw(surface)
+        assert image._display_surface[0] is image._surface
+
+        # Filled images optimize the scaled surface
+        image = pygame_menu.BaseImage(pygame_menu.baseimage.IMAGE_EXAMPLE_GRAY_LINES)
+        image.draw(surface)
+        assert image._last_transform[2].get_flags() & pygame.SRCALPHA == 0
+    finally:
+        configure_display_optimization(False)
+
+
+def test_repeat_surface():
+    """Test the tiled surface cache used by the repeat modes."""
+    image = pygame_menu.BaseImage(
+        pygame_menu.baseimage.IMAGE_EXAMPLE_TILED_BORDER,
+        drawing_mode=IMAGE_MODE_REPEAT_XY,
+    )
+    image.draw(surface, pygame.Rect(0, 0, 60, 40))
+    key, tiled = image._repeat_surface[1], image._repeat_surface[2]
+    assert tiled.get_size() == (72, 54)
+    image.draw(surface, pygame.Rect(0, 0, 60, 40))
+    assert image._repeat_surface[2] is tiled
+
+    # A new area, or pixel changes, tile the image again
+    image.draw(surface, pygame.Rect(0, 0, 30, 40))
+    assert image._repeat_surface[1] != key
+    assert image._repeat_surface[2].get_size() == (36, 54)
+    image.set_at((0, 0), "red")
+    assert image._repeat_surface is None
+    image.draw(surface, pygame.Rect(0, 0, 30, 40))
+    assert image._repeat_surface[2].get_at((18, 0)) == image.get_at((0, 0))
+
+
 def test_subsurface():
     """Test subsurface."""
     image = pygame_menu.BaseImage(pygame_menu.baseimage.IMAGE_EXAMPLE_TILED_BORDER)
@@ -488,3 +547,92 @@ def test_from_surface():
     image2 = pygame_menu.BaseImage(surf2)
     image2.set_at((0, 0), (255, 255, 0))
     assert surf2.get_at((0, 0)) == (0, 0, 255, 255)
+
+
+def test_pending_source():
+    """Test images loaded in the background."""
+    future = Future()
+    placeholder = pygame.Surface((20, 10), pygame.SRCALPHA)
+    image = pygame_menu.BaseImage(future, placeholder=placeholder)
+    assert image.is_pending()
+    assert image.get_size() == (20, 10)
+    assert image.get_extension() == "<pending>"
+    image_copy = image.copy()
+    assert image_copy.is_pending()
+
+    # Placeholders are not drawn
+    surf = pygame.Surface((30, 30))
+    surf.fill((255, 0, 0))
+    image.draw(surf)
+    assert surf.get_at((0, 0)) == (255, 0, 0, 255)
+
+    # Resolve the source, only the resolved images are returned
+    loaded = load_pygame_image_file(pygame_menu.baseimage.IMAGE_EXAMPLE_GRAY_LINES)
+    other = pygame_menu.BaseImage(Future())
+    future.set_result(loaded)
+    resolved = _resolve_pending_images()
+    assert image in resolved and image_copy in resolved and other not in resolved
+    assert _resolve_pending_images() == []
+    assert image.get_size() == loaded.get_size()
+    assert not image.is_pending()
+    assert image.get_extension() == "<surface>"
+    assert not image_copy.is_pending()
+    assert image_copy.get_size() == loaded.get_size()
+    image.draw(surf)
+    assert image.copy().equals(image)
+
+    # Failed loads raise on resolution
+    future = Future()
+    image = pygame_menu.BaseImage(future)
+    assert image.get_size() == (1, 1)
+    future.set_exception(pygame.error("cannot load"))
+    with pytest.raises(pygame.error):
+        image.get_size()
+
+    # Already loaded sources are resolved on creation
+    future = Future()
+    future.set_result(loaded)
+    assert not pygame_menu.BaseImage(future).is_pending()
+
+
+def test_asset_loader():
+    """Test the background asset loader."""
+    gate = threading.Event()
+
+    def load_image():
+        gate.wait()
+        return load_pygame_image_file(pygame_menu.baseimage.IMAGE_EXAMPLE_PYGAME_MENU)
+
+    with pygame_menu.loader.AssetLoader(max_workers=2) as loader:
+        future = loader.load_image(pygame_menu.baseimage.IMAGE_EXAMPLE_METAL)
+        metal = pygame_menu.BaseImage(future)
+        future.result()
+        assert not metal.is_pending()
+        assert metal.equals(
+            pygame_menu.BaseImage(pygame_menu.baseimage.IMAGE_EXAMPLE_METAL)
+        )
+        image = pygame_menu.BaseImage(loader.submit(load_image))
+        font = loader.load_font(pygame_menu.font.FONT_OPEN_SANS, 17).result()
+        assert pygame_menu.font.get_font(pygame_menu.font.FONT_OPEN_SANS, 17) is font
+
+        # Concurrent loads share a single cached font
+        fonts = [loader.load_font(pygame_menu.font.FONT_BEBAS, 19) for _ in range(8)]
+        assert len({id(f.result()) for f in fonts}) == 1
+        with pytest.raises(AssertionError):
+            loader.load_image("invalid.png")
+
+        # The menu renders with the placeholder, then swaps in the image
+        menu = MenuUtils.generic_menu()
+        btn = menu.add.button("button")
+        widget = menu.add.image(image)
+        menu.draw(surface)
+        assert widget.get_size(apply_padding=False) == (1, 1)
+        gate.set()
+        image._pending.result()
+        assert image._pending is not None
+        menu.draw(surface)
+        assert not image.is_pending()
+        assert widget.get_size(apply_padding=False) == image.get_size()
+        assert widget.get_rect().y > btn.get_rect().y
+    with pytest.raises(RuntimeError):
+        loader.load_font(pygame_menu.font.FONT_OPEN_SANS, 17)
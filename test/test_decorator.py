@@ -344,3 +344,48 @@ def test_general():
 
     menu.draw(surface)
     deco.remove_all()
+
+
+def test_lazy_decorator():
+    """Test decorators are created on first use, and cache is kept between draws."""
+    menu = MenuUtils.generic_menu(theme=TEST_THEME.copy())
+    btn = menu.add.button("button")
+    frame = menu.add.frame_v(300, 400, max_height=100)
+    frame.pack(menu.add.button("frame button", margin=(0, 0)))
+    for _ in range(3):
+        menu.draw(surface)
+    assert menu._decorator is None
+    assert menu.get_scrollarea()._decorator is None
+    assert frame._frame_scrollarea._decorator is None
+    assert btn._decorator_obj is None
+
+    # Scrollarea cache is not updated if the widgets are drawn again
+    deco = menu.get_scrollarea().get_decorator()
+    deco.cache = True
+    deco.add_pixel(1, 2, (0, 0, 0))
+    menu.draw(surface)
+    cache_surface = deco._cache_surface["prev"]
+    assert cache_surface is not None
+    btn.force_menu_surface_update()
+    menu.draw(surface)
+    assert deco._cache_surface["prev"] is cache_surface
+    menu.force_surface_cache_update()
+    menu.draw(surface)
+    assert deco._cache_surface["prev"] is not cache_surface
+
+    # Same for scrollable frames
+    deco = frame.get_decorator()
+    assert deco is frame._frame_scrollarea._decorator
+    deco.cache = True
+    deco.add_pixel(1, 2, (0, 0, 0))
+    frame.draw(surface)
+    cache_surface = deco._cache_surface["prev"]
+    assert cache_surface is not None
+    for _ in range(3):
+        frame.draw(surface)
+    assert deco._cache_surface["prev"] is cache_surface
+
+    # Empty decorators are not drawn
+    deco.remove_all()
+    assert menu.get_decorator().draw_prev(surface) is menu.get_decorator()
+    menu.draw(surface)
@@ -201,3 +201,17 @@ def test_font_argument_direct_instance_in_menu():
     # Test widgets with default font, check are equal
     text2 = menu.add.text_input("First name: ", default="John")
     assert text2.get_font_info()["name"] == menu.get_theme().widget_font
+
+
+@pytest.mark.parametrize("name", pygame_menu.font.FONT_EXAMPLES)
+def test_measure_text(name):
+    """Test text measure matches the rendered size."""
+    font = pygame_menu.font.get_font(name, 20)
+    for text in ("", "Hello world", "Play  game", "Ω€£ é"):
+        size = pygame_menu.font.measure_text(font, text)
+        if size is not None:
+            assert size == font.render(text, True, (0, 0, 0)).get_size()
+
+    # Control and combining characters cannot be measured
+    assert pygame_menu.font.measure_text(font, "a\nb") is None
+    assert pygame_menu.font.measure_text(font, "a\u030a") is None
@@ -6,20 +6,29 @@ TEST MENU
 Menu object tests.
 """
 
+import asyncio
 import copy
+import inspect
+import json
 import math
+import os
 import sys
 import time
 import timeit
+import tracemalloc
+import zlib
 
 import pygame
 import pytest
+from pygame import gfxdraw
 
 from pygame_menu import (
     BaseImage,
     baseimage,
+    binding,
     controls as ctrl,
     events,
+    menu as menu_module,
     widgets,
 )
 from pygame_menu.locals import (
@@ -49,7 +58,11 @@ from pygame_menu.menu import (
     _MenuWidgetOverflow,
 )
 from pygame_menu.themes import THEME_BLUE, THEME_DARK, THEME_DEFAULT, Theme
-from pygame_menu.utils import get_cursor, set_pygame_cursor
+from pygame_menu.utils import (
+    configure_menu_retention,
+    get_cursor,
+    set_pygame_cursor,
+)
 from pygame_menu.widgets import Button, Label
 from test._utils import (
     PYGAME_V2,
@@ -580,6 +593,49 @@ def test_get_widget():
     assert menu.get_widget("deep_selector", recursive=True) == deep_selector
 
 
+def test_widget_index():
+    """Test the widget ID index is kept in sync with the Menu tree."""
+    menu = MenuUtils.generic_menu()
+    menu2 = MenuUtils.generic_menu()
+    menu3 = MenuUtils.generic_menu()
+    menu4 = MenuUtils.generic_menu()
+    btn = menu.add.button("btn", button_id="btn")
+    with pytest.raises(IndexError):
+        menu.add.button("btn", button_id="btn")
+
+    # Menu widgets take precedence over the submenus ones
+    btn2 = menu2.add.button("btn", button_id="btn")
+    label = menu3.add.label("label", label_id="label")
+    menu.add.button("menu2", menu2)
+    menu.add.button("menu3", menu3)
+    menu2.add.button("menu4", menu4)
+    menu3.add.button("menu4", menu4)
+    assert menu.get_widget("btn", recursive=True) == btn
+    assert menu2.get_widget("btn", recursive=True) == btn2
+    assert menu.get_submenus(recursive=True) == (menu2, menu3, menu4)
+    assert menu.get_widget("label", recursive=True) == label
+
+    # Changes on submenus invalidate the tree index
+    label4 = menu4.add.label("label", label_id="label4")
+    assert menu.get_widget("label4", recursive=True) == label4
+    assert menu.get_widgets(["btn", "label4", "invalid"]) == (btn, label4, None)
+    menu.move_widget_index(btn, 1)
+    assert menu.get_widget("btn") == btn
+    menu.remove_widget(btn)
+    assert menu.get_widget("btn") is None
+    assert menu.get_widget("btn", recursive=True) == btn2
+    menu.add.generic_widget(btn)
+    assert menu.get_widget("btn", recursive=True) == btn
+    menu4.remove_widget(label4)
+    assert menu.get_widget("label4", recursive=True) is None
+    menu3.clear()
+    assert menu.get_widget("label", recursive=True) is None
+    assert menu3.get_submenus(recursive=True) == ()
+    menu.clear()
+    assert menu.get_submenus(recursive=True) == ()
+    assert menu.get_widget("btn", recursive=True) is None
+
+
 def test_add_generic_widget():
     """Test adding generic widgets to menu."""
     menu = MenuUtils.generic_menu()
@@ -1001,6 +1057,57 @@ def test_input_data():
         menu.get_input_data(recursive=True)
 
 
+def test_input_data_delta():
+    """Test input data change tracking."""
+    menu = MenuUtils.generic_menu()
+    submenu = MenuUtils.generic_menu()
+    text = menu.add.text_input("text", textinput_id="text", default="a")
+    menu.add.button("submenu", submenu)
+    toggle = submenu.add.toggle_switch("toggle", toggleswitch_id="toggle")
+    drop = submenu.add.dropselect("drop", [("a", 0), ("b", 1)], dropselect_id="drop")
+    data = {"text": "a", "toggle": False}
+    assert menu.get_input_data(recursive=True) == data
+    assert menu.get_input_data_delta(recursive=True) == data
+    assert menu.get_input_data_delta(recursive=True) == {}
+
+    # Unchanged widgets are not queried
+    calls = []
+    text_get_value = text.get_value
+
+    def get_value(*args):
+        calls.append(1)
+        return text_get_value(*args)
+
+    text.get_value = get_value
+    toggle.set_value(1)
+    assert menu.get_input_data(recursive=True) == {"text": "a", "toggle": True}
+    assert menu.get_input_data(recursive=True) == {"text": "a", "toggle": True}
+    assert calls == []
+    assert menu.get_input_data_delta(recursive=True) == {"toggle": True}
+
+    # User input
+    menu.update(PygameEventUtils.key(pygame.K_b, keydown=True, char="b"))
+    assert menu.get_input_data()["text"] == "ab"
+    assert len(calls) == 1
+    assert menu.get_input_data_delta() == {"text": "ab"}
+    assert submenu.get_input_data_delta() == {}
+
+    # Widgets without value, added and removed widgets
+    drop.set_value(1)
+    assert list(submenu.get_input_data().keys()) == ["toggle", "drop"]
+    assert submenu.get_input_data_delta() == {"drop": (("b", 1), 1)}
+    drop.set_value(-1)
+    assert submenu.get_input_data() == {"toggle": True}
+    submenu.add.text_input("text2", textinput_id="text2", default="c")
+    assert submenu.get_input_data_delta() == {"text2": "c"}
+    submenu.remove_widget(toggle)
+    assert menu.get_input_data(recursive=True) == {"text": "ab", "text2": "c"}
+    toggle.set_value(0)
+    assert submenu.get_input_data_delta() == {}
+    menu.reset_value(recursive=True)
+    assert menu.get_input_data_delta(recursive=True) == {"text": "a", "text2": "c"}
+
+
 def test_columns_menu():
     """Test multi-column menu behavior."""
     # Basic invalid configurations
@@ -1485,6 +1592,68 @@ def test_mainloop_kwargs():
     menu.mainloop(surface, bgfun)
 
 
+def test_run_async():
+    """Test asynchronous mainloop and coroutine callbacks."""
+    menu = MenuUtils.generic_menu()
+    calls = []
+
+    async def onreturn():
+        """Coroutine callback, the menu keeps drawing while it waits."""
+        frames = menu._stats.loop
+        await asyncio.sleep(0.05)
+        assert menu._stats.loop > frames
+        calls.append("done")
+        menu.disable()
+
+    btn = menu.add.button("async", onreturn)
+
+    def bgfun():
+        """Background callback that triggers the button once."""
+        if not calls:
+            calls.append("apply")
+            assert isinstance(btn.apply(), asyncio.Task)
+
+    assert asyncio.run(menu.run_async(surface, bgfun, fps_limit=0)) == menu
+    assert calls == ["apply", "done"]
+    assert not menu._mainloop
+    assert menu._async_tasks is None
+
+    # Outside the async loop the coroutine is returned as is
+    coro = btn.apply()
+    assert asyncio.iscoroutine(coro)
+    coro.close()
+
+    # Single loop, and disabled menu
+    menu.enable()
+    loops = menu._stats.loop
+    asyncio.run(menu.run_async(surface, disable_loop=True))
+    assert menu._stats.loop == loops + 1
+    menu.disable()
+    with pytest.raises(RuntimeError):
+        asyncio.run(menu.run_async(surface))
+    menu.enable()
+
+    # Exceptions in callbacks are propagated
+    async def onreturn_error():
+        """Coroutine callback that fails."""
+        raise ValueError("callback failed")
+
+    menu = MenuUtils.generic_menu()
+    btn = menu.add.button("error", onreturn_error)
+    menu.set_onupdate(lambda *_: btn.apply())
+    pygame.event.post(PygameEventUtils.joy_center(inlist=False))
+    with pytest.raises(ValueError):
+        asyncio.run(menu.run_async(surface, fps_limit=0))
+    assert not menu._mainloop
+
+    # Wait for event
+    menu = MenuUtils.generic_menu()
+    menu.set_onupdate(menu.disable)
+    pygame.event.post(PygameEventUtils.joy_center(inlist=False))
+    asyncio.run(menu.run_async(surface, wait_for_event=True))
+    assert not menu.is_enabled()
+
+
 def _call_invalid_menu():
     """Call Menu constructor with an invalid keyword."""
     bad = {"fake_option": True}
@@ -1621,6 +1790,39 @@ def test_focus():
     assert menu._draw_focus_widget(surface, btn) is not None
 
 
+def test_focus_cache():
+    """Test focus overlay is prerendered and reused while the focus is the same."""
+    menu = MenuUtils.generic_menu(title="menu", mouse_motion_selection=True)
+    btn = menu.add.button("nice")
+    btn.active = True
+
+    # Compare the blitted areas against the drawn polygons
+    surf = surface.copy()
+    surf.fill((255, 255, 255))
+    focus = menu._draw_focus_widget(surf, btn)
+    expected = surface.copy()
+    expected.fill((255, 255, 255))
+    for area in focus.values():
+        gfxdraw.filled_polygon(
+            expected, area, menu.get_theme().focus_background_color
+        )
+    for pos in ((0, 0), (599, 599), (300, 330), (10, 330), (590, 330), (300, 310)):
+        assert surf.get_at(pos) == expected.get_at(pos)
+
+    # Same focus uses the prerendered areas
+    assert menu._stats.draw_focus == 1
+    assert menu._draw_focus_widget(surf, btn) == focus
+    assert menu._stats.draw_focus == 1
+    assert menu._stats.draw_focus_cached == 1
+
+    # If the widget moves the focus is computed again
+    btn.translate(10, 0)
+    focus2 = menu._draw_focus_widget(surf, btn)
+    assert focus2 != focus
+    assert focus2[2][1][0] == focus[2][1][0] + 10
+    assert menu._stats.draw_focus == 2
+
+
 def test_visible():
     """Test widget visibility and selection updates."""
     menu = MenuUtils.generic_menu(title="menu")
@@ -1989,6 +2191,51 @@ def test_theme_params():
     assert pygame.display.get_caption()[0] == menu.get_title()
 
 
+def test_draw_idle_allocations():
+    """Test idle frames do not retain memory."""
+    theme = TEST_THEME.copy()
+    theme.title_updates_pygame_display = True
+    menu = MenuUtils.generic_menu(theme=theme, title="Idle")
+    for i in range(30):
+        menu.add.button(f"button {i}")
+    menu._mainloop = True  # Checks the mouseleave on each draw
+    for _ in range(10):
+        menu.draw(surface)
+    assert pygame.display.get_caption()[0] == "Idle"
+
+    # The caption changed by the user is restored
+    pygame.display.set_caption("Other")
+    menu.draw(surface)
+    assert pygame.display.get_caption()[0] == "Idle"
+
+    # The exact retained size depends on the interpreter version, thus, each
+    # window must stay below a bound that a single object leaked per frame
+    # would exceed
+    frames = 250
+    pkg_filter = [
+        tracemalloc.Filter(True, os.path.join(os.path.dirname(menu_module.__file__), "*"))
+    ]
+    windows = []
+    tracemalloc.start()
+    try:
+        # Warm up, stats counters must exceed the small integers cache
+        for _ in range(300):
+            menu.draw(surface)
+        snapshot = tracemalloc.take_snapshot().filter_traces(pkg_filter)
+        for _ in range(4):
+            for _ in range(frames):
+                menu.draw(surface)
+            new_snapshot = tracemalloc.take_snapshot().filter_traces(pkg_filter)
+            diff = new_snapshot.compare_to(snapshot, "filename")
+            windows.append(sum(stat.size_diff for stat in diff))
+            snapshot = new_snapshot
+    finally:
+        tracemalloc.stop()
+    for size_diff in windows:
+        assert size_diff < 32 * frames
+    menu._mainloop = False
+
+
 def test_widget_move_index():
     """Test moving widgets by index and reference."""
     menu = MenuUtils.generic_menu(theme=TEST_THEME.copy())
@@ -2529,6 +2776,24 @@ def test_resize():
     for m in (menu, menu2, menu3):
         assert m.get_size() == (300, 300)
 
+    # Submenus apply the size once they are displayed
+    menu.resize(400, 300, recursive=True)
+    menu.resize(500, 300, recursive=True)
+    assert menu2._pending_resize == (500, 300, None, None)
+    assert menu3._width == 300
+    menu.get_widgets()[0].apply()
+    assert menu.get_current() == menu2
+    assert menu2._pending_resize is None
+    assert menu2._width == 500
+    assert menu3._pending_resize is not None
+    menu.resize(300, 300, recursive=True)
+    assert menu2._pending_resize is None
+    assert menu2._width == 300
+    assert menu3._pending_resize == (300, 300, None, None)
+    menu.reset(1)
+    assert menu3.get_size() == (300, 300)
+    assert menu3._pending_resize is None
+
 
 def test_get_size():
     """Test menu size getters and border size calculation."""
@@ -2791,3 +3056,461 @@ def test_selection():
     assert menu.get_current() == sub2
     sub.clear(reset=False)
     assert menu.get_current() == sub2
+
+
+def test_selection_table():
+    """Test the selection over long runs of non-selectable widgets."""
+    menu = MenuUtils.generic_menu(rows=None)
+    menu.disable_render()
+    btn1 = menu.add.button("1")
+    for i in range(200):
+        menu.add.label(f"label {i}")
+    btn2 = menu.add.button("2")
+    menu.enable_render()
+    assert menu.get_selected_widget() == btn1
+
+    # The selection skips all labels without recursion
+    recursion_limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(len(inspect.stack()) + 100)
+    try:
+        menu.update(PygameEventUtils.key(ctrl.KEY_MOVE_UP, keydown=True))
+    finally:
+        sys.setrecursionlimit(recursion_limit)
+    assert menu.get_selected_widget() == btn2
+    assert menu._last_selected_type == menu_module.SELECT_RECURSIVE
+    menu.update(PygameEventUtils.key(ctrl.KEY_MOVE_UP, keydown=True))
+    assert menu.get_selected_widget() == btn1
+    assert len(menu._select_table[1]) == 2
+
+    # Table is cached, and updated if a widget changes its selectable status
+    version = menu._select_table[0]
+    menu.update(PygameEventUtils.key(ctrl.KEY_MOVE_UP, keydown=True))
+    assert menu._select_table[0] == version
+    assert menu.get_selected_widget() == btn2
+    label = menu.get_widgets()[-2]
+    label.is_selectable = True
+    menu.update(PygameEventUtils.key(ctrl.KEY_MOVE_DOWN, keydown=True))
+    assert menu.get_selected_widget() == label
+    assert menu._select_table[0] != version
+
+    # Hidden widgets are skipped
+    menu.update(PygameEventUtils.key(ctrl.KEY_MOVE_UP, keydown=True))
+    assert menu.get_selected_widget() == btn2
+    label.hide()
+    menu.update(PygameEventUtils.key(ctrl.KEY_MOVE_DOWN, keydown=True))
+    assert menu.get_selected_widget() == btn1
+    label.show()
+    menu.update(PygameEventUtils.key(ctrl.KEY_MOVE_UP, keydown=True))
+    assert menu.get_selected_widget() == label
+
+    # Frames are resolved to its first selectable widget
+    menu = MenuUtils.generic_menu()
+    btn1 = menu.add.button("1")
+    frame = menu.add.frame_v(300, 300)
+    frame.pack(menu.add.label("label"))
+    btn3 = frame.pack(menu.add.button("3"))
+    btn4 = frame.pack(menu.add.button("4"))
+    menu.update(PygameEventUtils.key(ctrl.KEY_MOVE_UP, keydown=True))
+    assert menu.get_selected_widget() == btn3
+    menu.update(PygameEventUtils.key(ctrl.KEY_MOVE_DOWN, keydown=True))
+    assert menu.get_selected_widget() == btn1
+    menu.update(PygameEventUtils.key(ctrl.KEY_MOVE_DOWN, keydown=True))
+    assert menu.get_selected_widget() == btn4
+    btn3.is_selectable = False
+    menu.update(PygameEventUtils.key(ctrl.KEY_MOVE_DOWN, keydown=True))
+    assert menu.get_selected_widget() == btn1
+    menu.update(PygameEventUtils.key(ctrl.KEY_MOVE_UP, keydown=True))
+    assert menu.get_selected_widget() == btn4
+
+
+def test_menu_retention():
+    """Test the widget surface retention of the inactive menus."""
+    menu = MenuUtils.generic_menu()
+    sub = MenuUtils.generic_menu()
+    link = menu.add.button("sub", sub)
+    sub.add.button("back", events.BACK)
+    menu.draw(surface)
+    surf = menu._widgets_surface
+    builds = menu._stats.build_surface
+
+    # Going back to an unchanged menu does not rebuild the surface
+    link.apply()
+    assert menu.get_current() == sub
+    menu.draw(surface)
+    menu.reset(1)
+    assert menu.get_current() == menu
+    menu.draw(surface)
+    assert menu._widgets_surface is surf
+    assert menu._stats.build_surface == builds
+
+    # Changes made while the menu is inactive are applied on return
+    link.apply()
+    link.set_title("submenu")
+    menu.reset(1)
+    menu.draw(surface)
+    assert menu._stats.build_surface == builds + 1
+
+    # Menus exceeding the budget release their surface
+    configure_menu_retention(0)
+    try:
+        link.apply()
+        assert menu._widgets_surface is None
+        assert menu._stats.release_surface == 1
+        assert sub._widgets_surface is not None
+        menu.reset(1)
+        assert sub._widgets_surface is None
+        menu.draw(surface)
+        assert menu._stats.build_surface == builds + 2
+    finally:
+        configure_menu_retention(32 * 1024 * 1024)
+
+
+def test_prewarm():
+    """Test the prewarm of the menus not displayed yet."""
+    menu = MenuUtils.generic_menu()
+    sub = MenuUtils.generic_menu()
+    sub2 = MenuUtils.generic_menu()
+    menu.add.button("sub", sub)
+    sub.add.button("sub2", sub2)
+    for i in range(10):
+        sub.add.label(f"label {i}", font_shadow=True)
+        sub2.add.button(f"button {i}")
+    menu.render()
+    sub._widgets_surface = None
+    sub2._widgets_surface = None
+    assert menu.get_prewarm_progress() == 1
+
+    # Each call runs at least one task
+    progress = menu.prewarm(budget_ms=1e-6)
+    assert 0 < progress < 1
+    assert menu.get_prewarm_progress() == progress
+    while progress < 1:
+        assert sub2._widgets_surface is None
+        progress = menu.prewarm(budget_ms=1e-6)
+    assert menu._prewarm is None
+    assert sub._widgets_surface is not None
+    assert sub2._widgets_surface is not None
+
+    # Opening the menu does not rebuild the surface
+    builds = sub._stats.build_surface
+    menu.get_widgets()[0].apply()
+    assert menu.get_current() == sub
+    menu.draw(surface)
+    assert sub._stats.build_surface == builds
+
+    # Not recursive
+    sub2._widgets_surface = None
+    assert sub.prewarm(recursive=False) == 1
+    assert sub2._widgets_surface is None
+    assert sub.prewarm() == 1
+    assert sub2._widgets_surface is not None
+
+    # The pending work continues on the mainloop frames
+    sub2._widgets_surface = None
+    menu.reset(1)
+    assert menu.prewarm(budget_ms=1e-6) < 1
+    menu.mainloop(surface, disable_loop=True)
+    assert menu.get_prewarm_progress() > 0
+    while menu._prewarm is not None:
+        menu.mainloop(surface, disable_loop=True)
+    assert sub2._widgets_surface is not None
+
+    # The surfaces of the inactive menus count against the retention budget
+    sub3 = MenuUtils.generic_menu()
+    sub3.add.button("sub3")
+    menu.add.button("sub3", sub3)
+    assert sub3._widgets_surface is not None
+    configure_menu_retention(0)
+    try:
+        sub2._widgets_surface = None
+        menu.reset(1)
+        assert menu.prewarm() == 1
+        assert sub2._widgets_surface is None
+        assert sub3._widgets_surface is None
+        assert menu._widgets_surface is not None
+        assert sub2.get_widgets()[0]._surface is not None
+        assert id(sub2) not in menu_module._RETAINED_MENUS
+    finally:
+        configure_menu_retention(32 * 1024 * 1024)
+    menu.prewarm()
+    assert sub2._widgets_surface is not None
+    assert id(sub2) in menu_module._RETAINED_MENUS
+
+
+def test_incremental_render(monkeypatch):
+    """Test the incremental render of the widgets."""
+    menu = MenuUtils.generic_menu()
+    buttons = [menu.add.button(f"button {i}") for i in range(30)]
+    menu.set_incremental_render(1e-6)
+    menu.render()
+    menu.get_scrollarea().scroll_to(ORIENTATION_VERTICAL, 1)
+
+    drawn_widgets = []
+    widget_draw = Button.draw
+    monkeypatch.setattr(
+        Button, "draw", lambda w, s: drawn_widgets.append(w) or widget_draw(w, s)
+    )
+    placeholders = []
+    monkeypatch.setattr(
+        menu_module.gfxdraw, "box", lambda s, rect, color: placeholders.append(rect)
+    )
+    menu.draw(surface)
+
+    # The visible widgets are drawn first, the rest are placeholders
+    sa = menu.get_scrollarea()
+    view = pygame.Rect(*sa.get_offsets(), *sa.get_view_rect().size)
+    assert menu._stats.render_backlog == 29
+    assert len(menu._rendered_widgets) == 1
+    assert len(drawn_widgets) == 1
+    assert drawn_widgets[0].get_rect().colliderect(view)
+    assert drawn_widgets[0] != buttons[0]
+    visible = [b for b in buttons if b.get_rect().colliderect(view)]
+    assert len(placeholders) == len(visible) - 1
+    rect = buttons[0].get_rect()
+    assert menu._widgets_surface.get_at(rect.topleft)[3] == 0
+
+    # Each frame draws only the new widgets over the kept surface
+    builds = menu._stats.draw_update_cached
+    for i in range(29):
+        assert menu._stats.render_backlog == 29 - i
+        drawn_widgets.clear()
+        placeholders.clear()
+        menu.draw(surface)
+        assert len(drawn_widgets) == 1
+        assert drawn_widgets[0].get_id() in menu._rendered_widgets
+    assert menu._stats.draw_update_cached == builds
+    assert menu._stats.render_backlog == 0
+    assert len(menu._rendered_widgets) == 30
+    assert menu._widgets_surface.get_at(rect.topleft)[3] != 0
+    drawn_widgets.clear()
+    placeholders.clear()
+    menu.draw(surface)
+    assert drawn_widgets == [] and placeholders == []
+    monkeypatch.undo()
+
+    # New widgets are rendered incrementally
+    btn = menu.add.button("new")
+    menu.set_incremental_render(100)
+    menu.force_surface_cache_update()
+    menu.draw(surface)
+    assert btn.get_id() in menu._rendered_widgets
+    assert menu._stats.render_backlog == 0
+
+    # Disable
+    menu.set_incremental_render(None)
+    menu.add.button("new")
+    menu.force_surface_cache_update()
+    menu.draw(surface)
+    assert len(menu._rendered_widgets) == 31
+
+    # Removed widgets are discarded
+    menu.remove_widget(btn)
+    assert btn.get_id() not in menu._rendered_widgets
+    assert len(menu._rendered_widgets) == 30
+    menu.clear()
+    assert len(menu._rendered_widgets) == 0
+
+
+def test_layout(tmp_path):
+    """Test the menu layout export and restore."""
+    theme = THEME_DARK.copy()
+    menu = Menu("Main", 600, 400, menu_id="main", theme=theme)
+    sub = Menu("Sub", 600, 400, menu_id="sub", onclose=events.BACK, theme=theme)
+    with sub.record_layout():
+        sub.add.button("Back", events.BACK)
+    with menu.record_layout():
+        menu.add.button("Sub", sub, button_id="to_sub")
+        menu.add.button("Play", lambda: None, button_id="play")
+        menu.add.selector(
+            "Level", [("Easy", 1), ("Hard", 2)], onchange=print, selector_id="selector"
+        )
+        menu.add.label("Hidden", label_id="hidden").hide()
+        removed = menu.add.label("Removed")
+        menu.remove_widget(removed)
+        menu.add.image(baseimage.IMAGE_EXAMPLE_PYGAME_MENU, scale=(0.1, 0.1))
+        menu.add.surface(pygame.Surface((20, 10)), surface_id="surface")
+
+    # Calls are recorded only within the recording context
+    menu.add.button("Not recorded")
+    assert len(menu._layout_calls) == len(menu.get_widgets()) - 1
+    with pytest.raises(ValueError):
+        menu.export_layout()
+    menu.remove_widget(menu.get_widgets()[-1])
+
+    path = tmp_path / "menu.cache"
+    menu.export_layout(path, key="v1")
+    played = []
+    callbacks = {"play": lambda: played.append(True), "selector": print}
+    restored = Menu.from_layout(path, callbacks, theme, "v1")
+    assert restored.get_id() == "main"
+    assert [w.get_id() for w in restored.get_widgets()] == [
+        w.get_id() for w in menu.get_widgets()
+    ]
+    for widget in restored.get_widgets():
+        assert restored.get_widget(widget.get_id()) is widget
+    assert [w.get_title() for w in restored.get_widgets()] == [
+        w.get_title() for w in menu.get_widgets()
+    ]
+    assert not restored.get_widget("hidden").is_visible()
+    restored.get_widget("play").apply()
+    assert played == [True]
+    assert restored.get_widget("surface").get_size() == (
+        menu.get_widget("surface").get_size()
+    )
+    assert restored.get_rect() == menu.get_rect()
+    restored_sub = restored.get_widget("to_sub")._menu_hook
+    assert restored_sub.get_id() == "sub" and restored_sub is not sub
+    restored.draw(surface)
+
+    # The layout is stored as JSON, the removed widgets are not recorded
+    data = json.loads(zlib.decompress(path.read_bytes()))
+    assert [call[0] for call in data["menus"]["main"]["calls"]] == [
+        "button",
+        "button",
+        "selector",
+        "label",
+        "image",
+        "surface",
+    ]
+    assert len(menu._layout_calls) == len(menu.get_widgets())
+
+    # Restored menus can be exported again
+    assert Menu.from_layout(restored.export_layout(), callbacks, theme)
+
+    # Calls which add several widgets are kept until all are removed
+    with menu.record_layout():
+        lines = menu.add.label("line 1\nline 2")
+    menu.remove_widget(lines[0])
+    restored = Menu.from_layout(menu.export_layout(), callbacks, theme)
+    assert restored.get_widget(lines[1].get_id()).get_title() == "line 2"
+    assert restored.get_widget(lines[0].get_id()) is None
+    menu.remove_widget(lines[1])
+    assert len(menu._layout_calls) == len(menu.get_widgets())
+    menu.clear()
+    assert menu._layout_calls == {}
+
+    # Outdated, missing or invalid layouts are discarded
+    assert Menu.from_layout(path, callbacks, theme, "v2") is None
+    assert Menu.from_layout(path, callbacks, THEME_BLUE, "v1") is None
+    assert Menu.from_layout(tmp_path / "missing.cache") is None
+    assert Menu.from_layout(b"invalid") is None
+    with pytest.raises(ValueError):
+        Menu.from_layout(path, {}, theme, "v1")
+
+    # Callbacks, events and methods are never resolved from the layout data
+    def craft(call: list) -> bytes:
+        crafted = json.loads(zlib.decompress(path.read_bytes()))
+        crafted["menus"]["main"]["calls"] = [call]
+        return zlib.compress(json.dumps(crafted).encode())
+
+    for call in (
+        ["button", ["Run", {"callback": "os.system"}, "ls"], {}, ["run"], [], []],
+        ["button", ["Run", {"event": "pygame"}], {}, ["run"], [], []],
+        ["generic_widget", [], {}, ["run"], [], []],
+    ):
+        with pytest.raises(ValueError):
+            Menu.from_layout(craft(call), callbacks, theme, "v1")
+
+    # Frames and generic widgets cannot be exported
+    frame_menu = MenuUtils.generic_menu()
+    with frame_menu.record_layout():
+        frame_menu.add.frame_v(300, 200).pack(frame_menu.add.button("Button"))
+    with pytest.raises(ValueError):
+        frame_menu.export_layout()
+    generic_menu = MenuUtils.generic_menu()
+    generic_menu.add.generic_widget(Button("Button"))
+    with pytest.raises(ValueError):
+        generic_menu.export_layout()
+
+    # Menu subclasses, and objects other than primitives cannot be exported
+    class SubMenu(Menu):
+        pass
+
+    with pytest.raises(ValueError):
+        SubMenu("Sub", 600, 400).export_layout()
+    object_menu = MenuUtils.generic_menu()
+    with object_menu.record_layout():
+        object_menu.add.button("Button", object_menu.reset, object())
+    with pytest.raises(ValueError):
+        object_menu.export_layout()
+
+
+def test_list_binding():
+    """Test the list binding reuses the widgets of the pool."""
+    menu = MenuUtils.generic_menu(height=600)
+    header = menu.add.label("header")
+    selected = []
+    items = binding.ListBinding(
+        menu,
+        lambda: menu.add.button("", None),
+        lambda btn, item: btn.update_callback(selected.append, item)
+        or btn.set_title(f"item {item}"),
+    )
+    assert len(items) == 0
+    items.update(range(5))
+    footer = menu.add.label("footer")
+    assert len(items) == 5
+    pool = items.get_widgets()
+    assert [w.get_title() for w in pool] == [f"item {i}" for i in range(5)]
+    ids = [w.get_id() for w in pool]
+
+    # Positions are updated as in a single render
+    position_update = menu._stats.position_update
+    menu.render()
+    render_updates = menu._stats.position_update - position_update
+
+    # Update with a shorter list, the extra widgets are hidden
+    position_update = menu._stats.position_update
+    added = menu._stats.added_widgets
+    items.update([7, 8])
+    assert menu._stats.position_update == position_update + render_updates
+    assert menu._stats.added_widgets == added
+    assert len(items) == 2 and items.get_pool_size() == 5
+    assert [w.get_title() for w in items.get_widgets()] == ["item 7", "item 8"]
+    assert [w.is_visible() for w in pool] == [True, True, False, False, False]
+    pool[1].apply()
+    assert selected == [8]
+
+    # Longer list, the pool grows after the last widget, before the footer
+    position_update = menu._stats.position_update
+    items.update(range(8))
+    assert menu._stats.position_update == position_update + render_updates
+    assert items.get_pool_size() == 8
+    assert [w.get_id() for w in items.get_widgets()[:5]] == ids
+    assert menu.get_widgets()[0] == header
+    assert menu.get_widgets()[-1] == footer
+    assert list(menu.get_widgets()[1:-1]) == items.get_widgets()
+    assert all(w.is_visible() for w in items.get_widgets())
+    items.get_widgets()[-1].apply()
+    assert selected == [8, 7]
+
+    # Default binding sets the title
+    labels = binding.ListBinding(menu, lambda: menu.add.label(""))
+    labels.update(["a", "b"])
+    assert [w.get_title() for w in labels.get_widgets()] == ["a", "b"]
+    labels.update([])
+    assert len(labels) == 0 and not any(w.is_visible() for w in labels._widgets)
+    assert menu._render_enabled
+
+    # Widgets removed from the menu are not reused
+    removed = items.get_widgets()[1]
+    menu.remove_widget(removed)
+    items.update(range(8))
+    assert removed not in items.get_widgets()
+    assert all(w.get_menu() is menu for w in items.get_widgets())
+    assert items.get_pool_size() == 8
+    menu.clear()
+    items.update(range(3))
+    assert len(items) == 3 and items.get_pool_size() == 3
+    assert list(menu.get_widgets()) == items.get_widgets()
+    assert [w.get_title() for w in menu.get_widgets()] == [
+        "item 0",
+        "item 1",
+        "item 2",
+    ]
+
+    # Factory must add the widget to the menu
+    invalid = binding.ListBinding(menu, lambda: widgets.Button("button"))
+    with pytest.raises(AssertionError):
+        invalid.update([1])
+    assert menu._render_enabled
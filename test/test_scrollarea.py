@@ -233,6 +233,60 @@ def test_bg_image_support():
     assert isinstance(sa_custom._area_color, pygame_menu.BaseImage)
 
 
+def test_border_image_cache():
+    """Test that the tiled border is composed only when the size changes."""
+    sa_border = pygame_menu._scrollarea.ScrollArea(
+        100,
+        100,
+        border_color=pygame_menu.BaseImage(
+            pygame_menu.baseimage.IMAGE_EXAMPLE_TILED_BORDER
+        ),
+        world=pygame.Surface((50, 50)),
+    )
+    sa_border.draw(surface)
+    border = sa_border._border_surface[1]
+    assert border.get_size() == (112, 112)
+    sa_border.draw(surface)
+    assert sa_border._border_surface[1] is border
+    sa_border.create_rect(200, 100)
+    sa_border.draw(surface)
+    assert sa_border._border_surface[1].get_size() == (212, 112)
+
+
+def test_background_cache():
+    """Test that the background is built only when the key changes."""
+    theme = TEST_THEME.copy()
+    theme.background_color = pygame_menu.BaseImage(
+        pygame_menu.baseimage.IMAGE_EXAMPLE_GRAY_LINES
+    )
+    menu = MenuUtils.generic_menu(title="menu", theme=theme)
+    sa = menu.get_scrollarea()
+    menu.add.button("button")
+    menu.draw(surface)
+    assert sa._extend_y > 0
+    bg = sa._bg_surface
+    assert bg.get_size() == (
+        sa._rect.width + sa._extend_x,
+        sa._rect.height + sa._extend_y,
+    )
+    builds = menu._stats.build_background
+    for _ in range(3):
+        menu.draw(surface)
+    assert sa._bg_surface is bg
+    assert menu._stats.build_background == builds
+
+    # Changing the image properties rebuilds the background
+    theme.background_color.set_drawing_offset((10, 10))
+    menu.draw(surface)
+    assert menu._stats.build_background == builds + 1
+    sa.update_area_color(theme.background_color)
+    assert menu._stats.build_background == builds + 2
+    sa.update_area_color("red")
+    menu.draw(surface)
+    assert menu._stats.build_background == builds + 3
+    assert sa._bg_surface.get_at((0, 0)) == (255, 0, 0, 255)
+
+
 def test_show_hide_scrollbars_full(menu, sa):
     """Full visibility/force logic test for scrollbars."""
     menu.render()
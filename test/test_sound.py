@@ -12,6 +12,8 @@ import time
 import pygame
 import pytest
 
+import pygame_menu.sound as sound_module
+from pygame_menu.loader import AssetLoader
 from pygame_menu.sound import (
     SOUND_EXAMPLES,
     SOUND_INITIALIZED,
@@ -238,3 +240,102 @@ def test_mixer_config_copied(sound):
     """Ensure mixer configuration is copied correctly."""
     s2 = copy.copy(sound)
     assert sound._mixer_configs == s2._mixer_configs
+
+
+def test_load_sounds_background(sound):
+    """Test sounds loaded in the background are played once ready."""
+    with AssetLoader() as loader:
+        sound.load_example_sounds(volume=0.3, loader=loader)
+        sound.set_sound_volume(SOUND_TYPES[0], 0.2)
+        for sound_type in SOUND_TYPES:
+            assert sound._sound[sound_type]["path"] is not None
+    assert not sound.is_pending()
+    for sound_type in SOUND_TYPES:
+        assert isinstance(sound._sound[sound_type]["file"], pygame.mixer.Sound)
+        assert sound._sound[sound_type]["length"] > 0
+    volume = sound._sound[SOUND_TYPES[0]]["file"].get_volume()
+    assert volume == pytest.approx(0.2, abs=0.01)
+    sound.play_click_mouse()
+
+
+def test_scheduler(monkeypatch):
+    """Test scheduled plays are coalesced, rate limited and played on flush."""
+    s = Sound(force_init=True).load_example_sounds()
+    s.set_scheduler(rate_limits={SOUND_TYPES[0]: 1})
+    try:
+        channels = s._scheduler.channels
+        assert len(channels) == len(SOUND_TYPES)
+        assert pygame.mixer.find_channel() not in channels.values()
+
+        fake_time = [1000.0]
+        monkeypatch.setattr(time, "time", lambda: fake_time[0])
+        channel = channels[SOUND_TYPES[0]]
+        s.stop()
+        for _ in range(5):
+            s.play_click_mouse()
+        s.play_error()
+        assert channel.get_sound() is None
+        assert s.get_scheduler_stats() == {
+            "coalesced": 4,
+            "dropped": 0,
+            "played": 0,
+            "queued": 2,
+        }
+        assert s.flush() == 2
+        assert channel.get_sound() is s._sound[SOUND_TYPES[0]]["file"]
+
+        # Plays within the rate limit are dropped
+        fake_time[0] += 0.5
+        s.play_click_mouse()
+        s.play_error()
+        assert s.flush() == 1
+        fake_time[0] += 0.6
+        s.play_click_mouse()
+        assert s.flush() == 1
+        assert s.get_scheduler_stats()["dropped"] == 1
+        assert copy.copy(s)._scheduler.rate_limits == {SOUND_TYPES[0]: 1}
+
+        # Menus flush the sounds at the end of the update
+        menu = MenuUtils.generic_menu()
+        menu.set_sound(s)
+        fake_time[0] += 2
+        s.play_click_mouse()
+        menu.update([])
+        assert s.get_scheduler_stats()["queued"] == 0
+        assert s.get_scheduler_stats()["played"] == 5
+
+        with pytest.raises(ValueError):
+            s.set_scheduler(rate_limits={"invalid": 1})
+        s.set_scheduler(False)
+        assert s.get_scheduler_stats() == {}
+    finally:
+        pygame.mixer.set_reserved(0)
+
+
+def test_scheduler_reserved_channels():
+    """Test the scheduler restores the reservation made by the application."""
+    s = Sound(force_init=True)
+    s2 = Sound()
+    total = len(SOUND_TYPES)
+    try:
+        pygame.mixer.set_reserved(2)
+        s.set_scheduler()
+        s2.set_scheduler()
+        assert sound_module._get_reserved_channels() == total
+        s.set_scheduler(False)
+        assert sound_module._get_reserved_channels() == total
+        s2.set_scheduler(False)
+        assert sound_module._get_reserved_channels() == 2
+
+        # Greater reservations are not lowered
+        pygame.mixer.set_num_channels(total + 10)
+        pygame.mixer.set_reserved(total + 2)
+        s.set_scheduler()
+        assert sound_module._get_reserved_channels() == total + 2
+        s.set_scheduler(reserve_channels=False)
+        assert s._scheduler.channels == {}
+        assert sound_module._get_reserved_channels() == total + 2
+        s.set_scheduler(False)
+        assert sound_module._get_reserved_channels() == total + 2
+    finally:
+        pygame.mixer.set_reserved(0)
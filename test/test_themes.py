@@ -11,7 +11,7 @@ from pathlib import Path
 import pytest
 
 import pygame_menu
-from test._utils import MenuUtils
+from test._utils import MenuUtils, surface
 
 
 @pytest.fixture
@@ -304,3 +304,39 @@ def test_get_invalid_cases():
 
     with pytest.raises(AssertionError):
         t._get({}, "", int, 4.4)
+
+
+def test_gradient():
+    """Test gradient colors on themes."""
+    theme = pygame_menu.Theme(
+        background_color=((255, 0, 0), [(0, 255, 0), (0, 0, 255)], True, True),
+        title_background_color=((0, 0, 0), (255, 255, 255), False, True),
+    )
+    assert isinstance(theme.background_color, pygame_menu.baseimage.GradientImage)
+    assert theme.background_color.get_gradient() == (
+        ((255, 0, 0), (0, 255, 0), (0, 0, 255)),
+        True,
+        True,
+    )
+    gradient_image = pygame_menu.baseimage.GradientImage
+    assert isinstance(theme.title_background_color, gradient_image)
+    assert isinstance(theme.copy().background_color, gradient_image)
+
+    # Gradients assigned after creation are converted on validation
+    theme.widget_background_color = ("red", "blue", False, False)
+    menu = MenuUtils.generic_menu(theme=theme)
+    assert isinstance(theme.widget_background_color, gradient_image)
+    menu.add.button("button")
+    menu.draw(surface)
+
+    # The background is drawn with the gradient, as well as the menubar polygon
+    color = surface.get_at((300, 498))
+    assert color.r == 0 and color.b > 240
+    title = menu.get_menubar()
+    assert title._polygon_surface is not None
+    x, y = title._polygon_surface[2]
+    assert surface.get_at((x + 1, y + 1))[0:3] == (0, 0, 0)
+
+    # Invalid gradients
+    with pytest.raises(AssertionError):
+        pygame_menu.Theme(background_color=("red", [], True, True))
@@ -6,6 +6,7 @@ TEST UTILS
 Library utils.
 """
 
+import pygame
 import pytest
 
 import pygame_menu.utils as ut
@@ -22,6 +23,127 @@ def test_alpha():
     assert ut._ALPHA_CHANNEL[0] is True
 
 
+def test_display_optimization(monkeypatch):
+    """Test the display-format surface conversion."""
+    assert ut._DISPLAY_OPTIMIZATION[0] is False
+    surf = pygame.Surface((10, 10), pygame.SRCALPHA, 32)
+    assert ut.optimize_surface(surf) is surf
+    assert ut.make_surface(10, 10, fill_color="red").get_flags() & pygame.SRCALPHA
+
+    ut.configure_display_optimization(True)
+    try:
+        # Transparent surfaces keep the alpha channel, and are RLE accelerated
+        opt = ut.optimize_surface(surf)
+        assert opt is not surf
+        assert opt.get_flags() & pygame.SRCALPHA
+        assert opt.get_flags() & pygame.RLEACCELOK
+
+        # Opaque surfaces drop it
+        surf.fill((10, 20, 30))
+        opt = ut.optimize_surface(surf)
+        assert not opt.get_flags() & pygame.SRCALPHA
+        assert opt.get_at((0, 0)) == (10, 20, 30, 255)
+
+        # Colorkeyed surfaces
+        key = pygame.Surface((10, 10))
+        key.set_colorkey((0, 0, 0))
+        opt = ut.optimize_surface(key)
+        assert opt.get_colorkey() == (0, 0, 0, 255)
+        assert opt.get_flags() & pygame.RLEACCELOK
+
+        # Opaque surfaces created by make_surface
+        opaque = ut.make_surface(10, 10, fill_color="red")
+        assert not opaque.get_flags() & pygame.SRCALPHA
+        assert opaque.get_at((0, 0)) == (255, 0, 0, 255)
+        assert ut.make_surface(10, 10, fill_color=(0, 0, 0, 100)).get_flags() & (
+            pygame.SRCALPHA
+        )
+        assert ut.make_surface(10, 10).get_flags() & pygame.SRCALPHA
+
+        # Without a display the surfaces are not converted
+        monkeypatch.setattr(pygame.display, "get_surface", lambda: None)
+        assert ut.optimize_surface(surf) is surf
+        assert ut.make_surface(10, 10, fill_color="red").get_flags() & pygame.SRCALPHA
+    finally:
+        ut.configure_display_optimization(False)
+
+
+def test_surface_pool():
+    """Test the surface pool."""
+    assert ut.get_surface_pool() is None
+    surf = ut.make_surface(10, 10)
+    ut.release_surface(surf)  # Does nothing
+
+    ut.configure_surface_pool(True, max_surfaces=2)
+    try:
+        pool = ut.get_surface_pool()
+        assert isinstance(pool, ut.SurfacePool)
+        assert not pool.release(surf)  # Not created by the pool
+
+        # Released surfaces are reused, cleared
+        surf = ut.make_surface(10, 10, fill_color="red")
+        assert pool.get_stats()["missed"] == 1
+        ut.release_surface(surf)
+        ut.release_surface(surf)
+        assert len(pool) == 1
+        new = ut.make_surface(10, 10)
+        assert new is surf
+        assert new.get_at((0, 0)) == (0, 0, 0, 0)
+        assert len(pool) == 0
+        assert ut.make_surface(5, 5) is not surf
+
+        # Bounded retention discards the oldest surfaces
+        for s in [ut.make_surface(i + 1, 1) for i in range(3)]:
+            ut.release_surface(s)
+        assert len(pool) == 2
+        assert ut.make_surface(1, 1).get_size() == (1, 1)
+        assert pool.get_stats() == {
+            "discarded": 1,
+            "missed": 6,
+            "released": 4,
+            "retained": 2,
+            "reused": 1,
+        }
+        pool.clear()
+        assert len(pool) == 0
+    finally:
+        ut.configure_surface_pool(False)
+
+
+def test_gradient():
+    """Test the gradient engine."""
+    surf = pygame.Surface((20, 30), pygame.SRCALPHA, 32)
+    ut.fill_gradient(surf, (0, 0, 0), (255, 255, 255), pygame.Rect(0, 10, 20, 10))
+    assert surf.get_at((0, 9)) == (0, 0, 0, 0)
+    assert surf.get_at((5, 10)) == (0, 0, 0, 255)
+    assert surf.get_at((5, 15)) == (127, 127, 127, 255)
+    assert surf.get_at((19, 19)) == (229, 229, 229, 255)
+    assert surf.get_at((5, 20)) == (0, 0, 0, 0)
+
+    # Horizontal, reversed
+    ut.fill_gradient(surf, (0, 0, 0), (100, 0, 0), vertical=False, forward=False)
+    assert surf.get_at((0, 0)) == (100, 0, 0, 255)
+    assert surf.get_at((19, 29)) == (5, 0, 0, 255)
+
+    # Multi-stop gradient
+    ut.fill_gradient(surf, "red", ["green", "blue"], pygame.Rect(0, 0, 20, 20))
+    assert surf.get_at((0, 0)) == (255, 0, 0, 255)
+    assert surf.get_at((0, 10)) == (0, 255, 0, 255)
+    assert surf.get_at((0, 19)).b > 200
+    ut.fill_gradient(surf, "red", "blue", pygame.Rect(0, 0, 0, 10))  # Empty
+
+    # Gradients are cached
+    g = ut.make_gradient(10, 10, ((0, 0, 0), (255, 0, 0)))
+    assert ut.make_gradient(10, 10, ((0, 0, 0), (255, 0, 0))) is g
+    assert ut.make_gradient(10, 10, ((0, 0, 0), (255, 0, 0)), vertical=False) is not g
+    for i in range(ut._GRADIENT_CACHE_SIZE):
+        ut.make_gradient(i + 1, 1, ("red", "blue"))
+    assert len(ut._GRADIENT_CACHE) == ut._GRADIENT_CACHE_SIZE
+    assert ut.make_gradient(10, 10, ((0, 0, 0), (255, 0, 0))) is not g
+    with pytest.raises(AssertionError):
+        ut.make_gradient(10, 10, ("red",))
+
+
 def test_callable():
     """Test is callable."""
     assert ut.is_callable(bool)
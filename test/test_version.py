@@ -6,11 +6,70 @@ TEST VERSION
 Test version management.
 """
 
+import ast
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
 import pygame_menu
 
+# Maximum number of modules loaded by the package import, once pygame is loaded
+IMPORT_MODULES_BUDGET = 10
+
 
 def test_version_types():
     """Test version."""
     assert isinstance(pygame_menu.version.ver, str)
     assert isinstance(repr(pygame_menu.version.vernum), str)
     assert isinstance(str(pygame_menu.version.vernum), str)
+
+
+def _import_pygame_menu(
+    code: str = "import pygame_menu, sys; print(list(sys.modules))",
+) -> subprocess.CompletedProcess:
+    """
+    Import pygame-menu in a new interpreter.
+
+    :param code: Code to run
+    :return: Completed process
+    """
+    env = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT="1")
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        cwd=Path(__file__).resolve().parents[1],
+        env=env,
+        text=True,
+    )
+
+
+def test_lazy_import():
+    """Test the submodules, themes and metadata are loaded on first access."""
+    modules = _import_pygame_menu().stdout
+    for module in ("baseimage", "menu", "sound", "themes", "widgets"):
+        assert f"'pygame_menu.{module}'" not in modules
+    assert "'importlib.metadata'" not in modules
+
+    assert isinstance(pygame_menu.__author__, str)
+    assert pygame_menu.Menu is pygame_menu.menu.Menu
+    assert "Menu" in dir(pygame_menu)
+    assert pygame_menu.themes.THEME_BLUE is pygame_menu.themes.THEME_BLUE
+    with pytest.raises(AttributeError):
+        _ = pygame_menu.unknown
+    with pytest.raises(AttributeError):
+        _ = pygame_menu.themes.THEME_UNKNOWN
+
+
+def test_import_cost():
+    """Test the modules loaded by the package import are within the budget."""
+    code = (
+        "import sys, pygame; before = set(sys.modules); import pygame_menu; "
+        "print(sorted(set(sys.modules) - before))"
+    )
+    modules = ast.literal_eval(_import_pygame_menu(code).stdout)
+    assert [m for m in modules if m.startswith("pygame_menu")] == ["pygame_menu"]
+    assert len(modules) <= IMPORT_MODULES_BUDGET
@@ -8,6 +8,7 @@ Test Label widget.
 
 import pytest
 
+from pygame_menu.font import FONT_OPEN_SANS, get_font
 from pygame_menu.locals import ALIGN_LEFT
 from pygame_menu.widgets import Label
 from test._utils import PYGAME_V2, MenuUtils, surface
@@ -164,6 +165,37 @@ def test_empty_title(menu):
     assert label.get_height() == expected_h
 
 
+def test_label_measure(menu):
+    """Test label measure without rendering."""
+    label = menu.add.label("measure\tme", padding=(1, 2, 3, 4))
+    btn = menu.add.button("button")
+    for w in (label, btn):
+        assert w.measure() == w.get_size()
+        assert w.measure(
+            apply_padding=False, apply_selection=True
+        ) == w.get_size(apply_padding=False, apply_selection=True)
+
+    # Menu layout measures the widgets, these are rendered only when drawn
+    renders = []
+    label_render = label._render
+    label._render = lambda: renders.append(1) or label_render()
+    menu.render()
+    assert renders == []
+    menu.draw(surface)
+    assert len(renders) > 0
+
+    # Transformed widgets are rendered to be measured
+    del label._render
+    label.rotate(90)
+    assert label.measure() == label.get_size()
+    assert label._measure() == label._font_measure_string("measure\tme")
+
+    # Wordwrap is rendered
+    label = menu.add.label("lorem ipsum dolor sit amet", wordwrap=True)
+    assert label._measure() is None
+    assert label.measure() == label.get_size()
+
+
 def test_label_value(menu):
     """Test label value API."""
     label = menu.add.label("title")
@@ -221,6 +253,90 @@ def test_wordwrap_max_lines(menu):
     assert label.get_overflow_lines() == []
 
 
+def test_wordwrap_linear(menu):
+    """Test the wordwrap measures each word once."""
+
+    class CountingFont:
+        def __init__(self, font):
+            self.font = font
+            self.calls = []
+
+        def size(self, text):
+            self.calls.append(text)
+            return self.font.size(text)
+
+    font = get_font(FONT_OPEN_SANS, 20)
+    counting_font = CountingFont(font)
+    words = ["lorem", "ipsum", "dolor", "sit\tamet", "", "consectetur"] * 50
+    text = " ".join(words)
+    lines = Label._wordwrap_line(text, counting_font, 300, 4)  # type: ignore
+    assert " ".join(lines).replace("\t", "    ") == text.replace("\t", "    ")
+    assert len(counting_font.calls) <= 7 + 3 * len(lines)
+    for line in lines:
+        assert font.size(line.replace("\t", "    "))[0] <= 300
+
+    # Words wider than the max width are not split, if the last word does not
+    # fit an empty line follows
+    assert Label._wordwrap_line("a verylongword b", font, 10, 4) == [
+        "a",
+        "verylongword",
+        "b",
+        "",
+    ]
+    assert Label._wordwrap_line("a b", font, 100, 4) == ["a b"]
+    assert Label._wordwrap_line("", font, 10, 4) == [""]
+
+    # Lines rendered before are reused
+    label = menu.add.label(text, wordwrap=True)
+    label._force_render()
+    surfaces = label._lines_surfaces[1]
+    assert len(surfaces) > 1
+    label._force_render()
+    assert label._lines_surfaces[1] == surfaces
+    label.update_font({"color": (255, 0, 0)})
+    assert not set(label._lines_surfaces[1].values()) & set(surfaces.values())
+
+
+def _wordwrap_line_quadratic(line, font, max_width, tab_size):
+    """Wordwrap that measures each line prefix, used as reference."""
+    final_lines = []
+    words = line.split(" ")
+    while True:
+        split_line = False
+        current_line = ""
+        i = 0
+        for i, _ in enumerate(words):
+            current_line = " ".join(words[: i + 1]).replace("\t", " " * tab_size)
+            if font.size(current_line)[0] > max_width:
+                split_line = True
+                break
+        if split_line:
+            i = i if i > 0 else 1
+            final_lines.append(" ".join(words[:i]))
+            words = words[i:]
+        else:
+            final_lines.append(current_line)
+            break
+    return final_lines
+
+
+@pytest.mark.parametrize("max_width", [1, 40, 97, 150, 300])
+def test_wordwrap_same_lines(max_width):
+    """Test the wordwrap breaks the lines as measuring each line prefix."""
+    font = get_font(FONT_OPEN_SANS, 20)
+    texts = [
+        "a verylongwordthatdoesnotfit",
+        "verylongwordthatdoesnotfit",
+        "AV To Wa Ty LT ff fi Yo VA AT Te Tr WA Ya yo",
+        "lorem ipsum  dolor\tsit amet, consectetur adipiscing elit " * 4,
+        " leading and trailing spaces ",
+    ]
+    for text in texts:
+        assert Label._wordwrap_line(text, font, max_width, 4) == (
+            _wordwrap_line_quadratic(text, font, max_width, 4)
+        )
+
+
 def test_clock(menu):
     """Test clock widget."""
     clock = menu.add.clock()
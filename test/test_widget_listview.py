@@ -0,0 +1,253 @@
+"""
+pygame-menu
+https://github.com/ppizarror/pygame-menu
+
+TEST WIDGET - LISTVIEW
+Test ListView widget.
+"""
+
+import pygame
+import pytest
+
+import pygame_menu
+import pygame_menu.controls as ctrl
+from pygame_menu.widgets.core.widget import WidgetTransformationNotImplemented
+from test._utils import MenuUtils, PygameEventUtils, surface
+
+
+@pytest.fixture
+def menu():
+    """Return a generic menu fixture."""
+    return MenuUtils.generic_menu()
+
+
+def test_listview_basic(menu):
+    """Test list view widget."""
+    lv = menu.add.list_view(["a", "b", "c"], rows=4, width=200)
+    menu.draw(surface)
+    assert lv.get_index() == -1
+    assert not lv.value_changed()
+    with pytest.raises(ValueError):
+        lv.get_value()
+    assert lv.get_rows() == 4
+    assert lv._measure() == (200, 4 * lv.get_row_height())
+    assert lv.get_rect(apply_padding=False).size == lv._measure()
+
+    lv.set_value(1)
+    assert lv.get_value() == ("b", 1)
+    assert lv.value_changed()
+    lv.reset_value()
+    assert lv.get_index() == -1
+
+    # Invalid configurations
+    with pytest.raises(AssertionError):
+        menu.add.list_view(lambda i: i)
+    with pytest.raises(AssertionError):
+        menu.add.list_view(["a"], default=1)
+    with pytest.raises(AssertionError):
+        menu.add.list_view(["a"], rows=0)
+    with pytest.raises(AssertionError):
+        lv.set_value(3)
+
+
+@pytest.mark.parametrize(
+    "method",
+    [
+        "rotate",
+        "flip",
+        "scale",
+        "resize",
+        "set_max_width",
+        "set_max_height",
+    ],
+)
+def test_listview_invalid_transforms(menu, method):
+    """Test invalid list view transforms."""
+    lv = pygame_menu.widgets.ListView([1, 2, 3])
+    with pytest.raises(WidgetTransformationNotImplemented):
+        getattr(lv, method)()
+
+
+def test_listview_large_source(menu):
+    """Test the list view only renders the visible rows of a large source."""
+    rendered = []
+
+    def renderer(item, index, selected):
+        rendered.append(index)
+        return str(item)
+
+    menu.add.button("first")
+    lv = menu.add.list_view(range(1_000_000), renderer, rows=5)
+    menu.draw(surface)
+    assert sorted(rendered) == [0, 1, 2, 3, 4]
+    assert len(lv._row_cache) == 5
+
+    # Select the last item, only the visible rows are kept
+    menu.select_widget(lv)
+    rendered.clear()
+    assert lv.update(PygameEventUtils.key(pygame.K_END, keydown=True))
+    assert lv.get_value() == (999_999, 999_999)
+    assert lv.get_offset() == 999_995
+    assert sorted(rendered) == [999_995, 999_996, 999_997, 999_998, 999_999]
+    assert sorted(lv._row_cache) == [999_995, 999_996, 999_997, 999_998, 999_999]
+
+    # Scrolling by one row renders a single new row
+    rendered.clear()
+    assert lv.scroll(-1)
+    assert rendered == [999_994]
+    assert len(lv._row_cache) == 5
+
+
+def test_listview_keys(menu):
+    """Test list view keyboard and joystick selection."""
+    changes = []
+    returns = []
+    lv = menu.add.list_view(
+        list("abcdef"),
+        rows=3,
+        onchange=lambda value: changes.append(value),
+        onreturn=lambda value: returns.append(value),
+    )
+    menu.add.button("next")
+    menu.select_widget(lv)
+
+    # Keys are inverted, move up selects the next item
+    assert lv.update(PygameEventUtils.key(ctrl.KEY_MOVE_UP, keydown=True))
+    assert lv.get_value() == ("a", 0)
+    assert lv.update(PygameEventUtils.key(ctrl.KEY_MOVE_UP, keydown=True))
+    assert lv.update(PygameEventUtils.joy_hat_motion(ctrl.JOY_DOWN))
+    assert lv.get_index() == 2
+    assert lv.update(PygameEventUtils.joy_hat_motion(ctrl.JOY_UP))
+    assert lv.update(PygameEventUtils.key(ctrl.KEY_MOVE_DOWN, keydown=True))
+    assert lv.get_index() == 0
+    assert changes == [("a", 0), ("b", 1), ("c", 2), ("b", 1), ("a", 0)]
+
+    # The first item is selected, the event is left to the menu
+    assert not lv.update(PygameEventUtils.key(ctrl.KEY_MOVE_DOWN, keydown=True))
+    assert lv.update(PygameEventUtils.key(pygame.K_END, keydown=True))
+    assert lv.get_value() == ("f", 5)
+    assert lv.get_offset() == 3
+    assert not lv.update(PygameEventUtils.key(ctrl.KEY_MOVE_UP, keydown=True))
+    assert lv.update(PygameEventUtils.key(pygame.K_HOME, keydown=True))
+    assert lv.get_offset() == 0
+
+    # Apply
+    assert lv.update(PygameEventUtils.key(ctrl.KEY_APPLY, keydown=True))
+    assert lv.update(PygameEventUtils.joy_button(ctrl.JOY_BUTTON_SELECT))
+    assert returns == [("a", 0), ("a", 0)]
+
+    # The menu moves to the next widget once the list boundary is reached
+    menu.update(PygameEventUtils.key(pygame.K_END, keydown=True))
+    menu.update(PygameEventUtils.key(ctrl.KEY_MOVE_UP, keydown=True))
+    assert menu.get_selected_widget().get_title() == "next"
+
+    # Readonly does not accept events
+    lv.readonly = True
+    assert not lv.update(PygameEventUtils.key(pygame.K_HOME, keydown=True))
+
+
+def test_listview_mouse(menu):
+    """Test list view mouse hit testing and wheel."""
+    returns = []
+    lv = menu.add.list_view(
+        range(100), rows=4, onreturn=lambda value: returns.append(value)
+    )
+    menu.render()
+    rect = lv.get_rect(apply_padding=False, to_real_position=True)
+    height = lv.get_row_height()
+    x = rect.centerx
+
+    # Click the third row
+    assert lv.update(PygameEventUtils.mouse_click(x, rect.y + 2.5 * height))
+    assert lv.get_value() == (2, 2)
+    assert lv.get_row_index(rect.y + 3 * height) == 3
+    assert lv.get_row_index(rect.y - 1) == -1
+
+    # Click again applies
+    assert lv.update(PygameEventUtils.mouse_click(x, rect.y + 2.5 * height))
+    assert returns == [(2, 2)]
+
+    # The wheel scrolls the list without changing the selection
+    assert lv.update(
+        PygameEventUtils.mouse_click(
+            x, rect.y + height, evtype=pygame.MOUSEBUTTONDOWN, button=5
+        )
+    )
+    assert lv.get_offset() == 1
+    assert lv.get_index() == 2
+    assert lv.update(PygameEventUtils.mouse_click(x, rect.y + 0.5 * height))
+    assert lv.get_index() == 1
+
+    # Clicks outside do nothing
+    assert not lv.update(PygameEventUtils.mouse_click(rect.x - 10, rect.y))
+
+
+def test_listview_notify_changed(menu):
+    """Test the list view only renders the changed rows."""
+    items = ["a", "b", "c"]
+    rendered = []
+
+    def renderer(item, index, selected):
+        rendered.append(index)
+        return str(item)
+
+    menu.add.button("first")
+    lv = menu.add.list_view(lambda i: items[i], renderer, length=lambda: len(items))
+    menu.draw(surface)
+    assert sorted(rendered) == [0, 1, 2]
+    rendered.clear()
+
+    # Changed rows only
+    items[1] = "x"
+    lv.notify_changed(1, 50)
+    assert rendered == [1]
+    assert not menu._widgets_surface_need_update
+
+    # Selected widget status changes all rows
+    rendered.clear()
+    menu.select_widget(lv)
+    menu.draw(surface)
+    assert sorted(rendered) == [0, 1, 2]
+
+    # Length changes
+    rendered.clear()
+    items.append("d")
+    lv.notify_changed()
+    assert sorted(rendered) == [0, 1, 2, 3]
+    lv.set_value(3)
+    del items[1:]
+    lv.notify_changed()
+    assert lv.get_value() == ("a", 0)
+
+    # Renderer can return a surface
+    lv = menu.add.list_view(
+        [1, 2], lambda item, index, selected: pygame.Surface((10, 10)), row_height=10
+    )
+    menu.draw(surface)
+    assert lv.get_row_height() == 10
+
+
+def test_listview_input_data(menu):
+    """Test the menu input data follows the list view selection and source."""
+    items = ["a", "b", "c"]
+    lv = menu.add.list_view(
+        lambda i: items[i], length=lambda: len(items), list_view_id="lv"
+    )
+    assert menu.get_input_data() == {}
+
+    lv.set_value(1)
+    assert menu.get_input_data() == {"lv": ("b", 1)}
+    lv.set_value(0)
+    assert menu.get_input_data() == {"lv": ("a", 0)}
+
+    # The selected item changes
+    items[0] = "Z"
+    lv.notify_changed(0)
+    assert menu.get_input_data() == {"lv": ("Z", 0)}
+
+    # The source changes
+    items[0] = "Y"
+    lv.notify_changed()
+    assert menu.get_input_data() == {"lv": ("Y", 0)}
+    lv.reset_value()
+    assert menu.get_input_data() == {}
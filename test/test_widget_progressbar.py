@@ -96,3 +96,20 @@ def test_progressbar_empty_title(menu):
     expected_height = 41 if PYGAME_V2 else 42
     assert pb.get_size() == (150, expected_height)
     assert not pb.is_selected()
+
+
+def test_progressbar_surface_pool(menu):
+    """Test progressbar surfaces are recycled by the surface pool."""
+    pygame_menu.utils.configure_surface_pool(True)
+    try:
+        pb = menu.add.progress_bar("progress")
+        for i in range(10):
+            pb.set_value(i * 10)
+            pb.render()
+        menu.draw(surface)
+        stats = pygame_menu.utils.get_surface_pool().get_stats()
+        assert stats["released"] > 0
+        assert stats["reused"] > 0
+        assert pb.get_value() == 90
+    finally:
+        pygame_menu.utils.configure_surface_pool(False)
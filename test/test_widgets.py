@@ -7,6 +7,8 @@ Test general widget properties.
 """
 
 import copy
+import gc
+import tracemalloc
 
 import pygame
 import pytest
@@ -23,8 +25,14 @@ from pygame_menu.locals import (
     POSITION_SOUTHWEST,
     POSITION_WEST,
 )
-from pygame_menu.widgets import Button, Label
-from pygame_menu.widgets.core.widget import AbstractWidgetManager, Widget
+from pygame_menu.widgets import Button, Label, NoneWidget, VMargin
+from pygame_menu.widgets.core.widget import (
+    _MOUSELEAVE_EVENT,
+    _NO_SHADOW,
+    AbstractWidgetManager,
+    Widget,
+    check_widget_mouseleave,
+)
 from test._utils import (
     PYGAME_V2,
     TEST_THEME,
@@ -678,3 +686,78 @@ def test_widget_center_overflow_ignore_scrollbar_thickness() -> None:
     scrollbar_thickness = menu._get_scrollbar_thickness()
     assert pos_after[0] - pos_before[0] == scrollbar_thickness[1] / 2  # x
     assert pos_after[1] == pos_before[1]  # y
+
+
+def test_widget_footprint() -> None:
+    """Test the memory footprint of the widgets, and the lazy auxiliary objects."""
+    menu = MenuUtils.generic_menu()
+    menu.disable_render()
+    factories = {
+        "NoneWidget": NoneWidget,
+        "VMargin": lambda: VMargin(10),
+        "Label": lambda: Label("label"),
+        "Button": lambda: Button("button"),
+        "menu.add.label": lambda: menu.add.label("label"),
+    }
+    footprint = {}
+    for name, factory in factories.items():
+        n = 200
+        gc.collect()
+        tracemalloc.start()
+        try:
+            snapshot = tracemalloc.take_snapshot()
+            widgets = [factory() for _ in range(n)]
+            gc.collect()
+            diff = tracemalloc.take_snapshot().compare_to(snapshot, "filename")
+        finally:
+            tracemalloc.stop()
+        footprint[name] = sum(stat.size_diff for stat in diff) / n
+        assert len(widgets) == n
+    # Before the widget core used __slots__ each widget used about 7.6KB
+    for name, size in footprint.items():
+        assert size < 4096, f"{name} footprint is {size:.0f} bytes"
+
+    # Auxiliary objects are created once used
+    label = menu.add.label("label")
+    assert label._decorator_obj is None
+    assert label._sound_obj is None
+    assert label._draw_callbacks is None
+    assert label._update_callbacks is None
+    assert label._shadow is _NO_SHADOW
+    assert not label._shadow["enabled"]
+    label.draw(surface)
+    label.force_menu_surface_update()
+    assert label._decorator_obj is None
+    assert label.get_decorator() is label._decorator_obj is not None
+    assert label.get_sound() is label._sound_obj is not None
+    label.shadow()
+    assert label._shadow is not _NO_SHADOW
+    assert label._shadow["enabled"]
+    assert not _NO_SHADOW["enabled"]
+    with pytest.raises(IndexError):
+        label.remove_draw_callback("invalid")
+    with pytest.raises(IndexError):
+        label.remove_update_callback("invalid")
+
+    # The core is slotted, but subclasses accept new attributes
+    assert not hasattr(Widget(), "__dict__")
+    label.custom_attribute = True
+
+
+def test_mouseleave_event_not_shared():
+    """Test the mouseleave callback does not receive the reused check event."""
+    menu = MenuUtils.generic_menu()
+    btn = menu.add.button("button")
+    events = []
+    btn.set_onmouseleave(lambda widget, event: events.append(event))
+    menu.update(PygameEventUtils.mouse_motion(btn))
+    assert btn._mouseover
+
+    # The mouse is not over the button, the check uses the reused event
+    pygame.mouse.set_pos((0, 0))
+    assert not btn.get_rect(to_real_position=True).collidepoint(0, 0)
+    check_widget_mouseleave()
+    assert not btn._mouseover
+    assert len(events) == 1
+    assert events[0] is not _MOUSELEAVE_EVENT
+    assert events[0].type == pygame.MOUSEMOTION